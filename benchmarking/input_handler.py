@@ -1,6 +1,7 @@
 import csv
 from cv_visualization import CompressedVectorDownsampler as cvd
 from cv_visualization import CompressedVector as cv
+from cv_visualization import AffineAxis
 from cv_visualization import DOWNSAMPLERS, COMPRESSION_METHODS
 import tsdownsample as tsd
 import numpy as np
@@ -16,21 +17,21 @@ class InputHandler:
         """
             Set the width of the integer part in bits.
             Args:
-                width (int): The width of the integer part in bits. Only 8, 16, 32, or 64 are valid.
+                width (int or str): The width of the integer part in bits. Only 8, 16, 32, 64 or "auto" are valid.
                 axis (str): The axis to set the width for. Can be "x" or "y".
         """
         if option == "y":
-            if width not in [8, 16, 32, 64]:
-                raise ValueError("Width must be one of [8, 16, 32, 64]")
+            if width not in [8, 16, 32, 64, "auto"]:
+                raise ValueError("Width must be one of [8, 16, 32, 64, 'auto']")
             self.width_y = width
         elif option == "x":
-            if width not in [8, 16, 32, 64]:
-                raise ValueError("Width must be one of [8, 16, 32, 64]")
+            if width not in [8, 16, 32, 64, "auto"]:
+                raise ValueError("Width must be one of [8, 16, 32, 64, 'auto']")
             self.width_x = width
         else:
             raise ValueError("Option must be 'x' or 'y'")
             
-    def get_from_file(self, file_path, option, decimal_places=2, delimiter=";", column=1, truncate=None, decompressed=False, compress_option=None, n_out=None, downsampler=tsd.MinMaxLTTBDownsampler):
+    def get_from_file(self, file_path, option, decimal_places=2, delimiter=";", column=1, truncate=None, decompressed=False, compress_option=None, n_out=None, downsampler=tsd.MinMaxLTTBDownsampler, affine_tolerance=None):
         """
             Read data from a file and return two lists of integers or compressed vectors.
             Args:
@@ -42,6 +43,8 @@ class InputHandler:
                 truncate (int): If specified, truncate the lists to this length.
                 decompressed (bool): If True, return decompressed vectors.
                 compress_option (str): Name of the compression method to apply.
+                affine_tolerance (float): If given, a regularly spaced x column (within this
+                    tolerance) is stored as an AffineAxis instead of a compressed vector.
             Returns:
                 tuple: Two vectors as raw lists or CompressedVector instances.
         """
@@ -59,7 +62,13 @@ class InputHandler:
         if option == "default":
             return x, y
         elif option == "compressed_vector":
-            cx = self.compress_vector(x, decimal_places, self.width_x, decompressed, compress_option)
+            cx = None
+            if affine_tolerance is not None:
+                cx = AffineAxis.from_values(x, affine_tolerance, decimal_places=decimal_places)
+            if cx is None:
+                cx = self.compress_vector(x, decimal_places, self.width_x, decompressed, compress_option)
+            else:
+                cx.set_decompressed_config(decompressed)
             cy = self.compress_vector(y, decimal_places, self.width_y, decompressed, compress_option)
             return cx, cy
         elif option == "compressed_vector_downsampler":
@@ -71,7 +80,8 @@ class InputHandler:
             method=downsampler,
             int_width=self.width_x,
             decimal_places=decimal_places,
-            compress_method=compress_option
+            compress_method=compress_option,
+            affine_tolerance=affine_tolerance
             )
             self.x_indices = cv_downsampler.get_x_indices()
             self.y_indices = cv_downsampler.get_y_indices()
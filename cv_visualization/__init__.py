@@ -1,17 +1,39 @@
-from .compressed_vector import CompressedVector
+from .compressed_vector import CompressedVector, CompressedVectorView, CompressedVectorExpression
 from .compressed_vector_downsampler import CompressedVectorDownsampler
+from .affine_axis import AffineAxis
+from .block_compressed_vector import BlockCompressedVector
+from .lod_pyramid import LODPyramid
+from .downsample_cache import DownsampleCache
+from .streaming_downsampler import StreamingDownsampler
+from .run_length_vector import RunLengthVector
+from .index_vector import IndexVector
 from .common import (
     COMPRESSION_METHODS,
+    COMPRESSION_OBJECTIVES,
     DOWNSAMPLERS,
+    REPRESENTATIONS,
     list_available_compression_methods,
     list_available_downsamplers,
+    list_available_representations,
 )
 
 __all__ = [
     "CompressedVector",
+    "CompressedVectorView",
+    "CompressedVectorExpression",
     "CompressedVectorDownsampler",
+    "AffineAxis",
+    "BlockCompressedVector",
+    "LODPyramid",
+    "DownsampleCache",
+    "StreamingDownsampler",
+    "RunLengthVector",
+    "IndexVector",
     "COMPRESSION_METHODS",
+    "COMPRESSION_OBJECTIVES",
     "DOWNSAMPLERS",
+    "REPRESENTATIONS",
     "list_available_compression_methods",
     "list_available_downsamplers",
+    "list_available_representations",
 ]
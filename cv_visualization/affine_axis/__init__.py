@@ -0,0 +1 @@
+from .affine_axis import AffineAxis
\ No newline at end of file
@@ -0,0 +1,250 @@
+import numpy as np
+from decimal import Decimal
+from ..common.available_methods import DEFAULT_CHUNK_SIZE
+from ..compressed_vector import CompressedVector, CompressedVectorView
+from ..common.indexing import normalize_indices
+
+# Most decimal places a selection of an axis is materialized with when none are given
+MAX_DECIMAL_PLACES = 15
+
+class AffineAxis:
+    def __init__(
+        self,
+        start=0.0,
+        step=1.0,
+        n=0,
+        decimal_places=None,
+        get_decompressed=False
+    ):
+        """
+        Implicit vector of n regularly spaced values start + step * i.
+        Only start, step and n are stored, so the size does not depend on n
+        and every lookup is pure arithmetic.
+        Args:
+            start (float): The first value.
+            step (float): The distance between consecutive values.
+            n (int): Number of values.
+            decimal_places (int): If given, values are rounded to this many decimal places.
+        """
+        if not isinstance(n, (int, np.integer)) or n < 0:
+            raise ValueError("n must be a non-negative integer")
+        if decimal_places is not None and decimal_places < 0:
+            raise ValueError("Decimal places must be non-negative")
+
+        self.start = float(start)
+        self.step = float(step)
+        self.n_elements = int(n)
+        self.decimal_places = decimal_places
+        self.get_decompressed = get_decompressed
+
+    @classmethod
+    def from_values(cls, values, tolerance=0.0, decimal_places=None):
+        """
+        Build an AffineAxis from values if they are regularly spaced.
+        Args:
+            values (array-like): The values to check.
+            tolerance (float): Maximum absolute difference allowed between a value
+                and start + step * i.
+            decimal_places (int): If given, values are rounded to this many decimal places.
+        Returns:
+            AffineAxis or None: None if the values are not regularly spaced within tolerance.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        n = len(values)
+        if n == 0:
+            return cls(0.0, 0.0, 0, decimal_places=decimal_places)
+        if np.isnan(values).any():
+            return None
+
+        step = (values[-1] - values[0]) / (n - 1) if n > 1 else 0.0
+        axis = cls(values[0], step, n, decimal_places=decimal_places)
+        if np.max(np.abs(axis.to_numpy() - values)) > tolerance:
+            return None
+        return axis
+
+    @property
+    def dtype(self):
+        """
+        Return the data type of the axis.
+        """
+        return np.dtype(float)
+
+    @property
+    def ndim(self):
+        return 1
+
+    @property
+    def shape(self):
+        return (self.n_elements,)
+
+    @property
+    def size(self):
+        return self.n_elements
+
+    def __len__(self):
+        """
+        Return the number of elements in the axis.
+        """
+        return self.n_elements
+
+    def __iter__(self):
+        """
+        Iterate over the values of the axis.
+        Returns:
+            generator: The values of the axis as python floats.
+        """
+        for chunk in self.iter_chunks():
+            yield from chunk.tolist()
+
+    def iter_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE, start=0, end=None):
+        """
+        Iterate over the values of the axis in numpy blocks.
+        Args:
+            chunk_size (int): Number of values per block. (default: 65536)
+            start (int): First index.
+            end (int): End index (exclusive). If None, until the end.
+        Returns:
+            generator: float64 numpy arrays of at most chunk_size values.
+        """
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer.")
+        start, end, _ = slice(start, end).indices(self.n_elements)
+        for chunk_start in range(start, end, chunk_size):
+            yield self._take(range(chunk_start, min(chunk_start + chunk_size, end)))
+
+    def __getitem__(self, index):
+        """
+        Get the value at the given index or a slice of values.
+        Args:
+            index (int, slice, list, np.ndarray, tuple): The index or slice to retrieve values from.
+        Returns:
+            float for an int index, a new AffineAxis for a slice, and for index lists
+            a numpy array if get_decompressed is True or a CompressedVectorView otherwise.
+        """
+        if isinstance(index, (int, np.integer)):
+            index = int(index)
+            if index < 0:
+                index += self.n_elements
+            if index < 0 or index >= self.n_elements:
+                raise IndexError("Index out of bounds")
+            return float(self._take(np.array([index]))[0])
+
+        elif isinstance(index, slice):
+            selected = range(*index.indices(self.n_elements))
+            if self.get_decompressed:
+                return self._take(selected)
+            return AffineAxis(
+                self.start + self.step * selected.start,
+                self.step * selected.step,
+                len(selected),
+                decimal_places=self.decimal_places,
+                get_decompressed=self.get_decompressed
+            )
+
+        elif isinstance(index, (list, np.ndarray, tuple)):
+            selected = normalize_indices(index, self.n_elements)
+            if self.get_decompressed:
+                return self._take(selected)
+            return CompressedVectorView(self, selected)
+
+        else:
+            raise TypeError(f"Invalid index type: {type(index)}. Expected int, slice, list or ndarray.")
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Support for the numpy array protocol.
+        Args:
+            dtype (np.dtype): Optional target dtype.
+            copy (bool): Ignored, a new array is always returned.
+        Returns:
+            np.ndarray: The values of the axis.
+        """
+        return self.to_numpy(dtype=dtype)
+
+    def to_numpy(self, dtype=np.float64):
+        """
+        Materialize the values of the axis into a numpy array.
+        Args:
+            dtype (np.dtype): The dtype of the returned array. (default: float64)
+        Returns:
+            np.ndarray: The values of the axis.
+        """
+        values = self._take(range(self.n_elements))
+        if dtype is not None and np.dtype(dtype) != values.dtype:
+            values = values.astype(dtype)
+        return values
+
+    def _take(self, indices):
+        """
+        Compute the values at the given indices.
+        Args:
+            indices (range or np.ndarray): Non-negative indices.
+        Returns:
+            np.ndarray: The float64 values.
+        """
+        if isinstance(indices, range):
+            indices = np.arange(indices.start, indices.stop, indices.step, dtype=np.int64)
+        values = self.start + self.step * np.asarray(indices, dtype=np.float64)
+        if self.decimal_places is not None:
+            values = np.round(values, self.decimal_places)
+        return values
+
+    def _new_like(self):
+        """
+        Create an empty CompressedVector to materialize irregular selections into.
+        Without decimal_places, the precision is the number of decimal places
+        start and step are written with, so every value is kept exactly.
+        Returns:
+            CompressedVector: A new vector without any parts created yet.
+        Raises:
+            ValueError: If start or step need more than MAX_DECIMAL_PLACES decimal places.
+        """
+        decimal_places = self.decimal_places
+        if decimal_places is None:
+            decimal_places = max(self._decimal_places_of(self.start), self._decimal_places_of(self.step))
+            if decimal_places > MAX_DECIMAL_PLACES:
+                raise ValueError(
+                    f"start={self.start} and step={self.step} cannot be stored with at most "
+                    f"{MAX_DECIMAL_PLACES} decimal places. Build the AffineAxis with decimal_places."
+                )
+        return CompressedVector(
+            decimal_places=decimal_places,
+            get_decompressed=self.get_decompressed
+        )
+
+    @staticmethod
+    def _decimal_places_of(value):
+        """
+        Return the number of decimal places of the shortest representation of a float.
+        """
+        return max(0, -Decimal(repr(float(value))).as_tuple().exponent)
+
+    def set_decompressed_config(self, get_decompressed):
+        """
+        Set the configuration for decompression.
+        Args:
+            get_decompressed (bool): Whether to return decompressed values.
+        """
+        self.get_decompressed = get_decompressed
+
+    def size_in_bytes(self):
+        """
+        Return the size in bytes of the axis: start, step and n as 64 bit values.
+        Returns:
+            int: Total size in bytes of the axis.
+        """
+        return 3 * np.dtype(np.float64).itemsize
+
+    def compression_ratio(self):
+        """
+        Return how many times smaller the axis is than the same values as a float64 array.
+        Returns:
+            float: n_elements * 8 / size_in_bytes().
+        """
+        return (self.n_elements * np.dtype(np.float64).itemsize) / self.size_in_bytes()
+
+    def destroy(self):
+        """
+        Reset the axis to an empty one.
+        """
+        self.n_elements = 0
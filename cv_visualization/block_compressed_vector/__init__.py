@@ -0,0 +1 @@
+from .block_compressed_vector import BlockCompressedVector
@@ -0,0 +1,410 @@
+import os
+import sdsl4py
+import numpy as np
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from ..common.available_methods import (
+    DEFAULT_BLOCK_SIZE,
+    DEFAULT_CHECKPOINT_INTERVAL,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_SAMPLE_SIZE,
+    EXECUTORS,
+)
+from ..compressed_vector import CompressedVector, CompressedVectorView
+from ..common.indexing import normalize_indices
+
+
+def _build_block(config, values, compress_method, objective, sample_size):
+    """
+    Build one block, and compress it if compress_method is given.
+    Module level so process pools can pickle it.
+    """
+    block = CompressedVector(**config)
+    block.create_vector(len(values))
+    block.fill_from_vector(values)
+    if compress_method is not None:
+        block.compress(compress_method, objective=objective, sample_size=sample_size)
+    return block
+
+
+def _compress_block(block, compress_method, objective, sample_size):
+    """
+    Compress one block. Module level so process pools can pickle it.
+    """
+    block.compress(compress_method, objective=objective, sample_size=sample_size)
+    return block
+
+
+class BlockCompressedVector:
+    def __init__(
+        self,
+        decimal_places=0,
+        int_width=64,
+        dtype=float,
+        get_decompressed=False,
+        representation="split",
+        checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL,
+        block_size=DEFAULT_BLOCK_SIZE,
+        n_jobs=None,
+        executor="thread"
+    ):
+        """
+        Compressed vector split into fixed size blocks, each a CompressedVector
+        with its own encoded parts and codecs. Blocks are built and compressed
+        in parallel, and changing a value only rebuilds its block.
+        Args:
+            decimal_places, int_width, representation, checkpoint_interval:
+                Configuration of every block, see CompressedVector.
+            block_size (int): Number of values per block. (default: 65536)
+            n_jobs (int): Number of workers. If None, the number of CPUs.
+            executor (str or Executor): "thread" or "process" pool, or an existing
+                concurrent.futures.Executor. "process" is not limited by the GIL but
+                pickles the blocks, as their encoded values, to move them between processes.
+                (default: "thread")
+        """
+        if not isinstance(block_size, int) or block_size <= 0:
+            raise ValueError("block_size must be a positive integer")
+        if n_jobs is not None and (not isinstance(n_jobs, int) or n_jobs <= 0):
+            raise ValueError("n_jobs must be a positive integer or None")
+        if not isinstance(executor, Executor) and executor not in EXECUTORS:
+            raise ValueError(
+                f"Unknown executor: '{executor}'. "
+                f"Available: {', '.join(EXECUTORS)}"
+            )
+        # Validates the configuration once instead of in every worker
+        CompressedVector(decimal_places, int_width, dtype, get_decompressed, representation, checkpoint_interval)
+
+        self.decimal_places = decimal_places
+        self.int_width = int_width
+        self.representation = representation
+        self.checkpoint_interval = checkpoint_interval
+        self.block_size = block_size
+        self.n_jobs = n_jobs
+        self.executor = executor
+        self.get_decompressed = get_decompressed
+        self.n_elements = 0
+        self.blocks = []
+
+    @property
+    def dtype(self):
+        """
+        Return the data type of the vector.
+        """
+        return np.dtype(float)
+
+    @property
+    def ndim(self):
+        return 1
+
+    @property
+    def shape(self):
+        return (self.n_elements,)
+
+    @property
+    def size(self):
+        return self.n_elements
+
+    @property
+    def compression_methods(self):
+        """
+        Return the compression method of each part, for every block.
+        Returns:
+            list: One dict per block, attribute name of each part to its method name.
+        """
+        return [getattr(block, "compression_methods", {}) for block in self.blocks]
+
+    def _block_config(self):
+        """
+        Return the CompressedVector arguments of a block.
+        """
+        return {
+            "decimal_places": self.decimal_places,
+            "int_width": self.int_width,
+            "get_decompressed": self.get_decompressed,
+            "representation": self.representation,
+            "checkpoint_interval": self.checkpoint_interval,
+        }
+
+    def _map(self, function, *iterables):
+        """
+        Run function over the blocks on the configured pool.
+        Returns:
+            list: The results, in order.
+        """
+        n_tasks = min(map(len, iterables)) if iterables else 0
+        if isinstance(self.executor, Executor):
+            return list(self.executor.map(function, *iterables))
+        n_jobs = min(self.n_jobs or os.cpu_count() or 1, n_tasks)
+        if n_jobs <= 1:
+            return list(map(function, *iterables))
+        pool = ThreadPoolExecutor if self.executor == "thread" else ProcessPoolExecutor
+        with pool(max_workers=n_jobs) as executor:
+            return list(executor.map(function, *iterables))
+
+    def _block_bounds(self, block_index):
+        """
+        Return the first index and the end index (exclusive) of a block.
+        """
+        block_start = block_index * self.block_size
+        return block_start, min(block_start + self.block_size, self.n_elements)
+
+    def create_vector(self, size):
+        """
+        Set the number of elements. Blocks are created by fill_from_vector.
+        """
+        self.n_elements = size
+        self.blocks = []
+
+    def fill_from_vector(self, original_vector, start=0, end=None, compress_method=None,
+                         objective="size", sample_size=DEFAULT_SAMPLE_SIZE):
+        """
+        Build the blocks from a vector in parallel.
+        Args:
+            original_vector (list): The original vector to fill the vector with.
+            start (int): The start index in the original vector (inclusive).
+            end (int): The end index in the original vector (exclusive). If None, use the length of the vector.
+            compress_method (str, function or dict): If given, every block is compressed with it
+                right after being built, in the same task. See CompressedVector.compress.
+            objective (str): With "auto", what the best method is, one of COMPRESSION_OBJECTIVES.
+            sample_size (int): With "auto", number of values of each part the methods are tried on.
+        """
+        if end is None or end > len(original_vector):
+            end = len(original_vector)
+        start = max(0, start)
+
+        if isinstance(original_vector, (CompressedVector, BlockCompressedVector)):
+            values = original_vector._take(range(start, max(start, end)))
+        else:
+            values = np.asarray(original_vector[start:end], dtype=np.float64)
+
+        self.n_elements = len(values)
+        n_blocks = -(-self.n_elements // self.block_size)
+        chunks = [values[self._block_bounds(i)[0]:self._block_bounds(i)[1]] for i in range(n_blocks)]
+        self.blocks = self._map(
+            _build_block,
+            [self._block_config()] * n_blocks,
+            chunks,
+            [compress_method] * n_blocks,
+            [objective] * n_blocks,
+            [sample_size] * n_blocks,
+        )
+
+    def compress(self, vector_type=sdsl4py.enc_vector_elias_gamma, objective="size", sample_size=DEFAULT_SAMPLE_SIZE):
+        """
+        Compress every block in parallel. With "auto", or "auto" parts in a dict,
+        each block picks its own codecs.
+        Args:
+            vector_type (str, function or dict): See CompressedVector.compress.
+            objective (str): With "auto", what the best method is, one of COMPRESSION_OBJECTIVES.
+            sample_size (int): With "auto", number of values of each part the methods are tried on.
+        """
+        n_blocks = len(self.blocks)
+        self.blocks = self._map(
+            _compress_block,
+            self.blocks,
+            [vector_type] * n_blocks,
+            [objective] * n_blocks,
+            [sample_size] * n_blocks,
+        )
+
+    def __len__(self):
+        """
+        Return the number of elements in the vector.
+        """
+        return self.n_elements
+
+    def __iter__(self):
+        """
+        Iterate over the decompressed values.
+        Returns:
+            generator: The values of the vector as python floats.
+        """
+        for chunk in self.iter_chunks():
+            yield from chunk.tolist()
+
+    def iter_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE, start=0, end=None):
+        """
+        Iterate over the decompressed values in numpy blocks.
+        Args:
+            chunk_size (int): Number of values per block. (default: 65536)
+            start (int): First index to decode.
+            end (int): End index (exclusive). If None, decode until the end.
+        Returns:
+            generator: float64 numpy arrays of at most chunk_size values.
+        """
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer.")
+        start, end, _ = slice(start, end).indices(self.n_elements)
+        if end <= start:
+            return
+
+        pending = []
+        n_pending = 0
+        for block_index in range(start // self.block_size, (end - 1) // self.block_size + 1):
+            block_start, block_end = self._block_bounds(block_index)
+            block_chunks = self.blocks[block_index].iter_chunks(
+                chunk_size, max(start, block_start) - block_start, min(end, block_end) - block_start
+            )
+            for chunk in block_chunks:
+                pending.append(chunk)
+                n_pending += len(chunk)
+                # Chunks do not stop at block boundaries
+                while n_pending >= chunk_size:
+                    values = np.concatenate(pending)
+                    yield values[:chunk_size]
+                    pending = [values[chunk_size:]]
+                    n_pending -= chunk_size
+        if n_pending:
+            yield np.concatenate(pending)
+
+    def __getitem__(self, index):
+        """
+        Get the value at the given index or a slice of values.
+        Args:
+            index (int, slice, list, np.ndarray, tuple): The index or slice to retrieve values from.
+        Returns:
+            float for an int index, otherwise a numpy array if get_decompressed
+            is True, or a CompressedVectorView over the specified indices.
+        """
+        if isinstance(index, (int, np.integer)):
+            index = int(index)
+            if index < 0:
+                index += self.n_elements
+            if index < 0 or index >= self.n_elements:
+                raise IndexError("Index out of bounds")
+            return self.blocks[index // self.block_size][index % self.block_size]
+
+        elif isinstance(index, (slice, list, np.ndarray, tuple)):
+            if isinstance(index, slice):
+                selected = range(*index.indices(self.n_elements))
+            else:
+                selected = normalize_indices(index, self.n_elements)
+
+            if self.get_decompressed:
+                return self._take(selected)
+            return CompressedVectorView(self, selected)
+
+        else:
+            raise TypeError(f"Invalid index type: {type(index)}. Expected int, slice, list or ndarray.")
+
+    def __setitem__(self, index, value):
+        """
+        Set the value at the given index, rebuilding only its block with the
+        codecs it was compressed with.
+        Args:
+            index (int): The index to set the value at.
+            value (float): The value to set.
+        """
+        if isinstance(index, (int, np.integer)):
+            index = int(index)
+            if index < 0 or index >= self.n_elements:
+                raise IndexError("Index out of range")
+
+            block_index = index // self.block_size
+            block = self.blocks[block_index]
+            values = block.to_numpy()
+            values[index % self.block_size] = value
+            methods = getattr(block, "compression_methods", None)
+            self.blocks[block_index] = _build_block(
+                self._block_config(), values, dict(methods) if methods else None, "size", DEFAULT_SAMPLE_SIZE
+            )
+
+    def _take(self, indices):
+        """
+        Decompress the values at the given indices.
+        Args:
+            indices (range or np.ndarray): Non-negative indices to decode.
+        Returns:
+            np.ndarray: The decompressed float64 values.
+        """
+        if isinstance(indices, range) and indices.step == 1:
+            if len(indices) == 0:
+                return np.empty(0, dtype=np.float64)
+            return np.concatenate(list(self.iter_chunks(len(indices), indices.start, indices.stop)))
+
+        indices = np.asarray(indices, dtype=np.int64)
+        values = np.empty(len(indices), dtype=np.float64)
+        block_ids = indices // self.block_size
+        for block_index in np.unique(block_ids):
+            mask = block_ids == block_index
+            block = self.blocks[int(block_index)]
+            values[mask] = block._take(indices[mask] - int(block_index) * self.block_size)
+        return values
+
+    def _new_like(self):
+        """
+        Create an empty BlockCompressedVector with the same configuration.
+        """
+        return BlockCompressedVector(
+            decimal_places=self.decimal_places,
+            int_width=self.int_width,
+            get_decompressed=self.get_decompressed,
+            representation=self.representation,
+            checkpoint_interval=self.checkpoint_interval,
+            block_size=self.block_size,
+            n_jobs=self.n_jobs,
+            executor=self.executor
+        )
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Support for the numpy array protocol.
+        Args:
+            dtype (np.dtype): Optional target dtype.
+            copy (bool): Ignored, a new array is always returned.
+        Returns:
+            np.ndarray: The decompressed values.
+        """
+        return self.to_numpy(dtype=dtype)
+
+    def to_numpy(self, dtype=np.float64):
+        """
+        Decompress the whole vector into a numpy array.
+        Args:
+            dtype (np.dtype): The dtype of the returned array. (default: float64)
+        Returns:
+            np.ndarray: The decompressed values.
+        """
+        values = self._take(range(self.n_elements))
+        if dtype is not None and np.dtype(dtype) != values.dtype:
+            values = values.astype(dtype)
+        return values
+
+    def set_decompressed_config(self, get_decompressed):
+        """
+        Set the configuration for decompression.
+        Args:
+            get_decompressed (bool): Whether to return decompressed values.
+        """
+        self.get_decompressed = get_decompressed
+        for block in self.blocks:
+            block.set_decompressed_config(get_decompressed)
+
+    def size_in_bytes(self, per_block=False):
+        """
+        Return the size in bytes of the vector.
+        Args:
+            per_block (bool): Return the size of each block instead of the total.
+        Returns:
+            int or list: Total size in bytes, or the size of each block.
+        """
+        sizes = [block.size_in_bytes() for block in self.blocks]
+        if per_block:
+            return sizes
+        return sum(sizes)
+
+    def compression_ratio(self):
+        """
+        Return how many times smaller the vector is than the same values as a float64 array.
+        Returns:
+            float: n_elements * 8 / size_in_bytes().
+        """
+        return (self.n_elements * np.dtype(np.float64).itemsize) / self.size_in_bytes()
+
+    def destroy(self):
+        """
+        Destroy every block and free memory.
+        """
+        for block in self.blocks:
+            block.destroy()
+        self.blocks = []
+        self.n_elements = 0
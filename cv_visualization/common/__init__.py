@@ -1,13 +1,19 @@
 from .available_methods import (
     COMPRESSION_METHODS,
+    COMPRESSION_OBJECTIVES,
     DOWNSAMPLERS,
+    REPRESENTATIONS,
     list_available_compression_methods,
     list_available_downsamplers,
+    list_available_representations,
 )
 
 __all__ = [
     "COMPRESSION_METHODS",
+    "COMPRESSION_OBJECTIVES",
     "DOWNSAMPLERS",
+    "REPRESENTATIONS",
     "list_available_compression_methods",
     "list_available_downsamplers",
+    "list_available_representations",
 ]
@@ -1,5 +1,6 @@
 import tsdownsample as tsd
 import sdsl4py
+from ..run_length_vector import RunLengthVector
 
 DOWNSAMPLERS = {
     "MinMaxLTTBDownsampler": tsd.MinMaxLTTBDownsampler,
@@ -23,11 +24,50 @@ COMPRESSION_METHODS = {
     "vlc_vector_fibonacci": sdsl4py.vlc_vector_fibonacci,
     "vlc_vector_comma_2": sdsl4py.vlc_vector_comma_2,
     "dac_vector": sdsl4py.dac_vector,
+    "rle": RunLengthVector,
     "No Compression": None,
 }
 
+REPRESENTATIONS = ["split", "packed", "delta", "delta_of_delta"]
+
+# Representations storing differences between consecutive values
+DELTA_REPRESENTATIONS = ["delta", "delta_of_delta"]
+
+# Distance between absolute checkpoints of the delta representations
+DEFAULT_CHECKPOINT_INTERVAL = 128
+
+# What compress("auto") optimizes for when picking a codec per part
+COMPRESSION_OBJECTIVES = ["size", "decode_speed", "balanced"]
+
+# Number of values per part compress("auto") trial compresses
+DEFAULT_SAMPLE_SIZE = 32768
+
+# Number of values decoded at once when streaming a vector in blocks
+DEFAULT_CHUNK_SIZE = 65536
+
+# How downsample_many aligns the points selected for each series
+DOWNSAMPLE_ALIGNMENTS = ["union", "per-series"]
+
+# Aggregates LODPyramid and StreamingDownsampler can keep per bin, with the number of points each keeps
+LOD_METHODS = {"m4": 4, "minmax": 2}
+
+# Number of values per block of a BlockCompressedVector
+DEFAULT_BLOCK_SIZE = 65536
+
+# Byte budget of a DownsampleCache
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+# Byte budget of the decoded-block cache of a compressed CompressedVector
+DEFAULT_BLOCK_CACHE_BYTES = 8 * 1024 * 1024
+
+# Pools parallel builds and batch jobs can run on
+EXECUTORS = ["thread", "process"]
+
 def list_available_downsamplers():
     return list(DOWNSAMPLERS.keys())
 
 def list_available_compression_methods():
     return list(COMPRESSION_METHODS.keys())
+
+def list_available_representations():
+    return list(REPRESENTATIONS)
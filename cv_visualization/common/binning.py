@@ -0,0 +1,40 @@
+import numpy as np
+
+def bin_extrema(values, bin_size, offset=0):
+    """
+    Find the first, last, min and max points of consecutive bins of bin_size values.
+    NaN values are never selected as min or max unless a bin has nothing else.
+    Args:
+        values (np.ndarray): The float64 values, the last bin may be shorter.
+        bin_size (int): Number of values per bin.
+        offset (int): Index of the first value, added to every returned index.
+    Returns:
+        dict: int64 arrays of indices ("first", "last", "min", "max", and "nan" for the
+            first NaN of each bin, -1 if none) and float64 arrays of the min and max
+            values ("min_value", "max_value"), with one entry per bin.
+    """
+    n_bins = -(-len(values) // bin_size)
+    padded = np.full(n_bins * bin_size, np.nan)
+    padded[:len(values)] = values
+    padded = padded.reshape(n_bins, bin_size)
+
+    nan_mask = np.isnan(padded)
+    low = np.where(nan_mask, np.inf, padded)
+    high = np.where(nan_mask, -np.inf, padded)
+    min_position = low.argmin(axis=1)
+    max_position = high.argmax(axis=1)
+    # padding is NaN too, it is never before a real value of its bin
+    nan_position = np.where(nan_mask.any(axis=1), nan_mask.argmax(axis=1), -1)
+    rows = np.arange(n_bins)
+    starts = offset + rows * bin_size
+    nan_index = np.where(nan_position >= 0, starts + nan_position, -1)
+
+    return {
+        "first": starts,
+        "last": np.minimum(starts + bin_size, offset + len(values)) - 1,
+        "min": starts + min_position,
+        "max": starts + max_position,
+        "nan": np.where(nan_index < offset + len(values), nan_index, -1),
+        "min_value": low[rows, min_position],
+        "max_value": high[rows, max_position],
+    }
@@ -0,0 +1,23 @@
+import numpy as np
+
+def normalize_indices(index, n_elements):
+    """
+    Convert a sequence of indices or a boolean mask into non-negative int64 positions.
+    Args:
+        index (list, np.ndarray, tuple): Indices, negative ones counting from the end,
+            or a boolean mask of n_elements values.
+        n_elements (int): Length of the indexed vector.
+    Returns:
+        np.ndarray: The int64 positions.
+    """
+    index = np.asarray(index)
+    if index.dtype == bool:
+        if index.size != n_elements:
+            raise IndexError(f"Boolean index of length {index.size} does not match the length of the vector ({n_elements})")
+        return np.flatnonzero(index).astype(np.int64)
+
+    selected = np.array(index, dtype=np.int64).reshape(-1)
+    selected[selected < 0] += n_elements
+    if len(selected) and (selected.min() < 0 or selected.max() >= n_elements):
+        raise IndexError("Index out of bounds")
+    return selected
@@ -0,0 +1,90 @@
+from collections import OrderedDict
+
+class LRUCache:
+    def __init__(self, max_bytes):
+        """
+        Least recently used cache under a byte size budget.
+        When storing an entry would exceed max_bytes, the least recently used
+        entries are evicted first. Entries larger than the budget are not stored.
+        Args:
+            max_bytes (int): Maximum total size in bytes of the stored entries.
+        """
+        if not isinstance(max_bytes, int) or max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size_in_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        Return the entry stored under key and mark it as the most recently used.
+        Args:
+            key (hashable): The key of the entry.
+        Returns:
+            The stored entry, or None if there is none.
+        """
+        if key not in self.entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return self.entries[key][0]
+
+    def put(self, key, value, size_in_bytes):
+        """
+        Store an entry, evicting the least recently used entries to stay within max_bytes.
+        Args:
+            key (hashable): The key of the entry.
+            value: The entry.
+            size_in_bytes (int): Size in bytes the entry counts for.
+        Returns:
+            bool: Whether the entry was stored.
+        """
+        if key in self.entries:
+            self.size_in_bytes -= self.entries.pop(key)[1]
+        if size_in_bytes > self.max_bytes:
+            return False
+        while self.entries and self.size_in_bytes + size_in_bytes > self.max_bytes:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.size_in_bytes -= evicted_size
+            self.evictions += 1
+        self.entries[key] = (value, size_in_bytes)
+        self.size_in_bytes += size_in_bytes
+        return True
+
+    def __len__(self):
+        """
+        Return the number of stored entries.
+        """
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def stats(self):
+        """
+        Return the usage statistics of the cache.
+        Returns:
+            dict: "hits", "misses", "hit_rate", "evictions", "entries", "size_in_bytes" and "max_bytes".
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "size_in_bytes": self.size_in_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self):
+        """
+        Remove every entry. Statistics are kept.
+        """
+        self.entries.clear()
+        self.size_in_bytes = 0
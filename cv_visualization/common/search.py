@@ -0,0 +1,27 @@
+import numpy as np
+
+def searchsorted(vector, value, side="left"):
+    """
+    Find the index where value would be inserted to keep a sorted vector sorted, like np.searchsorted.
+    numpy arrays are searched directly, anything else indexable (lists, CompressedVector,
+    AffineAxis...) by binary search, reading O(log n) values without decoding the vector.
+    Args:
+        vector: The sorted vector.
+        value (float): The value to search.
+        side (str): "left" for the first suitable index, "right" for the last.
+    Returns:
+        int: The insertion index.
+    """
+    if side not in ("left", "right"):
+        raise ValueError(f"Unknown side: '{side}'. Available: left, right")
+    if isinstance(vector, np.ndarray):
+        return int(np.searchsorted(vector, value, side=side))
+
+    low, high = 0, len(vector)
+    while low < high:
+        middle = (low + high) // 2
+        if vector[middle] < value or (side == "right" and vector[middle] == value):
+            low = middle + 1
+        else:
+            high = middle
+    return low
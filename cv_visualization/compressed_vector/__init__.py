@@ -1 +1,3 @@
-from .compressed_vector import CompressedVector
\ No newline at end of file
+from .compressed_vector import CompressedVector
+from .compressed_vector_view import CompressedVectorView
+from .compressed_vector_expression import CompressedVectorExpression
@@ -1,32 +1,133 @@
 import sdsl4py
 import math
+import os
+import tempfile
 import numpy as np
 import operator
-from ..common.available_methods import COMPRESSION_METHODS
+import itertools
+from collections import OrderedDict
+import time
+from decimal import Decimal
+from ..common.available_methods import (
+    COMPRESSION_METHODS,
+    DEFAULT_BLOCK_CACHE_BYTES,
+    DEFAULT_CHECKPOINT_INTERVAL,
+    COMPRESSION_OBJECTIVES,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_SAMPLE_SIZE,
+    DELTA_REPRESENTATIONS,
+    REPRESENTATIONS,
+)
+from .compressed_vector_view import CompressedVectorView
+from .compressed_vector_expression import CompressedVectorExpression
+from ..common.lru_cache import LRUCache
+from ..run_length_vector import RunLengthVector
+from ..common.indexing import normalize_indices
+
+FIXED_WIDTH_VECTORS = {
+    8: sdsl4py.int_vector_8,
+    16: sdsl4py.int_vector_16,
+    32: sdsl4py.int_vector_32,
+    64: sdsl4py.int_vector_64,
+}
+
+# Number of contiguous blocks a sample for automatic codec selection is made of
+SAMPLE_BLOCKS = 8
+
+# A range of a compressed part is read element by element instead of skipping
+# to it through the iterator when it starts this many times its length in
+RANDOM_ACCESS_FACTOR = 32
+
+# Operators applied to a scalar through the pending affine transform, with their in-place form
+AFFINE_OPERATORS = {
+    operator.add: operator.iadd,
+    operator.sub: operator.isub,
+    operator.mul: operator.imul,
+    operator.truediv: operator.itruediv,
+}
+
+# Number of values per block of the decoded-block cache. Reads of fewer
+# values than this go through the cache, longer ones decode directly
+CACHE_BLOCK_SIZE = 1024
+
 class CompressedVector:
+    # Makes numpy defer array + vector to __radd__ instead of converting the vector
+    __array_priority__ = 1000
+
     def __init__(
         self,
         decimal_places=0,
         int_width=64,
         dtype=float,
-        get_decompressed = False
+        get_decompressed = False,
+        representation="split",
+        checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL,
+        summary_block_size=None,
+        block_cache_bytes=DEFAULT_BLOCK_CACHE_BYTES
     ):
         """
         Initialize the CompressedVector with default values.
         Args:
             decimal_places (int): Number of decimal places to keep.
-            int_width (int): Width of the integer part in bits. (default: 64)
+            int_width (int or str): Width of the vectors in bits, 1 to 64. 8, 16, 32 and 64
+                use the fixed width int_vectors, other widths sdsl4py.int_vector. "auto" picks
+                the smallest fixed width fitting the data for each part, and widens a part
+                when a later value does not fit. (default: 64)
+            representation (str): How values are stored, one of REPRESENTATIONS.
+                "split" keeps integer, decimal and sign parts in three vectors,
+                "packed" keeps round(value * 10**decimal_places) zigzag encoded
+                in a single vector plus the positions of NaN values, "delta" and
+                "delta_of_delta" store the packed values as differences (of differences)
+                with an absolute checkpoint every checkpoint_interval values. (default: "split")
+            checkpoint_interval (int): Distance between absolute checkpoints of the delta
+                representations, random access decodes at most this many values. (default: 128)
+            summary_block_size (int): Number of values each zone map summary (min, max, sum,
+                NaN count) covers, so aggregates over a range only decode its edges.
+                None disables the zone map. (default: None)
+            block_cache_bytes (int): Byte budget of the LRU cache of decoded blocks of
+                CACHE_BLOCK_SIZE values, used by short random reads (cv[i], small slices
+                and index arrays) when parts are compressed. A block is cached on its second
+                lookup, so one-off reads do not decode whole blocks. None disables it. (default: 8 MiB)
+        Scalar +, -, * and / are not applied to the stored values: they update a pending
+        affine transform (scale, offset), applied to every decoded value, until materialize().
         """
         if decimal_places < 0:
             raise ValueError("Decimal places must be non-negative")
-        if decimal_places > int_width:
+        if int_width != "auto" and (not isinstance(int_width, int) or not 1 <= int_width <= 64):
+            raise ValueError("int_width must be an integer between 1 and 64, or 'auto'")
+        if int_width != "auto" and decimal_places > int_width:
             raise ValueError("Decimal places cannot be greater than int_width")
+        if representation not in REPRESENTATIONS:
+            raise ValueError(
+                f"Unknown representation: '{representation}'. "
+                f"Available: {', '.join(REPRESENTATIONS)}"
+            )
+        if not isinstance(checkpoint_interval, int) or checkpoint_interval <= 0:
+            raise ValueError("checkpoint_interval must be a positive integer")
+        if summary_block_size is not None and (not isinstance(summary_block_size, int) or summary_block_size <= 0):
+            raise ValueError("summary_block_size must be a positive integer or None")
+        if block_cache_bytes is not None and (not isinstance(block_cache_bytes, int) or block_cache_bytes <= 0):
+            raise ValueError("block_cache_bytes must be a positive integer or None")
         
         self.decimal_places = decimal_places
         self.int_width = int_width
+        self.representation = representation
+        self.checkpoint_interval = checkpoint_interval
+        self.summary_block_size = summary_block_size
+        self.zone_map = None
+        self.block_cache_bytes = block_cache_bytes
+        # Decoded stored values of blocks of compressed parts, by block number
+        self.block_cache = LRUCache(block_cache_bytes) if block_cache_bytes is not None else None
+        # Blocks looked up once but not cached yet, a block is only cached on its second lookup
+        self._seen_blocks = OrderedDict()
         self.current = 0
         self.n_elements = 0
         self.get_decompressed = get_decompressed
+        # Pending affine transform, decoded values are stored * scale + offset
+        self.scale = 1.0
+        self.offset = 0.0
+        # Number of vectors sharing the parts after a copy-on-write copy, None if not shared
+        self._part_refs = None
 
     
     @property
@@ -51,12 +152,43 @@ class CompressedVector:
 
     def __iter__(self):
         """
-        Initialize the iterator for the CompressedVector.
+        Iterate over the decompressed values.
+        Values are decoded chunk by chunk through iter_chunks, so compressed
+        codecs are read sequentially instead of once per element.
         Returns:
-            self: The CompressedVector instance itself for iteration.
+            generator: The values of the vector as python floats.
         """
-        self.current = 0  # Reset the current index for iteration
-        return self
+        self.current = 0  # Reset the current index for __next__
+        for chunk in self.iter_chunks():
+            yield from chunk.tolist()
+
+    def iter_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE, start=0, end=None):
+        """
+        Iterate over the decompressed values in numpy blocks.
+        Each part is scanned once from start to end, so enc_vector/vlc_vector
+        codecs are decoded in sampling-block order and peak memory stays at
+        one chunk per part.
+        Args:
+            chunk_size (int): Number of values per block. (default: 65536)
+            start (int): First index to decode.
+            end (int): End index (exclusive). If None, decode until the end.
+        Returns:
+            generator: float64 numpy arrays of at most chunk_size values.
+        """
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer.")
+        start, end, _ = slice(start, end).indices(self.n_elements)
+        if self.representation in DELTA_REPRESENTATIONS:
+            for chunk in self._iter_delta_chunks(chunk_size, start, end):
+                yield self._apply_transform(chunk)
+            return
+
+        parts = zip(*[
+            self._iter_part_chunks(part, chunk_size, start, end)
+            for part in self._parts()
+        ])
+        for chunk_start, arrays in zip(range(start, end, chunk_size), parts):
+            yield self._apply_transform(self._decode_parts(arrays, range(chunk_start, chunk_start + len(arrays[0]))))
     
     def __next__(self):
         """
@@ -83,9 +215,10 @@ class CompressedVector:
             index (int, slice, list, np.ndarray, tuple): The index or slice to retrieve values from.
         Returns:
             if the flag get_decompressed is True, returns a numpy array of float values.
-            if the flag get_decompressed is False, returns a new CompressedVector with the specified indices.
+            if the flag get_decompressed is False, returns a CompressedVectorView over the specified indices.
         """
-        if isinstance(index, int):
+        if isinstance(index, (int, np.integer)):
+            index = int(index)
             # Handle negative indices like native Python lists
             if index < 0:
                 index += self.n_elements
@@ -94,47 +227,152 @@ class CompressedVector:
             return self._reconstruct_float_value(index)
 
         elif isinstance(index, (slice, list, np.ndarray, tuple)):
+            selected = self._normalize_index(index)
+
             # when index is a slice, list, ndarray or tuple and
             # get_decompressed is True, return a numpy array of float values
             if self.get_decompressed:
-                if isinstance(index, slice):
-                    # Convert slice to a proper list of indices
-                    index = range(*index.indices(self.n_elements))
-
-                selected = np.array(index)
-                int_arr = np.asarray(self.integer_part)
-                dec_arr = np.asarray(self.decimal_part)
-                sign_arr = np.asarray(self.sign_part)
-
-                denom = 10 ** self.decimal_places
-                float_arr = int_arr[selected] + dec_arr[selected] / denom
-                float_arr[sign_arr[selected] == 0] *= -1
-                return float_arr
-            
-            # else if get_decompressed is False, return a new CompressedVector
-            else:
-                new_vector = CompressedVector(
-                    decimal_places=self.decimal_places,
-                    int_width=self.int_width,
-                    get_decompressed=False
-                )
-
-                if isinstance(index, slice):
-                    start, stop, step = index.indices(self.n_elements)
-                    index_range = range(start, stop, step)
-                    len_index = len(index_range)
-                    new_vector.create_vector(len_index)
-                    new_vector.fill_from_vector(self, start=start, end=stop)
-                else:
-                    len_index = len(index)
-                    new_vector.create_vector(len_index)
-                    new_vector.fill_from_vector(self, start=0, end=len_index)
+                return self._take(selected)
 
-                return new_vector
+            # else if get_decompressed is False, return a lazy view over the parent
+            return CompressedVectorView(self, selected)
 
         else:
             raise TypeError(f"Invalid index type: {type(index)}. Expected int, slice, list or ndarray.")
 
+    def _normalize_index(self, index):
+        """
+        Convert a slice or a sequence of indices into a range or an index array.
+        Args:
+            index (slice, list, np.ndarray, tuple): The index to normalize.
+        Returns:
+            range or np.ndarray: Slices become ranges, anything else a non-negative int64 array.
+        """
+        if isinstance(index, slice):
+            return range(*index.indices(self.n_elements))
+
+        return normalize_indices(index, self.n_elements)
+
+    def _take(self, indices):
+        """
+        Decompress the values at the given indices, with the pending affine transform applied.
+        Args:
+            indices (range or np.ndarray): Non-negative indices to decode.
+        Returns:
+            np.ndarray: The decompressed float64 values.
+        """
+        return self._apply_transform(self._take_stored(indices))
+
+    def _take_stored(self, indices):
+        """
+        Decompress the stored values at the given indices, without the pending affine transform.
+        Short reads of compressed parts go through the decoded-block cache.
+        Args:
+            indices (range or np.ndarray): Non-negative indices to decode.
+        Returns:
+            np.ndarray: The decompressed float64 values.
+        """
+        if 0 < len(indices) < CACHE_BLOCK_SIZE and self._uses_block_cache():
+            indices = np.asarray(indices, dtype=np.int64)
+            blocks = indices // CACHE_BLOCK_SIZE
+            values = np.empty(len(indices), dtype=np.float64)
+            for block in np.unique(blocks):
+                selected = blocks == block
+                block_values = self._cached_block(int(block))
+                if block_values is None:
+                    values[selected] = self._decode_stored(indices[selected])
+                else:
+                    values[selected] = block_values[indices[selected] - int(block) * CACHE_BLOCK_SIZE]
+            return values
+        return self._decode_stored(indices)
+
+    def _decode_stored(self, indices):
+        """
+        Decode the stored values at the given indices from the parts.
+        Args:
+            indices (range or np.ndarray): Non-negative indices to decode.
+        Returns:
+            np.ndarray: The decompressed float64 values.
+        """
+        if self.representation in DELTA_REPRESENTATIONS:
+            return self._take_delta(indices)
+
+        if isinstance(indices, range) and indices.step == 1:
+            arrays = [self._read_part(part, indices.start, indices.stop) for part in self._parts()]
+            return self._decode_parts(arrays, indices)
+
+        indices = np.asarray(indices, dtype=np.int64)
+        arrays = [self._read_part_at(part, indices) for part in self._parts()]
+        return self._decode_parts(arrays, indices)
+
+    def _new_like(self):
+        """
+        Create an empty CompressedVector with the same configuration.
+        Returns:
+            CompressedVector: A new vector without any parts created yet.
+        """
+        return CompressedVector(
+            decimal_places=self.decimal_places,
+            int_width=self.int_width,
+            get_decompressed=self.get_decompressed,
+            representation=self.representation,
+            checkpoint_interval=self.checkpoint_interval,
+            summary_block_size=self.summary_block_size,
+            block_cache_bytes=self.block_cache_bytes
+        )
+
+    def _part_names(self):
+        """
+        Return the attribute names of the sdsl vectors used by the representation.
+        """
+        if self.representation == "split":
+            return ("integer_part", "decimal_part", "sign_part")
+        return ("packed_part",)
+
+    def _auxiliary_names(self):
+        """
+        Return the attribute names of the extra sdsl vectors that are not one value per element.
+        """
+        if self.representation == "packed":
+            return ("nan_positions",)
+        if self.representation in DELTA_REPRESENTATIONS:
+            return ("nan_positions", "checkpoints")
+        return ()
+
+    def _parts(self):
+        """
+        Return the sdsl vectors used by the representation, in _part_names order.
+        Raises:
+            ValueError: If the vectors have not been created.
+        """
+        parts = [getattr(self, name, None) for name in self._part_names()]
+        if any(part is None for part in parts):
+            raise ValueError("Vectors not created. Call create_vector() first.")
+        return parts
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Support for the numpy array protocol, so np.asarray(cv) decodes in bulk.
+        Args:
+            dtype (np.dtype): Optional target dtype.
+            copy (bool): Ignored, a new array is always returned.
+        Returns:
+            np.ndarray: The decompressed values.
+        """
+        return self.to_numpy(dtype=dtype)
+
+    def to_numpy(self, dtype=np.float64):
+        """
+        Decompress the whole vector into a numpy array.
+        Args:
+            dtype (np.dtype): The dtype of the returned array. (default: float64)
+        Returns:
+            np.ndarray: The decompressed values, NaN where the sign part is 2.
+        """
+        values = self._take(range(self.n_elements))
+        if dtype is not None and np.dtype(dtype) != values.dtype:
+            values = values.astype(dtype)
+        return values
 
     def __setitem__(self, index, value):
         """
@@ -151,52 +389,378 @@ class CompressedVector:
             self._insert_value(index, value)
     
     def __copy__(self):
-        new = CompressedVector(
-            decimal_places=self.decimal_places,
-            int_width=self.int_width,
-            get_decompressed=self.get_decompressed
-        )
-        new.create_vector(self.n_elements)
-        for i in range(self.n_elements):
-            new._insert_value(i, self._reconstruct_float_value(i))
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy(copy_on_write=False)
+
+    def copy(self, copy_on_write=True):
+        """
+        Copy the vector without decoding it. Uncompressed parts are duplicated as they are,
+        compressed parts cannot be written and are shared. Codecs and the pending affine
+        transform are kept.
+        Args:
+            copy_on_write (bool): If True, the copy shares the parts with this vector and
+                whichever of them is written first clones them, so copying is O(1).
+                If False, the parts are cloned right away. (default: True)
+        Returns:
+            CompressedVector: An independent vector with the same values.
+        """
+        new = self._new_like()
+        new.n_elements = self.n_elements
+        new.scale, new.offset = self.scale, self.offset
+        for name in self._part_names() + self._auxiliary_names():
+            part = getattr(self, name, None)
+            setattr(new, name, part if copy_on_write or part is None else self._clone_part(part))
+        if copy_on_write:
+            if self._part_refs is None:
+                self._part_refs = [1]
+            self._part_refs[0] += 1
+            new._part_refs = self._part_refs
+
+        if self.zone_map is not None:
+            new.zone_map = {key: values.copy() for key, values in self.zone_map.items()}
+            new._zone_map_stale = self._zone_map_stale.copy()
+        for name in ("compression_methods", "compression_report"):
+            if hasattr(self, name):
+                setattr(new, name, dict(getattr(self, name)))
         return new
+
+    def _clone_part(self, part):
+        """
+        Duplicate a sdsl vector. int_vector_8/16/32/64 are copied as one memcpy through
+        their buffer, a sdsl4py.int_vector is rebuilt with the same width from its values.
+        Compressed codecs cannot be written, so they are returned as they are.
+        """
+        width = self._part_width(part)
+        if width is None:
+            return part
+        try:
+            source = np.asarray(memoryview(part))
+        except TypeError:
+            clone = sdsl4py.int_vector(len(part), 0, int_width=width)
+            self._write_part(clone, 0, self._read_part(part, 0, len(part)))
+            return clone
+        clone = type(part)(size=len(source), default_value=0)
+        np.asarray(memoryview(clone))[:] = source
+        return clone
+
+    def _detach_parts(self):
+        """
+        Clone the parts shared with copy-on-write copies before they are written.
+        """
+        if self._part_refs is None:
+            return
+        if self._part_refs[0] > 1:
+            for name in self._part_names() + self._auxiliary_names():
+                part = getattr(self, name, None)
+                if part is not None:
+                    setattr(self, name, self._clone_part(part))
+        self._release_parts()
+
+    def _release_parts(self):
+        """
+        Stop sharing the parts with copy-on-write copies, before they are replaced.
+        """
+        if self._part_refs is not None:
+            self._part_refs[0] -= 1
+            self._part_refs = None
+
+    def __getstate__(self):
+        """
+        Return the state of the vector for pickling, e.g. to send it to a process pool.
+        sdsl vectors cannot be pickled: uncompressed parts are stored as a numpy array of
+        their encoded values with their width, compressed parts as the bytes sdsl serializes
+        them to with the name of their compression method, so they are never encoded again.
+        Returns:
+            dict: The attributes of the vector, without any sdsl vector.
+        """
+        state = self.__dict__.copy()
+        methods = getattr(self, "compression_methods", {})
+        for name in self._part_names() + self._auxiliary_names():
+            part = state.get(name)
+            # A RunLengthVector pickles its runs itself
+            if part is None or isinstance(part, RunLengthVector):
+                continue
+            width = self._part_width(part)
+            if width is not None:
+                kind = "fixed" if type(part) is FIXED_WIDTH_VECTORS.get(width) else "int_vector"
+                state[name] = (kind, width, self._read_part(part, 0, len(part)))
+            elif COMPRESSION_METHODS.get(methods.get(name)) is not None:
+                state[name] = ("compressed", methods[name], self._serialize_part(part))
+            else:
+                raise TypeError(f"{name} is compressed with '{methods.get(name)}', which is not in COMPRESSION_METHODS and cannot be pickled.")
+        # Parts are no longer shared once unpickled, and cached blocks are cheap to decode again
+        state["_part_refs"] = None
+        state["block_cache"] = None
+        state["_seen_blocks"] = None
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore a vector pickled by __getstate__, rebuilding its sdsl vectors.
+        Args:
+            state (dict): The state returned by __getstate__.
+        """
+        self.__dict__.update(state)
+        self.block_cache = LRUCache(self.block_cache_bytes) if self.block_cache_bytes is not None else None
+        self._seen_blocks = OrderedDict()
+        for name in self._part_names() + self._auxiliary_names():
+            if not isinstance(state.get(name), tuple):
+                continue
+            # The width of an uncompressed part, the compression method name of a compressed one
+            kind, argument, data = state[name]
+            if kind == "compressed":
+                part = self._load_part(COMPRESSION_METHODS[argument], data)
+            else:
+                if kind == "fixed":
+                    part = FIXED_WIDTH_VECTORS[argument](size=len(data), default_value=0)
+                else:
+                    part = sdsl4py.int_vector(len(data), 0, int_width=argument)
+                self._write_part(part, 0, data)
+            setattr(self, name, part)
+
+    @staticmethod
+    def _serialize_part(part):
+        """
+        Serialize a compressed sdsl vector to bytes through sdsl's store_to_file.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "part.sdsl")
+            sdsl4py.store_to_file(part, path)
+            with open(path, "rb") as file:
+                return file.read()
+
+    @staticmethod
+    def _load_part(vector_type, data):
+        """
+        Load a compressed sdsl vector serialized by _serialize_part, without encoding it again.
+        Args:
+            vector_type: The sdsl class of the vector.
+            data (bytes): The serialized vector.
+        Returns:
+            The sdsl vector.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "part.sdsl")
+            with open(path, "wb") as file:
+                file.write(data)
+            part = vector_type()
+            sdsl4py.load_from_file(part, path)
+            return part
     
     def __add__(self, other):
-        result = self.__copy__()  # necesitarás implementar una copia si no la tenés
-        result += other
+        return self._binary_operation(operator.add, other)
+
+    def __radd__(self, other):
+        return self._binary_operation(operator.add, other, reflected=True)
+
+    def __sub__(self, other):
+        return self._binary_operation(operator.sub, other)
+
+    def __rsub__(self, other):
+        return self._binary_operation(operator.sub, other, reflected=True)
+
+    def __mul__(self, other):
+        return self._binary_operation(operator.mul, other)
+
+    def __rmul__(self, other):
+        return self._binary_operation(operator.mul, other, reflected=True)
+
+    def __truediv__(self, other):
+        return self._binary_operation(operator.truediv, other)
+
+    def __rtruediv__(self, other):
+        return self._binary_operation(operator.truediv, other, reflected=True)
+
+    def __pow__(self, other):
+        return self._binary_operation(operator.pow, other)
+
+    def __rpow__(self, other):
+        return self._binary_operation(operator.pow, other, reflected=True)
+
+    def __neg__(self):
+        result = self.copy()
+        result *= -1
         return result
 
+    def lazy(self):
+        """
+        Return a lazy expression of the vector. Operators on it build a
+        CompressedVectorExpression, evaluated in one fused chunked pass when consumed,
+        instead of a new CompressedVector per operation.
+        Returns:
+            CompressedVectorExpression: The expression, e.g. ((a.lazy() + b) * c).compute().
+        """
+        return CompressedVectorExpression(operator.pos, (self,))
+
+    def _binary_operation(self, op, other, reflected=False):
+        """
+        Compute op(self, other), or op(other, self) if reflected, into a new CompressedVector.
+        Scalar +, -, * and / with the vector on the left (and + and * on either side)
+        copy the vector copy-on-write and update the affine transform of the copy, in O(1).
+        Anything else is evaluated in one fused chunked pass through an expression.
+        """
+        in_place = AFFINE_OPERATORS.get(op)
+        if self._is_scalar(other) and in_place is not None and (not reflected or op in (operator.add, operator.mul)):
+            return in_place(self.copy(), other)
+        operands = (other, self) if reflected else (self, other)
+        return CompressedVectorExpression(op, operands).compute()
+
     def __iadd__(self, other):
+        if self._is_scalar(other):
+            self.offset += other
+            return self
         return self._apply_operation(other, operator.add)
 
     def __isub__(self, other):
+        if self._is_scalar(other):
+            self.offset -= other
+            return self
         return self._apply_operation(other, operator.sub)
 
     def __imul__(self, other):
+        if self._is_scalar(other):
+            self.scale *= other
+            self.offset *= other
+            return self
         return self._apply_operation(other, operator.mul)
 
     def __itruediv__(self, other):
+        if self._is_scalar(other):
+            if other == 0:
+                raise ZeroDivisionError("division by zero")
+            self.scale /= other
+            self.offset /= other
+            return self
         return self._apply_operation(other, operator.truediv)
 
     def __ipow__(self, other):
         return self._apply_operation(other, operator.pow)
 
 
-    def _apply_operation(self, other, op):
-        if isinstance(other, (int, float)):
-            for i in range(self.n_elements):
-                value = op(self._reconstruct_float_value(i), other)
-                self._insert_value(i, value)
-        elif isinstance(other, (list, np.ndarray)):
+    @staticmethod
+    def _is_scalar(value):
+        return isinstance(value, (int, float, np.number))
+
+    def has_transform(self):
+        """
+        Return whether a scalar operation is pending in the affine transform.
+        """
+        return self.scale != 1.0 or self.offset != 0.0
+
+    def _apply_transform(self, values):
+        """
+        Apply the pending affine transform to decoded stored values.
+        """
+        if not self.has_transform():
+            return values
+        return values * self.scale + self.offset
+
+    def materialize(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Bake the pending affine transform into the stored values, rounded to decimal_places.
+        The values are re-encoded chunk by chunk into new parts, compressed with the
+        same methods as the current ones, so compressed vectors can be materialized too.
+        Args:
+            chunk_size (int): Number of values decoded at once. (default: 65536)
+        Returns:
+            CompressedVector: self.
+        """
+        if not self.has_transform():
+            return self
+
+        new = self._new_like()
+        new.create_vector(self.n_elements)
+        for start in range(0, self.n_elements, chunk_size):
+            new._insert_values(start, self._take(range(start, min(start + chunk_size, self.n_elements))))
+        new._refresh_zone_map()
+        methods = getattr(self, "compression_methods", None)
+        if methods and any(method is not None for method in methods.values()):
+            new.compress(dict(methods))
+
+        self._release_parts()
+        for name in self._part_names() + self._auxiliary_names():
+            setattr(self, name, getattr(new, name))
+        self.zone_map = new.zone_map
+        if new.zone_map is not None:
+            self._zone_map_stale = new._zone_map_stale
+        self.scale, self.offset = 1.0, 0.0
+        self._clear_block_cache()
+        return self
+
+    def _apply_operation(self, other, op, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Apply an arithmetic operation in place, chunk by chunk.
+        Each chunk is decoded in bulk, combined with the operand through the numpy
+        operator and re-encoded in bulk, so memory stays bounded by the chunk size.
+        Operands reading this vector (views of it, expressions using it) read a
+        copy-on-write copy, so they never see the chunks already written.
+        Args:
+            other (int, float, list, np.ndarray, CompressedVector): Scalar, or vector as long as this one.
+                Anything with iter_chunks (views, BlockCompressedVector...) is read chunk by chunk too.
+            op (function): Binary operator, e.g. operator.add.
+            chunk_size (int): Number of values decoded at once. (default: 65536)
+        Returns:
+            CompressedVector: self.
+        """
+        if self._is_scalar(other):
+            operand_chunks = itertools.repeat(other)
+        elif isinstance(other, (list, np.ndarray)) or hasattr(other, "iter_chunks"):
             if len(other) != self.n_elements:
                 raise ValueError("Length mismatch in operation.")
-            for i in range(self.n_elements):
-                value = op(self._reconstruct_float_value(i), other[i])
-                self._insert_value(i, value)
+            operand_chunks = None
         else:
             raise TypeError(f"Unsupported type for operation: {type(other)}")
+
+        # Delta chunks start at checkpoints, so no block is decoded twice
+        if self.representation in DELTA_REPRESENTATIONS:
+            chunk_size = max(1, chunk_size // self.checkpoint_interval) * self.checkpoint_interval
+
+        if operand_chunks is None:
+            if isinstance(other, (list, np.ndarray)):
+                other = np.asarray(other, dtype=np.float64)
+            elif other is not self and self._is_read_by(other):
+                other = self._snapshot_operand(other)
+
+        # Checked before writing anything, so a failed division leaves the vector as it was
+        if op is operator.truediv and CompressedVectorExpression._has_zero(other, chunk_size):
+            raise ZeroDivisionError("division by zero")
+
+        if operand_chunks is None:
+            if isinstance(other, np.ndarray):
+                operand_chunks = (other[start:start + chunk_size] for start in range(0, self.n_elements, chunk_size))
+            elif other is self:
+                operand_chunks = None
+            else:
+                operand_chunks = other.iter_chunks(chunk_size)
+
+        for start in range(0, self.n_elements, chunk_size):
+            end = min(start + chunk_size, self.n_elements)
+            values = self._take(range(start, end))
+            operand = values if operand_chunks is None else next(operand_chunks)
+            with np.errstate(invalid="ignore", over="ignore"):
+                self._insert_values(start, op(values, operand))
         return self
 
+    def _is_read_by(self, operand):
+        """
+        Return whether decoding an operand reads this vector: the vector itself, a view
+        of it, or an expression with one of those among its operands.
+        """
+        if operand is self or getattr(operand, "parent", None) is self:
+            return True
+        return any(self._is_read_by(child) for child in getattr(operand, "operands", ()))
+
+    def _snapshot_operand(self, operand):
+        """
+        Return an operand reading a copy-on-write copy of this vector instead of the vector.
+        Views are re-pointed at the copy, other operands are decoded.
+        """
+        if getattr(operand, "parent", None) is self:
+            return CompressedVectorView(self.copy(), operand.indices)
+        return operand.to_numpy()
+
     def select_compression_method(self, method):
         if method in COMPRESSION_METHODS.values() or method is None:
             return method
@@ -217,36 +781,688 @@ class CompressedVector:
             index (int): The index to insert the value at.
             value (float): The value to insert.
         """
+        self.materialize()
+        self._detach_parts()
+        self._clear_block_cache()
+        if self.representation != "split" or self.int_width == "auto":
+            self._insert_values(index, np.array([value], dtype=np.float64))
+            return
+
+        parts = (self.integer_part, self.decimal_part, self.sign_part)
+        encoded = self._encode_value(value)
+        # Every part is checked before any is written, so a failed write changes nothing
+        for part, encoded_part in zip(parts, encoded):
+            self._check_fits(part, encoded_part)
+        self._mark_zone_map(index, index + 1)
+        for part, encoded_part in zip(parts, encoded):
+            part[index] = encoded_part
+
+    def _encode_value(self, value):
+        """
+        Split a single float into its integer, decimal and sign parts.
+        Args:
+            value (float): The value to encode.
+        Returns:
+            tuple: (integer part, decimal part, sign part) as python ints.
+        """
         # Check for NaN values
         if math.isnan(value):
-            self.integer_part[index] = 0
-            self.decimal_part[index] = 0
-            self.sign_part[index] = 2  # Special code for NaN (not 0 or 1)
-            return
-            
-        from decimal import Decimal
+            return 0, 0, 2  # Special code for NaN (not 0 or 1)
 
-        value_dec = Decimal(str(abs(value)))
-        int_part = int(value_dec)
-        dec_part = value_dec - int_part
-        dec_part = round(dec_part, self.decimal_places)
-        dec_part = int(dec_part * (10 ** self.decimal_places))
+        # Round the shortest decimal representation, so 0.15 stays 0.15
+        # instead of 0.1499999... like the binary float would
+        scaled = Decimal(str(abs(value))).scaleb(self.decimal_places)
+        int_part, dec_part = divmod(int(scaled.to_integral_value()), 10 ** self.decimal_places)
         sign_part = 1 if value >= 0 else 0
-        self.integer_part[index] = int_part
-        self.decimal_part[index] = dec_part
-        self.sign_part[index] = sign_part
+        return int_part, dec_part, sign_part
+
+    def _encode_values(self, values):
+        """
+        Vectorized counterpart of _encode_value for a whole array.
+        Values whose scaled magnitude lands too close to a rounding tie, or
+        that are too large to be represented exactly as a float, are
+        re-encoded through _encode_value so the result is always the same.
+        Args:
+            values (np.ndarray): Float values to encode.
+        Returns:
+            tuple: (integer parts, decimal parts, sign parts) as uint64 arrays.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        denom = 10 ** self.decimal_places
+        nan_mask = np.isnan(values)
+
+        with np.errstate(invalid="ignore", over="ignore"):
+            scaled = np.abs(np.where(nan_mask, 0.0, values)) * float(denom)
+            rounded = np.rint(scaled)
+            distance_to_tie = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5)
+            # float64 keeps 53 bits, anything at or above 2**52 (or a tie
+            # closer than the representation error) needs the exact path
+            inexact = (
+                ~np.isfinite(scaled)
+                | (scaled >= 2.0 ** 52)
+                | (distance_to_tie <= 1e-9 + scaled * 2.0 ** -50)
+            ) & ~nan_mask
+
+        total = np.where(inexact, 0.0, rounded).astype(np.uint64)
+        if denom < 2 ** 63:
+            int_parts, dec_parts = np.divmod(total, np.uint64(denom))
+        else:
+            # every non-zero value has already been flagged as inexact
+            int_parts, dec_parts = np.zeros_like(total), total
+        sign_parts = np.where(values >= 0, 1, 0).astype(np.uint64)
+        sign_parts[nan_mask] = 2
+
+        exact_indices = np.flatnonzero(inexact)
+        if len(exact_indices):
+            encoded = [self._encode_value(float(values[i])) for i in exact_indices]
+            if any(part >= 2 ** 64 for int_part, dec_part, _ in encoded for part in (int_part, dec_part)):
+                int_parts, dec_parts = int_parts.astype(object), dec_parts.astype(object)
+            for i, (int_part, dec_part, sign_part) in zip(exact_indices, encoded):
+                int_parts[i], dec_parts[i], sign_parts[i] = int_part, dec_part, sign_part
+
+        return int_parts, dec_parts, sign_parts
+
+    def _check_fits(self, part, value):
+        """
+        Raise OverflowError if an encoded value does not fit in the width of an sdsl vector.
+        Args:
+            part: The sdsl vector to write into.
+            value (int): The largest encoded value to write.
+        """
+        width = self._part_width(part)
+        if width is not None and value >= 2 ** width:
+            raise OverflowError(
+                f"Value {value} does not fit in {width} bits (int_width={self.int_width})"
+            )
+
+    def _write_part(self, part, start, values):
+        """
+        Write a block of already encoded values into one of the sdsl vectors.
+        Vectors exposing the buffer protocol (int_vector_8/16/32/64) are written
+        through a numpy view in one go, anything else falls back to item assignment.
+        Args:
+            part: The sdsl vector to write into.
+            start (int): First index to write.
+            values (np.ndarray): Encoded values.
+        """
+        if len(values):
+            self._check_fits(part, int(values.max()))
+
+        try:
+            view = np.asarray(memoryview(part))
+        except TypeError:
+            view = None
+
+        if view is not None and view.flags.writeable and values.dtype != object:
+            view[start:start + len(values)] = values
+            return
+
+        for offset, value in enumerate(values):
+            part[start + offset] = int(value)
+
+    def _write_named_part(self, name, start, values):
+        """
+        Write a block of encoded values into the part stored in the given attribute.
+        With int_width="auto" the part is first widened if the values do not fit.
+        Args:
+            name (str): Attribute name of the part.
+            start (int): First index to write.
+            values (np.ndarray): Encoded values.
+        """
+        if self.int_width == "auto" and len(values):
+            required = max(1, int(values.max()).bit_length())
+            width = self._part_width(getattr(self, name))
+            if width is not None and required > width:
+                self._promote_part(name, required)
+        self._write_part(getattr(self, name), start, values)
+
+    def _promote_part(self, name, required):
+        """
+        Replace a part by the smallest fixed width int_vector holding required bits, keeping its values.
+        Args:
+            name (str): Attribute name of the part.
+            required (int): Number of bits the part has to hold.
+        """
+        width = next(width for width in FIXED_WIDTH_VECTORS if width >= required)
+        old_part = getattr(self, name)
+        new_part = FIXED_WIDTH_VECTORS[width](size=len(old_part), default_value=0)
+        self._write_part(new_part, 0, self._read_part(old_part, 0, len(old_part)))
+        setattr(self, name, new_part)
+
+    @staticmethod
+    def _part_width(part):
+        """
+        Return the bit width of an uncompressed sdsl vector, None for compressed ones.
+        """
+        try:
+            return np.asarray(memoryview(part)).dtype.itemsize * 8
+        except TypeError:
+            width = getattr(part, "width", None)
+            return width() if callable(width) else width
+
+    def part_widths(self):
+        """
+        Return the bit width of each part, None for compressed parts.
+        Returns:
+            dict: Attribute name of each part to its width in bits.
+        """
+        return {name: self._part_width(part) for name, part in zip(self._part_names(), self._parts())}
+
+    def bit_compress(self):
+        """
+        Repack every uncompressed part into a sdsl4py.int_vector using the minimum
+        number of bits its values need, e.g. 2 bits for the sign part.
+        Later writes of values that do not fit raise OverflowError, unless int_width is "auto".
+        Returns:
+            dict: The width of each part after repacking, see part_widths().
+        """
+        for name, part in zip(self._part_names(), self._parts()):
+            width = self._part_width(part)
+            if width is None:
+                continue
+            values = self._read_part(part, 0, len(part))
+            required = max(1, int(values.max()).bit_length()) if len(values) else 1
+            if required == width:
+                continue
+            packed = sdsl4py.int_vector(len(values), int_width=required)
+            self._write_part(packed, 0, values)
+            setattr(self, name, packed)
+        return self.part_widths()
+
+    def _insert_values(self, start, values):
+        """
+        Encode and insert a block of values starting at the specified index.
+        Args:
+            start (int): The index of the first value.
+            values (array-like): The float values to insert.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        self.materialize()
+        self._detach_parts()
+        self._clear_block_cache()
+        self._mark_zone_map(start, start + len(values))
+        if self.representation in DELTA_REPRESENTATIONS:
+            self._insert_delta_values(start, values)
+            return
+
+        self._parts()
+        for name, encoded in zip(self._part_names(), self._encode_parts(values)):
+            self._write_named_part(name, start, encoded)
+        if self.representation == "packed":
+            self._update_nan_positions(start, start + len(values), np.isnan(values))
+
+    def _encode_parts(self, values):
+        """
+        Encode a block of values into one array per sdsl vector of the representation.
+        Args:
+            values (np.ndarray): Float values to encode.
+        Returns:
+            list: Encoded uint64 arrays, in _part_names order.
+        """
+        if self.representation == "packed":
+            return [self._zigzag_encode(self._encode_fixed_point(values))]
+        return list(self._encode_values(values))
+
+    def _encode_fixed_point(self, values):
+        """
+        Encode a block of values as signed round(value * 10**decimal_places) integers.
+        NaN values are encoded as 0, their positions are kept in nan_positions.
+        Args:
+            values (np.ndarray): Float values to encode.
+        Returns:
+            np.ndarray: The fixed point values as int64.
+        Raises:
+            OverflowError: If a value does not fit in a signed 64 bit integer.
+        """
+        int_parts, dec_parts, sign_parts = self._encode_values(values)
+        denom = 10 ** self.decimal_places
+        # |value * 10**decimal_places| has to fit in a signed 64 bit integer
+        max_int_part = (2 ** 63 - 1) // denom - 1
+        if int_parts.dtype == object or (len(int_parts) and int(int_parts.max()) > max_int_part):
+            raise OverflowError(
+                f"Values do not fit in the packed representation with decimal_places={self.decimal_places}"
+            )
+        total = (int_parts * np.uint64(denom) + dec_parts).astype(np.int64)
+        total[sign_parts == 0] *= -1
+        return total
+
+    @staticmethod
+    def _zigzag_encode(values):
+        """
+        Map signed integers to unsigned ones: 0, -1, 1, -2, ... -> 0, 1, 2, 3, ...
+        """
+        values = np.asarray(values, dtype=np.int64)
+        return ((values << 1) ^ (values >> 63)).astype(np.uint64)
+
+    @staticmethod
+    def _zigzag_decode(values):
+        """
+        Inverse of _zigzag_encode.
+        """
+        values = np.asarray(values, dtype=np.uint64)
+        return (values >> np.uint64(1)).astype(np.int64) ^ -(values & np.uint64(1)).astype(np.int64)
+
+    def _update_nan_positions(self, start, end, nan_mask):
+        """
+        Replace the NaN positions of the packed representation inside [start, end).
+        Args:
+            start (int): First index written.
+            end (int): End index written (exclusive).
+            nan_mask (np.ndarray): Boolean mask of the NaN values written.
+        """
+        positions = self._nan_positions_array()
+        positions = positions[(positions < start) | (positions >= end)]
+        positions = np.union1d(positions, np.flatnonzero(nan_mask) + start).astype(np.uint64)
+        if not len(positions) and not len(self.nan_positions):
+            return
+        self.nan_positions = sdsl4py.int_vector_64(size=len(positions), default_value=0)
+        self._write_part(self.nan_positions, 0, positions)
+
+    def _nan_positions_array(self):
+        """
+        Return the sorted NaN positions of the packed representation as an int64 array.
+        """
+        return self._read_part(self.nan_positions, 0, len(self.nan_positions)).astype(np.int64)
+
+    def _decode_parts(self, arrays, positions):
+        """
+        Decode one array per sdsl vector of the representation into float values.
+        Args:
+            arrays (list): Encoded arrays, in _part_names order.
+            positions (range or np.ndarray): Indices of the encoded values in the vector.
+        Returns:
+            np.ndarray: The decompressed float64 values.
+        """
+        if self.representation == "split":
+            return self._decode_values(*arrays)
+
+        values = self._decode_fixed_point(self._zigzag_decode(arrays[0]))
+        return self._apply_nan_positions(values, positions)
+
+    def _decode_fixed_point(self, total):
+        """
+        Decode signed round(value * 10**decimal_places) integers into float values.
+        Args:
+            total (np.ndarray): The fixed point values as int64.
+        Returns:
+            np.ndarray: The decompressed float64 values.
+        """
+        magnitude = np.abs(total).astype(np.uint64)
+        denom = np.uint64(10 ** self.decimal_places) if self.decimal_places < 20 else None
+        if denom is None:
+            int_arr, dec_arr = np.zeros_like(magnitude), magnitude
+        else:
+            int_arr, dec_arr = np.divmod(magnitude, denom)
+        return self._decode_values(int_arr, dec_arr, np.where(total < 0, 0, 1))
+
+    def _apply_nan_positions(self, values, positions):
+        """
+        Set to NaN the values whose position is listed in nan_positions.
+        Args:
+            values (np.ndarray): Decoded values, modified in place.
+            positions (range or np.ndarray): Indices of the values in the vector.
+        Returns:
+            np.ndarray: The same values array.
+        """
+        nan_positions = self._nan_positions_array()
+        if len(nan_positions):
+            if isinstance(positions, range) and positions.step == 1:
+                low, high = np.searchsorted(nan_positions, [positions.start, positions.stop])
+                values[nan_positions[low:high] - positions.start] = np.nan
+            else:
+                values[np.isin(np.asarray(positions), nan_positions)] = np.nan
+        return values
+
+    def _insert_delta_values(self, start, values):
+        """
+        Encode and insert a block of values in one of the delta representations.
+        The delta chain restarts at every checkpoint, so only the checkpoint
+        blocks touched by [start, start + len(values)) are re-encoded.
+        Args:
+            start (int): The index of the first value.
+            values (np.ndarray): The float values to insert.
+        """
+        interval = self.checkpoint_interval
+        end = start + len(values)
+        block_start = start - start % interval
+        block_end = min(max(self.n_elements, end), -(-end // interval) * interval)
+
+        # Partially overwritten blocks keep their other values
+        if block_start < start or end < block_end:
+            block_values = self._take_delta(range(block_start, min(block_end, self.n_elements)))
+            block_values = np.concatenate([block_values, np.zeros(block_end - block_start - len(block_values))])
+            block_values[start - block_start:end - block_start] = values
+        else:
+            block_values = values
+
+        nan_mask = np.isnan(block_values)
+        total = self._encode_fixed_point(block_values)
+        # NaN repeats the previous value so it does not break the delta chain
+        if nan_mask.any():
+            last_valid = np.maximum.accumulate(np.where(nan_mask, -1, np.arange(len(total))))
+            total = np.where(last_valid >= 0, total[np.maximum(last_valid, 0)], 0)
+
+        is_checkpoint = (np.arange(block_start, block_end) % interval) == 0
+        deltas = np.diff(total, prepend=np.int64(0))
+        deltas[is_checkpoint] = 0
+        if self.representation == "delta_of_delta":
+            deltas = np.diff(deltas, prepend=np.int64(0))
+            deltas[is_checkpoint] = 0
+
+        self._write_named_part("packed_part", block_start, self._zigzag_encode(deltas))
+        self._write_part(self.checkpoints, block_start // interval, self._zigzag_encode(total[is_checkpoint]))
+        self._update_nan_positions(block_start, block_end, nan_mask)
+
+    @staticmethod
+    def _segmented_cumsum(values, is_reset, reset_values, carry):
+        """
+        Cumulative sum that restarts at every reset position.
+        Args:
+            values (np.ndarray): int64 values to accumulate, ignored at reset positions.
+            is_reset (np.ndarray): Boolean mask of the reset positions.
+            reset_values (np.ndarray): Value taken at each reset position, in order.
+            carry (int): Running total before the first value.
+        Returns:
+            np.ndarray: The accumulated int64 values.
+        """
+        positions = np.arange(len(values))
+        cumulative = np.cumsum(values)
+        last_reset = np.maximum.accumulate(np.where(is_reset, positions, -1))
+        at_reset = np.zeros(len(values), dtype=np.int64)
+        at_reset[is_reset] = reset_values
+        since_reset = last_reset >= 0
+        safe_reset = np.maximum(last_reset, 0)
+        return np.where(
+            since_reset,
+            at_reset[safe_reset] + cumulative - cumulative[safe_reset],
+            np.int64(carry) + cumulative
+        )
+
+    def _decode_delta(self, stored, start, carry=(0, 0)):
+        """
+        Decode stored (zigzag) deltas of the delta representations into fixed point values.
+        Args:
+            stored (np.ndarray): The stored values of packed_part from index start on.
+            start (int): Index of the first stored value.
+            carry (tuple): (value, delta) of the element before start, unused if start is a checkpoint.
+        Returns:
+            tuple: The fixed point values as int64 and the carry for the next block.
+        """
+        interval = self.checkpoint_interval
+        positions = np.arange(start, start + len(stored))
+        is_checkpoint = positions % interval == 0
+        first_checkpoint = -(-start // interval)
+        checkpoints = self._zigzag_decode(self._read_part(
+            self.checkpoints, first_checkpoint, first_checkpoint + int(is_checkpoint.sum())
+        ))
+
+        deltas = self._zigzag_decode(stored)
+        if self.representation == "delta_of_delta":
+            deltas = self._segmented_cumsum(deltas, is_checkpoint, 0, carry[1])
+        total = self._segmented_cumsum(deltas, is_checkpoint, checkpoints, carry[0])
+        if not len(total):
+            return total, carry
+        return total, (int(total[-1]), int(deltas[-1]))
+
+    def _take_delta(self, indices):
+        """
+        Decompress the values at the given indices of one of the delta representations.
+        Args:
+            indices (range or np.ndarray): Non-negative indices to decode.
+        Returns:
+            np.ndarray: The decompressed float64 values.
+        """
+        interval = self.checkpoint_interval
+        if isinstance(indices, range) and indices.step == 1:
+            if not len(indices):
+                return np.empty(0, dtype=np.float64)
+            scan_start = indices.start - indices.start % interval
+            total, _ = self._decode_delta(self._read_part(self.packed_part, scan_start, indices.stop), scan_start)
+            values = self._decode_fixed_point(total[indices.start - scan_start:])
+            return self._apply_nan_positions(values, indices)
+
+        indices = np.asarray(indices, dtype=np.int64)
+        values = np.empty(len(indices), dtype=np.float64)
+        # Decode each touched checkpoint block once, up to the last index needed
+        blocks = indices // interval
+        for block in np.unique(blocks):
+            selected = np.flatnonzero(blocks == block)
+            block_start = int(block) * interval
+            block_values = self._take_delta(range(block_start, int(indices[selected].max()) + 1))
+            values[selected] = block_values[indices[selected] - block_start]
+        return values
+
+    def _iter_delta_chunks(self, chunk_size, start, end):
+        """
+        iter_chunks for the delta representations, carrying the running value across chunks.
+        Args:
+            chunk_size (int): Number of values per block.
+            start (int): First index to decode.
+            end (int): End index (exclusive).
+        Returns:
+            generator: float64 numpy arrays of at most chunk_size values.
+        """
+        scan_start = start - start % self.checkpoint_interval
+        carry = (0, 0)
+        chunk_start = scan_start
+        for stored in self._iter_part_chunks(self.packed_part, chunk_size, scan_start, end):
+            total, carry = self._decode_delta(stored, chunk_start, carry)
+            skip = max(0, start - chunk_start)
+            positions = range(chunk_start + skip, chunk_start + len(stored))
+            chunk_start += len(stored)
+            if len(positions):
+                yield self._apply_nan_positions(self._decode_fixed_point(total[skip:]), positions)
+
+    def _read_part(self, part, start=0, end=None):
+        """
+        Read a block of one of the sdsl vectors into a numpy array.
+        Vectors exposing the buffer protocol are read through a numpy view,
+        compressed vectors are decoded sequentially through their iterator.
+        Args:
+            part: The sdsl vector to read from.
+            start (int): First index to read.
+            end (int): End index (exclusive). If None, read until the end.
+        Returns:
+            np.ndarray: The encoded values as uint64.
+        """
+        if end is None:
+            end = self.n_elements
+        if end <= start:
+            return np.empty(0, dtype=np.uint64)
+        return next(self._iter_part_chunks(part, end - start, start, end))
+
+    def _iter_part_chunks(self, part, chunk_size, start, end):
+        """
+        Iterate over one of the sdsl vectors in blocks of encoded values.
+        Args:
+            part: The sdsl vector to read from.
+            chunk_size (int): Number of values per block.
+            start (int): First index to read.
+            end (int): End index (exclusive).
+        Returns:
+            generator: uint64 numpy arrays of at most chunk_size values.
+        """
+        try:
+            view = np.asarray(memoryview(part))
+        except TypeError:
+            view = None
+
+        if view is not None:
+            for chunk_start in range(start, end, chunk_size):
+                yield view[chunk_start:min(chunk_start + chunk_size, end)].astype(np.uint64)
+            return
+
+        # Skipping a long prefix through the iterator costs more than
+        # decoding a short range element by element from its sampling point
+        if start > RANDOM_ACCESS_FACTOR * (end - start):
+            for chunk_start in range(start, end, chunk_size):
+                chunk_end = min(chunk_start + chunk_size, end)
+                yield np.fromiter(
+                    (int(part[i]) for i in range(chunk_start, chunk_end)),
+                    dtype=np.uint64,
+                    count=chunk_end - chunk_start
+                )
+            return
+
+        # A single iterator keeps the decoding sequential across chunks
+        iterator = iter(part)
+        if start:
+            next(itertools.islice(iterator, start - 1, start), None)
+        for chunk_start in range(start, end, chunk_size):
+            count = min(chunk_size, end - chunk_start)
+            yield np.fromiter(
+                (int(value) for value in itertools.islice(iterator, count)),
+                dtype=np.uint64,
+                count=count
+            )
+
+    def _read_part_at(self, part, indices):
+        """
+        Read the values at the given indices of one of the sdsl vectors.
+        Args:
+            part: The sdsl vector to read from.
+            indices (np.ndarray): Indices to read.
+        Returns:
+            np.ndarray: The encoded values as uint64.
+        """
+        try:
+            view = np.asarray(memoryview(part))
+        except TypeError:
+            view = None
+
+        if view is not None:
+            return view[indices].astype(np.uint64)
+        if len(indices) == 0:
+            return np.empty(0, dtype=np.uint64)
+
+        # Dense selections are cheaper to decode with one sequential scan
+        low, high = int(indices.min()), int(indices.max()) + 1
+        if len(indices) * 16 >= high - low:
+            return self._read_part(part, low, high)[indices - low]
+        return np.fromiter((int(part[int(i)]) for i in indices), dtype=np.uint64, count=len(indices))
+
+    def _decode_values(self, int_arr, dec_arr, sign_arr):
+        """
+        Vectorized counterpart of _reconstruct_float_value.
+        The integer and decimal parts are combined into one exact integer before
+        the single division, so the result is rounded exactly like the Decimal path.
+        Args:
+            int_arr (np.ndarray): Integer parts.
+            dec_arr (np.ndarray): Decimal parts.
+            sign_arr (np.ndarray): Sign parts (1 for +, 0 for -, 2 for NaN).
+        Returns:
+            np.ndarray: The reconstructed float64 values.
+        """
+        denom = 10 ** self.decimal_places
+        total = int_arr.astype(np.float64) * float(denom) + dec_arr.astype(np.float64)
+        values = total / float(denom)
+
+        # Beyond 2**53 (or 10**22 for the denominator) floats are no longer exact
+        inexact = total > 0 if denom > 10 ** 22 else total >= 2.0 ** 53
+        if inexact.any():
+            for i in np.flatnonzero(inexact):
+                value = Decimal(int(int_arr[i])) + Decimal(int(dec_arr[i])) / (Decimal(10) ** self.decimal_places)
+                values[i] = float(value)
+
+        values[sign_arr == 0] *= -1
+        values[sign_arr == 2] = np.nan
+        return values
 
     def _create_vector(self, vector_type):
         """
-        Create the integer and decimal vectors with the specified type.
+        Create the vectors of the representation with the specified type.
+        """
+        self._release_parts()
+        self._clear_block_cache()
+        for name in self._part_names():
+            setattr(self, name, vector_type(size=self.n_elements, default_value=0))
+        if "nan_positions" in self._auxiliary_names():
+            self.nan_positions = sdsl4py.int_vector_64(size=0, default_value=0)
+        if "checkpoints" in self._auxiliary_names():
+            n_checkpoints = -(-self.n_elements // self.checkpoint_interval)
+            self.checkpoints = sdsl4py.int_vector_64(size=n_checkpoints, default_value=0)
+        if self.summary_block_size is not None:
+            n_blocks = -(-self.n_elements // self.summary_block_size)
+            self.zone_map = {
+                "min": np.full(n_blocks, np.nan),
+                "max": np.full(n_blocks, np.nan),
+                "sum": np.zeros(n_blocks),
+                "nan_count": np.zeros(n_blocks, dtype=np.int64),
+            }
+            # Blocks whose summary no longer matches the stored values
+            self._zone_map_stale = np.ones(n_blocks, dtype=bool)
+
+    def _uses_block_cache(self):
+        """
+        Return whether reads go through the decoded-block cache: it is enabled and a part is compressed.
+        """
+        if self.block_cache is None:
+            return False
+        for part in self._parts():
+            try:
+                memoryview(part)
+            except TypeError:
+                return True
+        return False
+
+    def _cached_block(self, block):
+        """
+        Return the decoded stored values of a block of CACHE_BLOCK_SIZE values.
+        A block is decoded whole and cached on its second lookup only, so scattered
+        reads that never come back to a block just decode the values they need.
+        Args:
+            block (int): Block number.
+        Returns:
+            np.ndarray: The float64 values of the block, or None on its first lookup.
         """
-        self.integer_part = vector_type(size=self.n_elements, default_value=0)
-        self.decimal_part = vector_type(size=self.n_elements, default_value=0)
-        self.sign_part = vector_type(size=self.n_elements, default_value=0)
+        values = self.block_cache.get(block)
+        if values is not None:
+            return values
+        if block not in self._seen_blocks:
+            self._seen_blocks[block] = None
+            # Remember about as many blocks as the cache can hold
+            if len(self._seen_blocks) > max(1, self.block_cache.max_bytes // (CACHE_BLOCK_SIZE * 8)):
+                self._seen_blocks.popitem(last=False)
+            return None
+        del self._seen_blocks[block]
+        start = block * CACHE_BLOCK_SIZE
+        values = self._decode_stored(range(start, min(start + CACHE_BLOCK_SIZE, self.n_elements)))
+        self.block_cache.put(block, values, values.nbytes)
+        return values
+
+    def _clear_block_cache(self):
+        """
+        Drop the cached blocks, after the stored values changed.
+        """
+        if self.block_cache is not None:
+            self.block_cache.clear()
+        self._seen_blocks.clear()
+
+    def block_cache_stats(self):
+        """
+        Return the usage statistics of the decoded-block cache.
+        Returns:
+            dict: "hits", "misses", "hit_rate", "evictions", "entries", "size_in_bytes"
+                and "max_bytes", or None if the cache is disabled.
+        """
+        return self.block_cache.stats() if self.block_cache is not None else None
 
     def _reconstruct_float_value(self, index):
         """
-        Reconstructs the original float value at the given index by combining
+        Reconstruct the value at the given index, with the pending affine transform applied.
+        Args:
+            index (int): Index of the value to reconstruct
+        Returns:
+            float: Reconstructed value
+        """
+        value = self._reconstruct_stored_value(index)
+        if not self.has_transform():
+            return value
+        return value * self.scale + self.offset
+
+    def _reconstruct_stored_value(self, index):
+        """
+        Reconstructs the stored float value at the given index by combining
         integer part, decimal part and sign.
 
         Args:
@@ -255,11 +1471,23 @@ class CompressedVector:
         Returns:
             float: Reconstructed value with correct sign
         """
-        from decimal import Decimal
-        
+        if self._uses_block_cache():
+            values = self._cached_block(index // CACHE_BLOCK_SIZE)
+            if values is not None:
+                return float(values[index % CACHE_BLOCK_SIZE])
+
+        if self.representation in DELTA_REPRESENTATIONS:
+            return float(self._take_delta(range(index, index + 1))[0])
+
+        if self.representation == "packed":
+            if index in self._nan_positions_array():
+                return float('nan')
+            value = int(self._zigzag_decode([self.packed_part[index]])[0])
+            return float(Decimal(value) / (Decimal(10) ** self.decimal_places))
+
         if self.sign_part[index] == 2:
             return float('nan')
-            
+
         int_part = Decimal(self.integer_part[index])
         dec_part = Decimal(self.decimal_part[index]) / (Decimal(10) ** self.decimal_places)
         value = int_part + dec_part
@@ -275,20 +1503,19 @@ class CompressedVector:
 
     def create_vector(self, size):
         """
-        Create the integer and decimal vectors.
+        Create the vectors of the representation.
         """
         self.n_elements = size
-        if self.int_width == 8:
-            self._create_vector(sdsl4py.int_vector_8)
-        elif self.int_width == 16:
-            self._create_vector(sdsl4py.int_vector_16)
-        elif self.int_width == 32:
-            self._create_vector(sdsl4py.int_vector_32)
-        elif self.int_width == 64:
-            self._create_vector(sdsl4py.int_vector_64)
+        self.scale, self.offset = 1.0, 0.0
+        if self.int_width == "auto":
+            # Parts start at the smallest width and grow with the data
+            self._create_vector(FIXED_WIDTH_VECTORS[8])
+        elif self.int_width in FIXED_WIDTH_VECTORS:
+            self._create_vector(FIXED_WIDTH_VECTORS[self.int_width])
         else:
-            print(f"Unsupported int_width: {self.int_width}, defaulting to 64")
-            self._create_vector(sdsl4py.int_vector_64)
+            self._create_vector(
+                lambda size, default_value: sdsl4py.int_vector(size, default_value, int_width=self.int_width)
+            )
 
     
     def fill_from_vector(self, original_vector, start=0, end=None):
@@ -299,9 +1526,8 @@ class CompressedVector:
             start (int): The start index in the original vector (inclusive).
             end (int): The end index in the original vector (exclusive). If None, use the length of the vector.
         """
-        if self.integer_part is None or self.decimal_part is None or self.sign_part is None:
-            raise ValueError("Vectors not created. Call create_vector() first.")
-        
+        self._parts()
+
         # Handle default end value and validate indices
         if end is None:
             end = len(original_vector)
@@ -310,15 +1536,19 @@ class CompressedVector:
         
         # Ensure start is valid
         start = max(0, start)
-        
-        for i in range(start, end):
-            self.current += 1
-            self._insert_value(self.current - 1, original_vector[i])
-                
-        self.n_elements = (end - start)
+
+        if isinstance(original_vector, CompressedVector):
+            values = original_vector._take(range(start, max(start, end)))
+        else:
+            values = np.asarray(original_vector[start:end], dtype=np.float64)
+
+        self._insert_values(self.current, values)
+
+        self.n_elements = max(0, end - start)
         self.current = 0
+        self._refresh_zone_map()
 
-    def build_from_file(self, file_path, column=1, delimiter=";", truncate=None):
+    def build_from_file(self, file_path, column=1, delimiter=";", truncate=None, affine_tolerance=None):
         """
         Build the compressed vector from a specific column in a csv file.
         Args:
@@ -326,6 +1556,10 @@ class CompressedVector:
             column (int): The column index (0-based) to extract the vector from.
             delimiter (str): The delimiter used in the csv file.
             truncate (int): The maximum number of rows to process. If None, process all rows.
+            affine_tolerance (float): If given and the column is regularly spaced within
+                this tolerance, an AffineAxis is returned instead and this vector is left empty.
+        Returns:
+            CompressedVector or AffineAxis: This vector, or the detected AffineAxis.
         """
         values = []
         with open(file_path, 'r') as file:
@@ -342,54 +1576,384 @@ class CompressedVector:
                 if truncate is not None and len(values) >= truncate:
                     break
         
+        if affine_tolerance is not None:
+            from ..affine_axis import AffineAxis
+
+            axis = AffineAxis.from_values(values, affine_tolerance, decimal_places=self.decimal_places)
+            if axis is not None:
+                axis.set_decompressed_config(self.get_decompressed)
+                return axis
+
         # Create and fill the vector
         self.create_vector(len(values))
-        for i, value in enumerate(values):
-            self._insert_value(i, value)
-            
+        self._insert_values(0, np.asarray(values, dtype=np.float64))
+
         self.n_elements = len(values)
+        return self
     
-    def size_in_bytes(self):
+    def size_in_bytes(self, per_part=False):
         """
         Return the size in bytes of the compressed vector.
+        Args:
+            per_part (bool): Return the size of each stored part instead of the total.
         Returns:
-            int: Total size in bytes of the compressed vector.
+            int or dict: Total size in bytes of the compressed vector, or the size
+                of each part by attribute name if per_part is True.
         Raises:
             ValueError: If the vector components are not initialized.
         """
-        if self.integer_part is None or self.decimal_part is None or self.sign_part is None:
+        parts = [getattr(self, name, None) for name in self._part_names()]
+        if any(part is None for part in parts):
             raise ValueError("You called size_in_bytes without creating the vectors or after destroying them. Call create_vector() first.")
-            
-        total = (
-                # sdsl4py vectors
-                sdsl4py.size_in_bytes(self.integer_part) 
-                + sdsl4py.size_in_bytes(self.decimal_part)
-                + sdsl4py.size_in_bytes(self.sign_part)
-                )
-        return total
+
+        # sdsl4py vectors
+        sizes = {name: self._part_size_in_bytes(part) for name, part in zip(self._part_names(), parts)}
+        for name in self._auxiliary_names():
+            sizes[name] = self._part_size_in_bytes(getattr(self, name))
+        if self.zone_map is not None:
+            sizes["zone_map"] = sum(summary.nbytes for summary in self.zone_map.values())
+        if per_part:
+            return sizes
+        return sum(sizes.values())
+
+    @staticmethod
+    def _part_size_in_bytes(part):
+        """
+        Return the size in bytes of a stored part, whether an sdsl vector or a codec
+        of this package that reports its own size.
+        """
+        if hasattr(part, "size_in_bytes"):
+            return part.size_in_bytes()
+        return sdsl4py.size_in_bytes(part)
+
+    def compression_ratio(self):
+        """
+        Return how many times smaller the vector is than the same values as a float64 array.
+        Returns:
+            float: n_elements * 8 / size_in_bytes().
+        """
+        return (self.n_elements * np.dtype(np.float64).itemsize) / self.size_in_bytes()
+
+    def summary(self, start=0, end=None):
+        """
+        Return the min, max, sum, count and NaN count of a range of the vector.
+        Full blocks are read from the zone map, only the partial blocks at the
+        edges of the range are decoded.
+        Args:
+            start (int): First index of the range.
+            end (int): End index (exclusive). If None, until the end.
+        Returns:
+            dict: "min", "max" and "sum" of the non NaN values, "count" of non NaN
+                values and "nan_count". min and max are NaN if there are no values.
+        """
+        start, end, _ = slice(start, end).indices(self.n_elements)
+        end = max(start, end)
+        edges = [(start, end)]
+        summaries = []
+        if self.zone_map is not None:
+            self._refresh_zone_map()
+            first_block = -(-start // self.summary_block_size)
+            last_block = end // self.summary_block_size
+            if first_block < last_block:
+                edges = [(start, first_block * self.summary_block_size), (last_block * self.summary_block_size, end)]
+                summaries.append({key: values[first_block:last_block] for key, values in self.zone_map.items()})
+
+        summaries += [
+            self._summarize_blocks(self._take_stored(range(edge_start, edge_end)), edge_end - edge_start)
+            for edge_start, edge_end in edges if edge_end > edge_start
+        ]
+        if not summaries:
+            return {"min": float("nan"), "max": float("nan"), "sum": 0.0, "count": 0, "nan_count": 0}
+
+        combined = {key: np.concatenate([summary[key] for summary in summaries]) for key in summaries[0]}
+        nan_count = int(combined["nan_count"].sum())
+        count = (end - start) - nan_count
+        # The zone map summarizes the stored values, the transform is monotonic
+        low, high = float(np.fmin.reduce(combined["min"])), float(np.fmax.reduce(combined["max"]))
+        if self.scale < 0:
+            low, high = high, low
+        return {
+            "min": low * self.scale + self.offset,
+            "max": high * self.scale + self.offset,
+            "sum": float(combined["sum"].sum()) * self.scale + self.offset * count,
+            "count": count,
+            "nan_count": nan_count,
+        }
+
+    def min(self, start=0, end=None):
+        """
+        Return the smallest non NaN value of a range, see summary().
+        """
+        return self.summary(start, end)["min"]
+
+    def max(self, start=0, end=None):
+        """
+        Return the largest non NaN value of a range, see summary().
+        """
+        return self.summary(start, end)["max"]
+
+    def sum(self, start=0, end=None):
+        """
+        Return the sum of the non NaN values of a range, see summary().
+        """
+        return self.summary(start, end)["sum"]
+
+    def mean(self, start=0, end=None):
+        """
+        Return the mean of the non NaN values of a range, NaN if there are none. See summary().
+        """
+        summary = self.summary(start, end)
+        return summary["sum"] / summary["count"] if summary["count"] else float("nan")
+
+    def envelope(self, n_bins, start=0, end=None):
+        """
+        Return the min/max envelope of a range split into n_bins bins of equal length,
+        as drawn by a line chart n_bins pixels wide.
+        Args:
+            n_bins (int): Number of bins.
+            start (int): First index of the range.
+            end (int): End index (exclusive). If None, until the end.
+        Returns:
+            tuple: Two float64 arrays with the min and max of each bin.
+        """
+        if not isinstance(n_bins, int) or n_bins <= 0:
+            raise ValueError("n_bins must be a positive integer.")
+        start, end, _ = slice(start, end).indices(self.n_elements)
+        edges = np.linspace(start, max(start, end), n_bins + 1).astype(np.int64)
+        summaries = [self.summary(int(bin_start), int(bin_end)) for bin_start, bin_end in zip(edges[:-1], edges[1:])]
+        return (
+            np.array([summary["min"] for summary in summaries], dtype=np.float64),
+            np.array([summary["max"] for summary in summaries], dtype=np.float64),
+        )
+
+    def _mark_zone_map(self, start, end):
+        """
+        Mark the zone map blocks overlapping [start, end) as stale.
+        """
+        if self.zone_map is None or end <= start:
+            return
+        self._zone_map_stale[start // self.summary_block_size:(end - 1) // self.summary_block_size + 1] = True
+
+    def _refresh_zone_map(self):
+        """
+        Recompute the summaries of the stale zone map blocks, decoding each run
+        of consecutive stale blocks at once.
+        """
+        if self.zone_map is None:
+            return
+        n_blocks = -(-self.n_elements // self.summary_block_size)
+        stale = np.flatnonzero(self._zone_map_stale[:n_blocks])
+        if len(stale) == 0:
+            return
+        breaks = np.diff(stale) > 1
+        run_starts = stale[np.concatenate([[True], breaks])]
+        run_ends = stale[np.concatenate([breaks, [True]])] + 1
+        for first_block, last_block in zip(run_starts, run_ends):
+            start = int(first_block) * self.summary_block_size
+            end = min(int(last_block) * self.summary_block_size, self.n_elements)
+            summaries = self._summarize_blocks(self._take_stored(range(start, end)), self.summary_block_size)
+            for key, values in summaries.items():
+                self.zone_map[key][first_block:last_block] = values
+        self._zone_map_stale[:n_blocks] = False
+
+    @staticmethod
+    def _summarize_blocks(values, block_size):
+        """
+        Summarize consecutive blocks of block_size values.
+        Args:
+            values (np.ndarray): The decoded float64 values, at least one.
+            block_size (int): Number of values per block.
+        Returns:
+            dict: "min", "max", "sum" and "nan_count" arrays with one entry per block.
+        """
+        offsets = np.arange(0, len(values), block_size)
+        nan_mask = np.isnan(values)
+        return {
+            "min": np.fmin.reduceat(values, offsets),
+            "max": np.fmax.reduceat(values, offsets),
+            "sum": np.add.reduceat(np.where(nan_mask, 0.0, values), offsets),
+            "nan_count": np.add.reduceat(nan_mask.astype(np.int64), offsets),
+        }
+
+    @classmethod
+    def compare_representations(cls, values, decimal_places=0, int_width=64, compress_method=None):
+        """
+        Build the values in every representation and report their sizes.
+        Args:
+            values (array-like): The values to encode.
+            decimal_places (int): Number of decimal places to keep.
+            int_width (int): Width of the vectors in bits.
+            compress_method (str or function): Compression method to apply, None for no compression.
+        Returns:
+            dict: For each representation, its "size_in_bytes" and "compression_ratio".
+        """
+        values = np.asarray(values, dtype=np.float64)
+        report = {}
+        for representation in REPRESENTATIONS:
+            vector = cls(decimal_places=decimal_places, int_width=int_width, representation=representation)
+            vector.create_vector(len(values))
+            vector.fill_from_vector(values)
+            if vector.select_compression_method(compress_method) is not None:
+                vector.compress(compress_method)
+            report[representation] = {
+                "size_in_bytes": vector.size_in_bytes(),
+                "compression_ratio": vector.compression_ratio(),
+            }
+            vector.destroy()
+        return report
     
-    def compress(self, vector_type=sdsl4py.enc_vector_elias_gamma):
-        compress_part = self.select_compression_method(vector_type)
+    def compress(self, vector_type=sdsl4py.enc_vector_elias_gamma, objective="size", sample_size=DEFAULT_SAMPLE_SIZE):
+        """
+        Compress the parts of the vector.
+        Args:
+            vector_type (str, function or dict): A compression method name or function from
+                COMPRESSION_METHODS, or "auto" to pick the best method for each part
+                by trial compressing a sample of its values. A dict maps parts
+                ("integer", "decimal", "sign", or "packed") to their own method or "auto";
+                parts left out are kept as they are, compressed by an earlier call or not.
+            objective (str): With "auto", what the best method is, one of
+                COMPRESSION_OBJECTIVES: the smallest, the fastest to decode, or a balance of both.
+            sample_size (int): With "auto", number of values of each part the methods are tried on.
+        """
+        if isinstance(vector_type, dict):
+            methods = {}
+            for part, method in vector_type.items():
+                name = part if part.endswith("_part") else f"{part}_part"
+                if name not in self._part_names():
+                    raise ValueError(
+                        f"Unknown part: '{part}'. "
+                        f"Available: {', '.join(name[:-len('_part')] for name in self._part_names())}"
+                    )
+                methods[name] = method
+        else:
+            methods = {name: vector_type for name in self._part_names()}
+
+        if objective not in COMPRESSION_OBJECTIVES:
+            raise ValueError(
+                f"Unknown objective: '{objective}'. "
+                f"Available: {', '.join(COMPRESSION_OBJECTIVES)}"
+            )
+
+        methods = {
+            name: method if isinstance(method, str) and method == "auto" else self.select_compression_method(method)
+            for name, method in methods.items()
+        }
+        for name, method in methods.items():
+            if method is not None and self._part_width(getattr(self, name)) is None:
+                raise ValueError(f"{name} is already compressed.")
+
+        # Summaries are built from the uncompressed parts, which are cheaper to decode
+        self._refresh_zone_map()
+
+        # Parts left out of a dict keep the method an earlier call recorded
+        self.compression_methods = dict(getattr(self, "compression_methods", {}))
+        self.compression_report = dict(getattr(self, "compression_report", {}))
+        for name, method in methods.items():
+            if isinstance(method, str) and method == "auto":
+                method = self._select_part_compression(name, objective, sample_size)
+            compress_part = self.select_compression_method(method)
+            if compress_part is not None:
+                setattr(self, name, compress_part(getattr(self, name)))
+            self.compression_methods[name] = self._compression_method_name(compress_part)
+        for name in self._part_names():
+            self.compression_methods.setdefault(name, self._compression_method_name(None))
+        self._clear_block_cache()
+
+    @staticmethod
+    def _compression_method_name(method):
+        """
+        Return the COMPRESSION_METHODS name of a compression function.
+        """
+        for name, function in COMPRESSION_METHODS.items():
+            if function is method:
+                return name
+        return getattr(method, "__name__", str(method))
+
+    def _select_part_compression(self, name, objective, sample_size):
+        """
+        Trial compress a sample of a part with every method in COMPRESSION_METHODS
+        and pick the best one. The measurements are kept in compression_report.
+        Args:
+            name (str): Attribute name of the part.
+            objective (str): One of COMPRESSION_OBJECTIVES.
+            sample_size (int): Number of values of the part to try the methods on.
+        Returns:
+            str: The name of the selected method.
+        """
+        part = getattr(self, name)
+        width = self._part_width(part)
+        if width is None:
+            raise ValueError(f"{name} is already compressed.")
+        sample = self._sample_part(part, sample_size)
+        sample_vector = FIXED_WIDTH_VECTORS[64](size=len(sample), default_value=0)
+        self._write_part(sample_vector, 0, sample)
+        uncompressed_bytes = max(1, (len(sample) * width + 7) // 8)
 
-        self.integer_part = compress_part(self.integer_part)
-        self.decimal_part = compress_part(self.decimal_part)
-        self.sign_part = compress_part(self.sign_part)
+        trials = {}
+        for method_name, method in COMPRESSION_METHODS.items():
+            try:
+                candidate = sample_vector if method is None else method(sample_vector)
+            except Exception:
+                # Not every codec accepts every input
+                continue
+            size = uncompressed_bytes if method is None else self._part_size_in_bytes(candidate)
+            start = time.perf_counter()
+            self._read_part(candidate, 0, len(sample))
+            trials[method_name] = {
+                "size_in_bytes": size,
+                "decode_seconds": time.perf_counter() - start,
+                "ratio": uncompressed_bytes / max(1, size),
+            }
+
+        best_size = min(trial["size_in_bytes"] for trial in trials.values())
+        best_time = max(min(trial["decode_seconds"] for trial in trials.values()), 1e-9)
+        if objective == "size":
+            score = lambda trial: (trial["size_in_bytes"], trial["decode_seconds"])
+        elif objective == "decode_speed":
+            score = lambda trial: (trial["decode_seconds"], trial["size_in_bytes"])
+        else:
+            score = lambda trial: (
+                (trial["size_in_bytes"] / max(1, best_size)) * (max(trial["decode_seconds"], 1e-9) / best_time)
+            )
+        best = min(trials, key=lambda method_name: score(trials[method_name]))
+        self.compression_report[name] = {
+            "method": best,
+            "ratio": trials[best]["ratio"],
+            "objective": objective,
+            "sample_size": len(sample),
+            "trials": trials,
+        }
+        return best
 
+    def _sample_part(self, part, sample_size):
+        """
+        Read a sample of a part made of a few contiguous blocks spread over the vector,
+        so codecs working on runs of consecutive values are measured realistically.
+        Args:
+            part: The sdsl vector to sample.
+            sample_size (int): Maximum number of values in the sample.
+        Returns:
+            np.ndarray: The sampled encoded values as uint64.
+        """
+        n = len(part)
+        if n <= sample_size:
+            return self._read_part(part, 0, n)
+        n_blocks = SAMPLE_BLOCKS
+        block_size = max(1, sample_size // n_blocks)
+        starts = np.linspace(0, n - block_size, n_blocks).astype(np.int64)
+        return np.concatenate([self._read_part(part, int(start), int(start) + block_size) for start in starts])
 
 
     def destroy(self):
         """
         Destroy the compressed vector and free memory.
         """
-        if self.integer_part is not None:
-            del self.integer_part
-            self.integer_part = None
-        if self.decimal_part is not None:
-            del self.decimal_part
-            self.decimal_part = None
-        if self.sign_part is not None:
-            del self.sign_part
-            self.sign_part = None
+        self._release_parts()
+        self._clear_block_cache()
+        for name in self._part_names() + self._auxiliary_names():
+            setattr(self, name, None)
+        self.zone_map = None
+        self.scale, self.offset = 1.0, 0.0
         
         # Reset attributes
         self.n_elements = 0
@@ -0,0 +1,287 @@
+import itertools
+import operator
+import numpy as np
+from ..common.available_methods import DEFAULT_CHUNK_SIZE, DELTA_REPRESENTATIONS
+from ..common.indexing import normalize_indices
+
+class CompressedVectorExpression:
+    # Makes numpy defer array + expression to __radd__ instead of converting the expression
+    __array_priority__ = 1000
+
+    def __init__(self, op, operands):
+        """
+        Lazy arithmetic expression over compressed vectors, arrays and scalars.
+        Nothing is decoded when the expression is built. When it is consumed (to_numpy,
+        iteration, iter_chunks or compute), every operand is decoded one chunk at a time
+        and the whole tree is evaluated on that chunk, so peak memory is one chunk per
+        operand instead of one full vector per intermediate result.
+        Args:
+            op (function): Operator applied to the operands, e.g. operator.add.
+            operands (tuple): Scalars, lists, numpy arrays, CompressedVector, views,
+                BlockCompressedVector or expressions. Vectors must all have the same length.
+        """
+        self.op = op
+        self.operands = tuple(self._normalize_operand(operand) for operand in operands)
+
+        lengths = {len(operand) for operand in self.operands if not self._is_scalar(operand)}
+        if len(lengths) > 1:
+            raise ValueError("Length mismatch in operation.")
+        self.n_elements = lengths.pop() if lengths else 1
+
+    @staticmethod
+    def _is_scalar(value):
+        return isinstance(value, (int, float, np.number))
+
+    @staticmethod
+    def _has_zero(operand, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Return whether a scalar or vector operand holds a zero, decoding vectors chunk by chunk.
+        """
+        if isinstance(operand, (int, float, np.number)):
+            return operand == 0
+        if isinstance(operand, np.ndarray):
+            return bool(np.any(operand == 0))
+        return any(np.any(chunk == 0) for chunk in operand.iter_chunks(chunk_size))
+
+    def _check_divisors(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Raise ZeroDivisionError if a divisor anywhere in the tree holds a zero,
+        like in-place division does, since the infinite results cannot be encoded.
+        """
+        if self.op is operator.truediv and self._has_zero(self.operands[1], chunk_size):
+            raise ZeroDivisionError("division by zero")
+        for operand in self.operands:
+            if isinstance(operand, CompressedVectorExpression):
+                operand._check_divisors(chunk_size)
+
+    @classmethod
+    def _normalize_operand(cls, operand):
+        """
+        Check an operand, converting lists to float64 arrays.
+        """
+        if cls._is_scalar(operand) or hasattr(operand, "iter_chunks"):
+            return operand
+        if isinstance(operand, (list, np.ndarray)):
+            return np.asarray(operand, dtype=np.float64).reshape(-1)
+        raise TypeError(f"Unsupported type for operation: {type(operand)}")
+
+    @property
+    def dtype(self):
+        return np.dtype(float)
+
+    @property
+    def ndim(self):
+        return 1
+
+    @property
+    def shape(self):
+        return (self.n_elements,)
+
+    @property
+    def size(self):
+        return self.n_elements
+
+    def __len__(self):
+        """
+        Return the number of elements of the expression.
+        """
+        return self.n_elements
+
+    def __iter__(self):
+        """
+        Iterate over the values of the expression, evaluated chunk by chunk.
+        Returns:
+            generator: The values as python floats.
+        """
+        for chunk in self.iter_chunks():
+            yield from chunk.tolist()
+
+    def iter_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE, start=0, end=None):
+        """
+        Evaluate the expression in numpy blocks, in a single pass over every operand.
+        Args:
+            chunk_size (int): Number of values per block. (default: 65536)
+            start (int): First index to evaluate.
+            end (int): End index (exclusive). If None, evaluate until the end.
+        Returns:
+            generator: float64 numpy arrays of at most chunk_size values.
+        """
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer.")
+        start, end, _ = slice(start, end).indices(self.n_elements)
+        operand_chunks = [self._operand_chunks(operand, chunk_size, start, end) for operand in self.operands]
+        for _, chunks in zip(range(start, end, chunk_size), zip(*operand_chunks)):
+            yield self._evaluate(chunks)
+
+    @staticmethod
+    def _operand_chunks(operand, chunk_size, start, end):
+        """
+        Return a generator of the chunks of an operand over [start, end).
+        """
+        if CompressedVectorExpression._is_scalar(operand):
+            return itertools.repeat(operand)
+        if isinstance(operand, np.ndarray):
+            return (operand[chunk_start:chunk_start + chunk_size] for chunk_start in range(start, end, chunk_size))
+        return operand.iter_chunks(chunk_size, start, end)
+
+    def _evaluate(self, chunks):
+        """
+        Apply the operator to one chunk of every operand.
+        """
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            return np.asarray(self.op(*chunks), dtype=np.float64)
+
+    def _take(self, indices):
+        """
+        Evaluate the expression at the given indices only.
+        Args:
+            indices (range or np.ndarray): Non-negative indices to evaluate.
+        Returns:
+            np.ndarray: The float64 values.
+        """
+        chunks = []
+        for operand in self.operands:
+            if self._is_scalar(operand):
+                chunks.append(operand)
+            elif isinstance(operand, np.ndarray):
+                chunks.append(operand[indices])
+            else:
+                chunks.append(operand._take(indices))
+        return self._evaluate(chunks)
+
+    def __getitem__(self, index):
+        """
+        Evaluate the expression at an index, a slice or a sequence of indices.
+        Args:
+            index (int, slice, list, np.ndarray, tuple): The positions to evaluate.
+        Returns:
+            float for an int index, otherwise a float64 numpy array.
+        """
+        if isinstance(index, (int, np.integer)):
+            index = int(index)
+            if index < 0:
+                index += self.n_elements
+            if index < 0 or index >= self.n_elements:
+                raise IndexError("Index out of bounds")
+            return float(self._take(np.array([index]))[0])
+        if isinstance(index, slice):
+            return self._take(range(*index.indices(self.n_elements)))
+        if isinstance(index, (list, np.ndarray, tuple)):
+            selected = normalize_indices(index, self.n_elements)
+            return self._take(selected)
+        raise TypeError(f"Invalid index type: {type(index)}. Expected int, slice, list or ndarray.")
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Support for the numpy array protocol, so np.asarray(expression) evaluates it.
+        Args:
+            dtype (np.dtype): Optional target dtype.
+            copy (bool): Ignored, a new array is always returned.
+        Returns:
+            np.ndarray: The values of the expression.
+        """
+        return self.to_numpy(dtype=dtype)
+
+    def to_numpy(self, dtype=np.float64):
+        """
+        Evaluate the whole expression into a numpy array, chunk by chunk.
+        Args:
+            dtype (np.dtype): The dtype of the returned array. (default: float64)
+        Returns:
+            np.ndarray: The values of the expression.
+        """
+        values = np.empty(self.n_elements, dtype=np.float64)
+        for chunk_start, chunk in zip(range(0, self.n_elements, DEFAULT_CHUNK_SIZE), self.iter_chunks()):
+            values[chunk_start:chunk_start + len(chunk)] = chunk
+        if dtype is not None and np.dtype(dtype) != values.dtype:
+            values = values.astype(dtype)
+        return values
+
+    def _template(self):
+        """
+        Return the first CompressedVector operand of the tree (or parent of a view), None if there is none.
+        """
+        for operand in self.operands:
+            if isinstance(operand, CompressedVectorExpression):
+                template = operand._template()
+                if template is not None:
+                    return template
+            elif hasattr(operand, "_insert_values"):
+                return operand
+            elif hasattr(getattr(operand, "parent", None), "_insert_values"):
+                return operand.parent
+        return None
+
+    def compute(self, compress=None, chunk_size=DEFAULT_CHUNK_SIZE, **config):
+        """
+        Evaluate the expression into a new CompressedVector in one chunked pass.
+        Infinite results cannot be encoded, so a divisor holding a zero raises ZeroDivisionError.
+        Args:
+            compress (str, function or dict): Optional compression method of the result, see
+                CompressedVector.compress().
+            chunk_size (int): Number of values evaluated at once. (default: 65536)
+            **config: CompressedVector arguments (decimal_places, int_width, representation...)
+                of the result, overriding those of the first CompressedVector operand.
+        Returns:
+            CompressedVector: The result.
+        """
+        template = self._template()
+        if template is None:
+            raise ValueError("compute() needs a CompressedVector operand to take its configuration from.")
+        self._check_divisors(chunk_size)
+        new = template._new_like()
+        if config:
+            params = {
+                "decimal_places": new.decimal_places,
+                "int_width": new.int_width,
+                "get_decompressed": new.get_decompressed,
+                "representation": new.representation,
+                "checkpoint_interval": new.checkpoint_interval,
+                "summary_block_size": new.summary_block_size,
+            }
+            new = type(new)(**{**params, **config})
+
+        # Delta chunks start at checkpoints, so no block is encoded twice
+        if new.representation in DELTA_REPRESENTATIONS:
+            chunk_size = max(1, chunk_size // new.checkpoint_interval) * new.checkpoint_interval
+
+        new.create_vector(self.n_elements)
+        for chunk_start, chunk in zip(range(0, self.n_elements, chunk_size), self.iter_chunks(chunk_size)):
+            new._insert_values(chunk_start, chunk)
+        new._refresh_zone_map()
+        if compress is not None:
+            new.compress(compress)
+        return new
+
+    def __add__(self, other):
+        return CompressedVectorExpression(operator.add, (self, other))
+
+    def __radd__(self, other):
+        return CompressedVectorExpression(operator.add, (other, self))
+
+    def __sub__(self, other):
+        return CompressedVectorExpression(operator.sub, (self, other))
+
+    def __rsub__(self, other):
+        return CompressedVectorExpression(operator.sub, (other, self))
+
+    def __mul__(self, other):
+        return CompressedVectorExpression(operator.mul, (self, other))
+
+    def __rmul__(self, other):
+        return CompressedVectorExpression(operator.mul, (other, self))
+
+    def __truediv__(self, other):
+        return CompressedVectorExpression(operator.truediv, (self, other))
+
+    def __rtruediv__(self, other):
+        return CompressedVectorExpression(operator.truediv, (other, self))
+
+    def __pow__(self, other):
+        return CompressedVectorExpression(operator.pow, (self, other))
+
+    def __rpow__(self, other):
+        return CompressedVectorExpression(operator.pow, (other, self))
+
+    def __neg__(self):
+        return CompressedVectorExpression(operator.neg, (self,))
@@ -0,0 +1,164 @@
+import numpy as np
+from ..common.available_methods import DEFAULT_CHUNK_SIZE
+from ..common.indexing import normalize_indices
+
+class CompressedVectorView:
+    def __init__(self, parent, indices):
+        """
+        Lazy view over a subset of a CompressedVector.
+        Nothing is decoded or copied until the values are accessed.
+        Args:
+            parent (CompressedVector): The vector holding the data.
+            indices (range or np.ndarray): Non-negative indices into the parent.
+        """
+        self.parent = parent
+        self.indices = indices
+
+    @property
+    def dtype(self):
+        return np.dtype(float)
+
+    @property
+    def ndim(self):
+        return 1
+
+    @property
+    def shape(self):
+        return (len(self.indices),)
+
+    @property
+    def size(self):
+        return len(self.indices)
+
+    @property
+    def get_decompressed(self):
+        return self.parent.get_decompressed
+
+    @property
+    def decimal_places(self):
+        return self.parent.decimal_places
+
+    @property
+    def int_width(self):
+        return self.parent.int_width
+
+    def __len__(self):
+        """
+        Return the number of elements in the view.
+        """
+        return len(self.indices)
+
+    def __iter__(self):
+        """
+        Iterate over the decompressed values of the view.
+        Returns:
+            generator: The values of the view as python floats.
+        """
+        for chunk in self.iter_chunks():
+            yield from chunk.tolist()
+
+    def __getitem__(self, index):
+        """
+        Get the value at the given index or a sub view.
+        Args:
+            index (int, slice, list, np.ndarray, tuple): The index or slice to retrieve values from.
+        Returns:
+            float for an int index, otherwise a numpy array if the parent has
+            get_decompressed set, or a new CompressedVectorView.
+        """
+        if isinstance(index, (int, np.integer)):
+            index = int(index)
+            if index < 0:
+                index += len(self)
+            if index < 0 or index >= len(self):
+                raise IndexError("Index out of bounds")
+            return self.parent[int(self.indices[index])]
+
+        elif isinstance(index, (slice, list, np.ndarray, tuple)):
+            if isinstance(index, slice):
+                # ranges compose into ranges, index arrays into index arrays
+                selected = self.indices[index]
+            else:
+                positions = normalize_indices(index, len(self))
+                selected = self._index_array()[positions]
+
+            if self.get_decompressed:
+                return self.parent._take(selected)
+            return CompressedVectorView(self.parent, selected)
+
+        else:
+            raise TypeError(f"Invalid index type: {type(index)}. Expected int, slice, list or ndarray.")
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Support for the numpy array protocol.
+        Args:
+            dtype (np.dtype): Optional target dtype.
+            copy (bool): Ignored, a new array is always returned.
+        Returns:
+            np.ndarray: The decompressed values.
+        """
+        return self.to_numpy(dtype=dtype)
+
+    def to_numpy(self, dtype=np.float64):
+        """
+        Decompress the values of the view into a numpy array.
+        Args:
+            dtype (np.dtype): The dtype of the returned array. (default: float64)
+        Returns:
+            np.ndarray: The decompressed values.
+        """
+        values = self.parent._take(self.indices)
+        if dtype is not None and np.dtype(dtype) != values.dtype:
+            values = values.astype(dtype)
+        return values
+
+    def iter_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE, start=0, end=None):
+        """
+        Iterate over the decompressed values of the view in numpy blocks.
+        Args:
+            chunk_size (int): Number of values per block. (default: 65536)
+            start (int): First position in the view to decode.
+            end (int): End position (exclusive). If None, decode until the end.
+        Returns:
+            generator: float64 numpy arrays of at most chunk_size values.
+        """
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer.")
+        indices = self.indices[slice(start, end)]
+        if isinstance(indices, range) and indices.step == 1:
+            yield from self.parent.iter_chunks(chunk_size, indices.start, indices.stop)
+            return
+        for chunk_start in range(0, len(indices), chunk_size):
+            yield self.parent._take(indices[chunk_start:chunk_start + chunk_size])
+
+    def _take(self, indices):
+        """
+        Decompress the values at the given positions of the view.
+        Args:
+            indices (range or np.ndarray): Non-negative positions in the view.
+        Returns:
+            np.ndarray: The decompressed float64 values.
+        """
+        if isinstance(self.indices, range) and isinstance(indices, range):
+            return self.parent._take(self.indices[indices.start:indices.stop:indices.step])
+        return self.parent._take(self._index_array()[np.asarray(indices, dtype=np.int64)])
+
+    def materialize(self):
+        """
+        Copy the values of the view into a new, independent CompressedVector.
+        Returns:
+            CompressedVector: A vector with the same configuration as the parent.
+        """
+        new_vector = self.parent._new_like()
+        new_vector.create_vector(len(self))
+        new_vector.fill_from_vector(self.to_numpy())
+        return new_vector
+
+    def _index_array(self):
+        """
+        Return the indices of the view as an int64 array.
+        """
+        if isinstance(self.indices, range):
+            return np.arange(self.indices.start, self.indices.stop, self.indices.step, dtype=np.int64)
+        return self.indices
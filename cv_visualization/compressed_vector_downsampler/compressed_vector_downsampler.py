@@ -1,15 +1,87 @@
 from ..compressed_vector import CompressedVector
+from ..affine_axis import AffineAxis
+from ..index_vector import IndexVector
 import sdsl4py
 
 import tsdownsample as tsd
 import numpy as np
 
-from ..common.available_methods import DOWNSAMPLERS, COMPRESSION_METHODS, list_available_downsamplers, list_available_compression_methods
+import copy
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from ..common.available_methods import DOWNSAMPLERS, COMPRESSION_METHODS, DEFAULT_CHUNK_SIZE, DOWNSAMPLE_ALIGNMENTS, EXECUTORS, list_available_downsamplers, list_available_compression_methods
+from ..common.binning import bin_extrema
+from ..common.search import searchsorted
+
+# Bins per output point the candidates of compressed inputs are taken from
+CANDIDATE_RATIO = 8
+
+# Keys of a batch job describing the file its x and y are read from
+FILE_JOB_KEYS = ("file_path", "column", "delimiter", "truncate")
+
+
+def _read_columns(file_path, column=1, delimiter=";", truncate=None):
+    """
+    Read x from the first column and y from another column of a csv file.
+    Lines without a numeric value in both columns are skipped.
+
+    :param file_path: The path to the file.
+    :param column: The column index (0-based) of y.
+    :param delimiter: The delimiter used in the csv file.
+    :param truncate: The maximum number of rows to read. If None, read all rows.
+    :return: x and y as float64 numpy arrays.
+    """
+    x, y = [], []
+    with open(file_path, 'r') as file:
+        for line in file:
+            line_values = line.strip().split(delimiter)
+            if len(line_values) > column:
+                try:
+                    x_value, y_value = float(line_values[0]), float(line_values[column])
+                except ValueError:
+                    continue
+                x.append(x_value)
+                y.append(y_value)
+            if truncate is not None and len(y) >= truncate:
+                break
+    return np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+
+
+def _run_batch_job(job):
+    """
+    Run one batch job. Module level so process pools can pickle it.
+
+    :param job: The downsample() arguments, plus the FILE_JOB_KEYS if x and y are read from a file.
+    :return: A dict with the downsample() result, the selected indices and the timings.
+    """
+    start = time.perf_counter()
+    params = {key: value for key, value in job.items() if key not in FILE_JOB_KEYS}
+    if "file_path" in job:
+        file_params = {key: job[key] for key in FILE_JOB_KEYS if key in job}
+        params["x"], params["y"] = _read_columns(**file_params)
+    read_seconds = time.perf_counter() - start
+
+    downsampler = CompressedVectorDownsampler()
+    result = downsampler.downsample(**params)
+    return {
+        "result": result,
+        "x_indices": downsampler.get_x_indices(),
+        "y_indices": downsampler.get_y_indices(),
+        "read_seconds": read_seconds,
+        "seconds": time.perf_counter() - start,
+    }
 
 class CompressedVectorDownsampler:
-    def __init__(self):
+    def __init__(self, cache=None):
+        """
+        :param cache: Optional DownsampleCache. downsample() results are then stored under a
+            fingerprint of the inputs and the parameters, and repeated calls return them
+            without downsampling or compressing again.
+        """
         self.x_indices = None
         self.y_indices = None
+        self.cache = cache
         return
 
     def downsample(
@@ -20,7 +92,10 @@ class CompressedVectorDownsampler:
         method="MinMaxLTTBDownsampler",
         int_width=64,
         decimal_places=4,
-        compress_method="vlc_vector_fibonacci"):
+        compress_method="vlc_vector_fibonacci",
+        affine_tolerance=None,
+        x_range=None,
+        cache_key=None):
         """
         Downsample a time series using the specified method and compress the result.
 
@@ -28,17 +103,62 @@ class CompressedVectorDownsampler:
         :param x: X-axis values (optional, used for irregularly spaced data).
         :param n_out: Target number of downsampled points.
         :param method: Downsampling method to use (name or instance).
-        :param int_width: Bit width of integers in compressed vector.
+        :param int_width: Bit width of integers in compressed vector, or "auto".
         :param decimal_places: Number of decimal places for float precision.
         :param compress_method: Compression method to apply (name or function).
-        :return: One or two CompressedVector instances depending on input.
+        :param affine_tolerance: If given, an x regularly spaced within this tolerance is
+            handled as an AffineAxis (x can also be passed as an AffineAxis directly).
+        :param x_range: Optional (x_min, x_max) visible range. The bounds are binary searched
+            in the sorted x and only the points inside are decoded and downsampled. If the
+            range holds n_out points or fewer, all of them are returned.
+        :param cache_key: With a cache, an explicit version key identifying x and y, used
+            instead of fingerprinting them. Pass one for data modified in place.
+        :return: One or two CompressedVector (or AffineAxis for x) instances depending on input.
         """
-        self._handle_exceptions(y, x, n_out, method, int_width, decimal_places, compress_method)
+        self._handle_exceptions(y, x, n_out, method, int_width, decimal_places, compress_method, x_range)
         downsampler_cls = self._select_downsampler(method)
+
+        if self.cache is not None:
+            key = (
+                cache_key if cache_key is not None
+                else (self.cache.fingerprint(x), self.cache.fingerprint(y)),
+                n_out,
+                downsampler_cls.__name__,
+                int_width,
+                decimal_places,
+                compress_method if isinstance(compress_method, str) or compress_method is None
+                else getattr(compress_method, "__name__", repr(compress_method)),
+                affine_tolerance,
+                tuple(x_range) if x_range is not None else None,
+            )
+            cached = self.cache.get(key)
+            if cached is not None:
+                output, self.x_indices, self.y_indices = cached
+                return self._copy_output(output)
+
         ds_instance = downsampler_cls()  # instantiate once
 
+        offset = 0
+        if x_range is not None:
+            x, y, offset = self._select_range(x, y, x_range)
+
+        x_axis = x if isinstance(x, AffineAxis) else None
+        if x_axis is None and x is not None and affine_tolerance is not None:
+            x_axis = AffineAxis.from_values(x, affine_tolerance, decimal_places=decimal_places)
+
         # Downsample based on inputs
-        if x is not None and y is not None and not isinstance(ds_instance, tsd.EveryNthDownsampler):
+        if x_range is not None and len(x) <= n_out:
+            # the visible range has nothing to reduce
+            indices = np.arange(len(x), dtype=np.int64)
+        elif self._is_streamed(x) or self._is_streamed(y):
+            # compressed inputs are never decoded as a whole
+            indices = self._downsample_streamed(ds_instance, x, y, n_out)
+        elif x_axis is not None and y is not None:
+            # regularly spaced x gives the same buckets as downsampling y alone
+            indices = ds_instance.downsample(y, n_out=n_out)
+        elif x_axis is not None:
+            indices = ds_instance.downsample(x_axis.to_numpy(), n_out=n_out)
+        elif x is not None and y is not None and not isinstance(ds_instance, tsd.EveryNthDownsampler):
             indices = ds_instance.downsample(x, y, n_out=n_out)
         elif y is not None:
             indices = ds_instance.downsample(y, n_out=n_out)
@@ -49,61 +169,383 @@ class CompressedVectorDownsampler:
 
         result = {}
         
-        self.x_indices = indices if x is not None else None
-        self.y_indices = indices if y is not None else None
+        # Indices are reported in the full arrays, not the x_range slice
+        indices = np.asarray(indices, dtype=np.int64)
+        full_indices = IndexVector(indices + offset)
+        self.x_indices = full_indices if x is not None else None
+        self.y_indices = full_indices if y is not None else None
         
-        if x is not None:
-            cv_x = CompressedVector(
-                int_width=int_width,
-                decimal_places=decimal_places,
-                get_decompressed=False
+        if x_axis is not None:
+            result["x"] = self._select_affine(x_axis, indices, int_width, decimal_places, compress_method_selected)
+
+        elif x is not None:
+            result["x"] = self._compress_values(
+                self._gather(x, indices), int_width, decimal_places, compress_method_selected
             )
-            cv_x.create_vector(len(indices))
-            # Convert x to numpy array if it's a list to support fancy indexing
-            x_array = np.array(x) if not isinstance(x, np.ndarray) else x
-            cv_x.fill_from_vector(x_array[indices])
-            if compress_method_selected is not None:
-                cv_x.compress(compress_method_selected)
-            result["x"] = cv_x
 
         if y is not None:
-            cv_y = CompressedVector(
-                int_width=int_width,
-                decimal_places=decimal_places,
-                get_decompressed=False
+            result["y"] = self._compress_values(
+                self._gather(y, indices), int_width, decimal_places, compress_method_selected
             )
-            cv_y.create_vector(len(indices))
-            # Convert y to numpy array if it's a list to support fancy indexing
-            y_array = np.array(y) if not isinstance(y, np.ndarray) else y
-            cv_y.fill_from_vector(y_array[indices])
-            if compress_method_selected is not None:
-                cv_y.compress(compress_method_selected)
-            result["y"] = cv_y
 
         # Return only what's available
         if "x" in result and "y" in result:
-            return result["x"], result["y"]
+            output = result["x"], result["y"]
         elif "y" in result:
-            return result["y"]
+            output = result["y"]
+        else:
+            output = result["x"]
+
+        if self.cache is not None:
+            # x and y share the same IndexVector
+            size = sum(vector.size_in_bytes() for vector in result.values()) + full_indices.size_in_bytes()
+            self.cache.put(key, (output, self.x_indices, self.y_indices), size)
+            # The cached vectors are never handed out, callers get copy-on-write copies
+            return self._copy_output(output)
+        return output
+
+    def downsample_many(
+        self,
+        x,
+        ys,
+        n_out=1000,
+        method="MinMaxLTTBDownsampler",
+        int_width=64,
+        decimal_places=4,
+        compress_method="vlc_vector_fibonacci",
+        align="union",
+        n_jobs=None):
+        """
+        Downsample several series sharing one x axis.
+        x is validated and converted once, and the series are downsampled concurrently.
+        An AffineAxis x is never materialized: every series is downsampled on y alone.
+
+        :param x: X-axis values shared by every series (array-like, CompressedVector or AffineAxis).
+        :param ys: Dict of series name to Y-axis values, each as long as x.
+        :param n_out: Target number of downsampled points per series.
+        :param method: Downsampling method to use (name or instance).
+        :param int_width: Bit width of integers in compressed vector, or "auto".
+        :param decimal_places: Number of decimal places for float precision.
+        :param compress_method: Compression method to apply (name or function).
+        :param align: One of DOWNSAMPLE_ALIGNMENTS. "union" keeps the union of the points
+            selected for every series, so all series share one x. "per-series" keeps the
+            points selected for each series.
+        :param n_jobs: Number of threads running the downsampler. If None, one per series.
+        :return: With "union", the compressed x (an AffineAxis if x is one and the union is
+            evenly spaced) and a dict of compressed y vectors, all of the same length. With "per-series", a dict of index arrays into x and a dict of
+            compressed y vectors.
+        """
+        if align not in DOWNSAMPLE_ALIGNMENTS:
+            raise ValueError(
+                f"Unknown alignment: '{align}'. "
+                f"Available: {', '.join(DOWNSAMPLE_ALIGNMENTS)}"
+            )
+        if not isinstance(ys, dict) or not ys:
+            raise ValueError("ys must be a non-empty dict of series.")
+        if x is None:
+            raise ValueError("x must be provided to downsample several series.")
+        # The arguments and x are checked once, every series only has to match x
+        self._handle_exceptions(None, x, n_out, method, int_width, decimal_places, compress_method)
+        for y in ys.values():
+            if len(y) != len(x):
+                raise ValueError("Every series must have the same length as x.")
+        downsampler_cls = self._select_downsampler(method)
+        compress_method_selected = self._select_compression_method(compress_method)
+
+        # x is converted once for every series, an AffineAxis is never materialized
+        x_axis = x if isinstance(x, AffineAxis) else None
+        if x_axis is None and not self._is_streamed(x):
+            x = np.asarray(x, dtype=np.float64)
+
+        def downsample_series(y):
+            ds_instance = downsampler_cls()
+            if self._is_streamed(x) or self._is_streamed(y):
+                indices = self._downsample_streamed(ds_instance, x, y, n_out)
+            elif x_axis is not None or isinstance(ds_instance, tsd.EveryNthDownsampler):
+                # regularly spaced x gives the same buckets as downsampling y alone
+                indices = ds_instance.downsample(np.asarray(y, dtype=np.float64), n_out=n_out)
+            else:
+                indices = ds_instance.downsample(x, np.asarray(y, dtype=np.float64), n_out=n_out)
+            return np.asarray(indices, dtype=np.int64)
+
+        with ThreadPoolExecutor(max_workers=n_jobs or len(ys)) as executor:
+            indices = dict(zip(ys, executor.map(downsample_series, ys.values())))
+
+        if align == "union":
+            union = np.unique(np.concatenate(list(indices.values())))
+            indices = {name: union for name in ys}
+            self.x_indices = IndexVector(union)
+            self.y_indices = {name: self.x_indices for name in ys}
+        else:
+            self.x_indices = None
+            self.y_indices = {name: IndexVector(series_indices) for name, series_indices in indices.items()}
+
+        result_y = {
+            name: self._compress_values(
+                self._gather(y, indices[name]), int_width, decimal_places, compress_method_selected
+            )
+            for name, y in ys.items()
+        }
+        if align == "union":
+            if x_axis is not None:
+                return self._select_affine(x_axis, union, int_width, decimal_places, compress_method_selected), result_y
+            cv_x = self._compress_values(
+                self._gather(x, union), int_width, decimal_places, compress_method_selected
+            )
+            return cv_x, result_y
+        return indices, result_y
+
+    def downsample_batch(self, jobs, max_workers=None, executor="process"):
+        """
+        Downsample many series in parallel, each job on its own worker.
+
+        :param jobs: List of jobs, each a dict of downsample() arguments, an (x, y, params)
+            tuple, or a file path. Files (also given as "file_path" in a dict, with optional
+            "column", "delimiter" and "truncate") are read by the worker, x from the first
+            column and y from column 1 by default.
+        :param max_workers: Number of workers. If None, the number of CPUs.
+        :param executor: "process" or "thread" pool, or an existing concurrent.futures.Executor.
+            Processes are not limited by the GIL, but jobs and results are pickled to move
+            them between processes, compressed vectors as their encoded values, so file
+            jobs avoid sending the input data.
+        :return: One dict per job in submission order, with the downsample() "result", the
+            "x_indices" and "y_indices", and the "read_seconds" and total "seconds" of the job.
+        """
+        if not isinstance(executor, Executor) and executor not in EXECUTORS:
+            raise ValueError(
+                f"Unknown executor: '{executor}'. "
+                f"Available: {', '.join(EXECUTORS)}"
+            )
+        if max_workers is not None and (not isinstance(max_workers, int) or max_workers <= 0):
+            raise ValueError("max_workers must be a positive integer or None.")
+        jobs = [self._normalize_job(job) for job in jobs]
+        if not jobs:
+            return []
+
+        if isinstance(executor, Executor):
+            return list(executor.map(_run_batch_job, jobs))
+        max_workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        pool = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+        with pool(max_workers=max_workers) as pool_executor:
+            return list(pool_executor.map(_run_batch_job, jobs))
+
+    @staticmethod
+    def _normalize_job(job):
+        """
+        Convert a batch job to a dict of downsample() arguments.
+
+        :param job: A dict, an (x, y, params) tuple or a file path.
+        :return: The job as a dict.
+        """
+        if isinstance(job, (str, os.PathLike)):
+            return {"file_path": os.fspath(job)}
+        if isinstance(job, dict):
+            return dict(job)
+        if isinstance(job, tuple) and len(job) in (2, 3):
+            params = dict(job[2]) if len(job) == 3 else {}
+            params["x"], params["y"] = job[0], job[1]
+            return params
+        raise TypeError("A batch job must be a dict, an (x, y, params) tuple or a file path.")
+
+    @staticmethod
+    def _is_streamed(vector):
+        """
+        Whether a vector is compressed data decoded block by block
+        (CompressedVector, BlockCompressedVector or a view of them).
+
+        :param vector: The vector to check.
+        :return: True if the vector can be streamed instead of converted to a numpy array.
+        """
+        return hasattr(vector, "iter_chunks") and not isinstance(vector, AffineAxis)
+
+    @staticmethod
+    def _copy_output(output):
+        """
+        Copy a downsample() output, one vector or an (x, y) tuple.
+        CompressedVector copies are copy-on-write, so nothing is duplicated until written.
+        """
+        if isinstance(output, tuple):
+            return tuple(copy.copy(vector) for vector in output)
+        return copy.copy(output)
+
+    @staticmethod
+    def _gather(vector, indices):
+        """
+        Read the values of a vector at the given indices as float64.
+
+        :param vector: Array-like, CompressedVector, CompressedVectorView or AffineAxis.
+        :param indices: Sorted int64 indices.
+        :return: A numpy array with the selected values.
+        """
+        if hasattr(vector, "_take"):
+            return vector._take(indices)
+        # Convert to a float array to support fancy indexing and bulk encoding
+        return np.asarray(vector, dtype=np.float64)[indices]
+
+    def _downsample_streamed(self, ds_instance, x, y, n_out):
+        """
+        Downsample compressed inputs without decoding them as a whole.
+        The values are streamed in decoded blocks split into CANDIDATE_RATIO * n_out bins,
+        and the first, last, min and max points of every bin (plus its first NaN for
+        the NaN downsamplers) are kept as candidates. The downsampler then runs on
+        the candidates only.
+
+        :param ds_instance: The downsampler instance.
+        :param x: The x values or None.
+        :param y: The y values or None.
+        :param n_out: Target number of downsampled points.
+        :return: The selected indices in the full vectors.
+        """
+        values = y if y is not None else x
+        n = len(values)
+        if isinstance(ds_instance, tsd.EveryNthDownsampler):
+            # only the length matters, a zero stride array avoids decoding anything
+            return ds_instance.downsample(np.broadcast_to(np.float64(0), (n,)), n_out=n_out)
+
+        bin_size = max(1, -(-n // (CANDIDATE_RATIO * n_out)))
+        chunk_size = max(bin_size, DEFAULT_CHUNK_SIZE // bin_size * bin_size)
+        keep_nan = type(ds_instance).__name__.startswith("NaN")
+
+        candidates = []
+        offset = 0
+        for chunk in self._iter_chunks(values, chunk_size):
+            extrema = bin_extrema(chunk, bin_size, offset)
+            points = [extrema["first"], extrema["min"], extrema["max"], extrema["last"]]
+            if keep_nan:
+                points.append(extrema["nan"][extrema["nan"] >= 0])
+            candidates.append(np.concatenate(points))
+            offset += len(chunk)
+        candidates = np.unique(np.concatenate(candidates))
+
+        candidate_values = self._gather(values, candidates)
+        if x is not None and y is not None:
+            candidate_x = self._gather(x, candidates)
         else:
-            return result["x"]
+            # candidates are irregularly spaced, their index keeps the geometry
+            candidate_x = candidates.astype(np.float64)
+        selected = ds_instance.downsample(candidate_x, candidate_values, n_out=n_out)
+        return candidates[np.asarray(selected, dtype=np.int64)]
+
+    @staticmethod
+    def _iter_chunks(vector, chunk_size):
+        """
+        Iterate over a vector in float64 chunks of exactly chunk_size values, except the last.
+        """
+        if hasattr(vector, "iter_chunks"):
+            yield from vector.iter_chunks(chunk_size)
+            return
+        vector = np.asarray(vector, dtype=np.float64)
+        for start in range(0, len(vector), chunk_size):
+            yield vector[start:start + chunk_size]
+
+    def _select_range(self, x, y, x_range):
+        """
+        Slice x and y to the points whose x lies in x_range.
+
+        :param x: The sorted x values (array-like, CompressedVector or AffineAxis).
+        :param y: The y values or None.
+        :param x_range: The (x_min, x_max) range, both ends included.
+        :return: The sliced x and y, and the index of the first point in the full arrays.
+        """
+        start = searchsorted(x, x_range[0], "left")
+        end = max(start, searchsorted(x, x_range[1], "right"))
+
+        def take(vector):
+            if vector is None:
+                return None
+            if isinstance(vector, AffineAxis):
+                return vector[start:end]
+            # only the visible slice is decoded
+            return np.asarray(vector[start:end], dtype=np.float64)
 
+        return take(x), take(y), start
+
+    def _select_affine(self, x_axis, indices, int_width, decimal_places, compress_method_selected):
+        """
+        Select the downsampled values of an AffineAxis without materializing it.
+
+        :param x_axis: The AffineAxis holding x.
+        :param indices: The indices selected by the downsampler.
+        :return: An AffineAxis if the indices are evenly spaced, a CompressedVector otherwise.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        steps = np.diff(indices)
+        if len(steps) == 0 or (steps == steps[0]).all():
+            index_step = int(steps[0]) if len(steps) else 1
+            first = int(indices[0]) if len(indices) else 0
+            return AffineAxis(
+                x_axis.start + x_axis.step * first,
+                x_axis.step * index_step,
+                len(indices),
+                decimal_places=decimal_places
+            )
+
+        return self._compress_values(x_axis._take(indices), int_width, decimal_places, compress_method_selected)
+
+    def _compress_values(self, values, int_width, decimal_places, compress_method_selected):
+        """
+        Store downsampled values in a new CompressedVector.
+
+        :param values: The float64 values to store.
+        :param int_width: Bit width of integers in compressed vector, or "auto".
+        :param decimal_places: Number of decimal places for float precision.
+        :param compress_method_selected: Compression function or None.
+        :return: The CompressedVector.
+        """
+        cv = CompressedVector(
+            int_width=int_width,
+            decimal_places=decimal_places,
+            get_decompressed=False
+        )
+        cv.create_vector(len(values))
+        cv.fill_from_vector(values)
+        if compress_method_selected is not None:
+            cv.compress(compress_method_selected)
+        return cv
 
     def get_x_indices(self):
         """
         Get the x indices used in the last downsampling operation.
         
-        :return: CompressedVector containing x indices or None if not available.
+        :return: int64 array of the x indices or None if not available.
         """
-        return self.x_indices
+        return self._decompress_indices(self.x_indices)
     
     def get_y_indices(self):
         """
         Get the y indices used in the last downsampling operation.
         
-        :return: CompressedVector containing y indices or None if not available.
+        :return: int64 array of the y indices, a dict of them after downsample_many,
+            or None if not available.
+        """
+        return self._decompress_indices(self.y_indices)
+
+    def get_x_indices_compressed(self):
+        """
+        Get the x indices used in the last downsampling operation, as they are kept.
+        
+        :return: IndexVector of the x indices (delta-encoded and compressed, usable as an
+            int64 array) or None if not available.
+        """
+        return self.x_indices
+
+    def get_y_indices_compressed(self):
+        """
+        Get the y indices used in the last downsampling operation, as they are kept.
+        
+        :return: IndexVector of the y indices (delta-encoded and compressed, usable as an
+            int64 array), a dict of them after downsample_many, or None if not available.
         """
         return self.y_indices
+
+    @staticmethod
+    def _decompress_indices(indices):
+        """
+        Decompress an IndexVector, or every IndexVector of a dict, into int64 arrays.
+        """
+        if isinstance(indices, dict):
+            return {name: series_indices.to_numpy() for name, series_indices in indices.items()}
+        return indices.to_numpy() if indices is not None else None
     
     def set_get_decompressed(self, get_decompressed):
         """
@@ -141,13 +583,13 @@ class CompressedVectorDownsampler:
                 )
         raise TypeError("compression method must be a string or a valid function.")
     
-    def _handle_exceptions(self, y, x, n_out, method, int_width, decimal_places, compress_method):
+    def _handle_exceptions(self, y, x, n_out, method, int_width, decimal_places, compress_method, x_range=None):
         if n_out <= 0:
             raise ValueError("n_out must be a positive integer.")
         if not isinstance(n_out, int):
             raise TypeError("n_out must be an integer.")
-        if not isinstance(int_width, int) or int_width not in [8, 16, 32, 64]:
-            raise ValueError("int_width must be one of [8, 16, 32, 64].")
+        if int_width != "auto" and (not isinstance(int_width, int) or not 1 <= int_width <= 64):
+            raise ValueError("int_width must be an integer between 1 and 64, or 'auto'.")
         if not isinstance(decimal_places, int) or decimal_places < 0:
             raise ValueError("decimal_places must be a non-negative integer.")
         if not isinstance(method, (str)) and method not in DOWNSAMPLERS.values():
@@ -160,4 +602,11 @@ class CompressedVectorDownsampler:
             raise ValueError(f"n_out ({n_out}) cannot be greater than the length of y ({len(y)}).")
         if x is None and y is None:
             raise ValueError("At least one of 'x' or 'y' must be provided for downsampling.")
+        if x_range is not None:
+            if x is None:
+                raise ValueError("x_range requires x to be provided.")
+            if len(x_range) != 2 or x_range[0] > x_range[1]:
+                raise ValueError("x_range must be a (x_min, x_max) pair with x_min <= x_max.")
+            if y is not None and len(x) != len(y):
+                raise ValueError("x and y must have the same length to use x_range.")
  
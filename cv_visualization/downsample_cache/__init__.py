@@ -0,0 +1 @@
+from .downsample_cache import DownsampleCache
@@ -0,0 +1,43 @@
+import hashlib
+import numpy as np
+from ..common.available_methods import DEFAULT_CACHE_BYTES
+from ..common.lru_cache import LRUCache
+
+# Number of evenly spaced values a fingerprint hashes
+FINGERPRINT_SAMPLES = 64
+
+class DownsampleCache(LRUCache):
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        """
+        LRU cache of downsampling results under a byte size budget.
+        When storing an entry would exceed max_bytes, the least recently used
+        entries are evicted first. Entries larger than the budget are not stored.
+        Args:
+            max_bytes (int): Maximum total size in bytes of the stored entries. (default: 64 MiB)
+        """
+        super().__init__(max_bytes)
+
+    @staticmethod
+    def fingerprint(vector):
+        """
+        Cheap fingerprint of a vector: its type, length and a hash of
+        FINGERPRINT_SAMPLES evenly spaced values, so only those are decoded.
+        A change between the sampled values is not detected, pass an explicit
+        version key to the downsampler for data that is modified in place.
+        Args:
+            vector: Array-like, CompressedVector, AffineAxis or None.
+        Returns:
+            tuple: The fingerprint, usable in a cache key.
+        """
+        if vector is None:
+            return None
+        n = len(vector)
+        positions = np.unique(np.linspace(0, n - 1, min(n, FINGERPRINT_SAMPLES)).astype(np.int64))
+        if hasattr(vector, "_take"):
+            sample = vector._take(positions)
+        elif isinstance(vector, np.ndarray):
+            sample = vector[positions]
+        else:
+            sample = [vector[int(position)] for position in positions]
+        digest = hashlib.blake2b(np.asarray(sample, dtype=np.float64).tobytes(), digest_size=16).hexdigest()
+        return (type(vector).__name__, n, digest)
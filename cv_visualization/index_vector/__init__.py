@@ -0,0 +1 @@
+from .index_vector import IndexVector
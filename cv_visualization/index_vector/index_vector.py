@@ -0,0 +1,115 @@
+import numpy as np
+from ..compressed_vector import CompressedVector
+
+class IndexVector:
+    def __init__(self, indices, compress_method="vlc_vector_elias_gamma"):
+        """
+        Compressed vector of non-negative integer indices, such as the points a
+        downsampler selected. The indices are stored delta encoded, so sorted
+        indices take a few bits each, and the vector converts to an int64 numpy
+        array wherever one is expected (np.asarray, fancy indexing...).
+        Args:
+            indices (array-like): The indices, below 2**53.
+            compress_method (str or function): Compression method of the deltas. (default: "vlc_vector_elias_gamma")
+        """
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        if len(indices) and indices.min() < 0:
+            raise ValueError("Indices must be non-negative")
+
+        self.n_elements = len(indices)
+        # Kept so the bounds of the indices never need a decode
+        self.bounds = (int(indices.min()), int(indices.max())) if len(indices) else None
+        self.values = CompressedVector(decimal_places=0, int_width=64, representation="delta", summary_block_size=None)
+        self.values.create_vector(self.n_elements)
+        self.values.fill_from_vector(indices.astype(np.float64))
+        if compress_method is not None:
+            self.values.compress(compress_method)
+
+    @property
+    def dtype(self):
+        """
+        Return the data type of the indices.
+        """
+        return np.dtype(np.int64)
+
+    @property
+    def ndim(self):
+        return 1
+
+    @property
+    def shape(self):
+        return (self.n_elements,)
+
+    @property
+    def size(self):
+        return self.n_elements
+
+    def __len__(self):
+        """
+        Return the number of indices.
+        """
+        return self.n_elements
+
+    def __iter__(self):
+        """
+        Iterate over the indices as python ints.
+        """
+        for chunk in self.values.iter_chunks():
+            yield from chunk.astype(np.int64).tolist()
+
+    def __getitem__(self, index):
+        """
+        Get the index at the given position, or the indices at a slice or positions.
+        Args:
+            index (int, slice, list, np.ndarray, tuple): The positions to retrieve.
+        Returns:
+            int for an int position, otherwise an int64 numpy array.
+        """
+        if isinstance(index, (int, np.integer)):
+            return int(self.values[index])
+        if isinstance(index, (slice, list, np.ndarray, tuple)):
+            return self.values._take(self.values._normalize_index(index)).astype(np.int64)
+        raise TypeError(f"Invalid index type: {type(index)}. Expected int, slice, list or ndarray.")
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Support for the numpy array protocol.
+        Args:
+            dtype (np.dtype): Optional target dtype.
+            copy (bool): Ignored, a new array is always returned.
+        Returns:
+            np.ndarray: The decompressed indices.
+        """
+        return self.to_numpy(dtype=dtype)
+
+    def to_numpy(self, dtype=np.int64):
+        """
+        Decompress the indices into a numpy array.
+        Args:
+            dtype (np.dtype): The dtype of the returned array. (default: int64)
+        Returns:
+            np.ndarray: The indices.
+        """
+        return self.values.to_numpy().astype(dtype if dtype is not None else np.int64)
+
+    def min(self):
+        """
+        Return the smallest index.
+        """
+        if self.bounds is None:
+            raise ValueError("min() of an empty IndexVector")
+        return self.bounds[0]
+
+    def max(self):
+        """
+        Return the largest index.
+        """
+        if self.bounds is None:
+            raise ValueError("max() of an empty IndexVector")
+        return self.bounds[1]
+
+    def size_in_bytes(self):
+        """
+        Return the size in bytes of the compressed indices.
+        """
+        return self.values.size_in_bytes()
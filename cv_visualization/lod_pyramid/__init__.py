@@ -0,0 +1 @@
+from .lod_pyramid import LODPyramid
@@ -0,0 +1,233 @@
+import math
+import numpy as np
+from ..common.available_methods import DEFAULT_CHUNK_SIZE, LOD_METHODS
+from ..common.binning import bin_extrema
+from ..common.search import searchsorted
+from ..compressed_vector import CompressedVector
+
+class LODPyramid:
+    def __init__(
+        self,
+        y,
+        x=None,
+        method="m4",
+        compress_method="vlc_vector_elias_gamma",
+        chunk_size=DEFAULT_CHUNK_SIZE
+    ):
+        """
+        Multi-resolution level of detail pyramid over a time series.
+        Level k splits the series into bins of 2 * points_per_bin * 2**k consecutive
+        points and keeps, for each bin, the indices of its M4 points (first, min,
+        max, last) or MinMax points, as a delta encoded compressed vector. Levels are
+        built once, the first from a single streamed pass over y and each other one
+        by merging pairs of bins of the level below.
+        Args:
+            y (array-like, CompressedVector): The values of the series.
+            x (array-like, CompressedVector, AffineAxis): Sorted x values. If None, x is the index.
+            method (str): Points kept per bin, one of LOD_METHODS. (default: "m4")
+            compress_method (str or function): Compression method of the level indices.
+            chunk_size (int): Number of values of y decoded at once while building.
+        """
+        if method not in LOD_METHODS:
+            raise ValueError(
+                f"Unknown LOD method: '{method}'. "
+                f"Available: {', '.join(LOD_METHODS)}"
+            )
+        if x is not None and len(x) != len(y):
+            raise ValueError("x and y must have the same length.")
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer.")
+
+        # Plain sequences are converted once, so queries can gather from them
+        self.y = y if hasattr(y, "_take") else np.asarray(y, dtype=np.float64)
+        self.x = x if x is None or hasattr(x, "_take") else np.asarray(x, dtype=np.float64)
+        self.method = method
+        self.points_per_bin = LOD_METHODS[method]
+        self.n_elements = len(y)
+        self.levels = []
+        self._build(compress_method, chunk_size)
+
+    def __len__(self):
+        """
+        Return the number of points of the series.
+        """
+        return self.n_elements
+
+    def _build(self, compress_method, chunk_size):
+        """
+        Build every level, from the finest to a single bin.
+        """
+        bin_size = 2 * self.points_per_bin
+        chunk_size = max(bin_size, chunk_size - chunk_size % bin_size)
+        bins = self._bins_from_values(bin_size, chunk_size)
+
+        while bins is not None:
+            self.levels.append((bin_size, self._store_level(bins, compress_method)))
+            if len(bins["first"]) <= 1:
+                break
+            bins = self._merge_bins(bins)
+            bin_size *= 2
+
+    def _iter_y_chunks(self, chunk_size):
+        """
+        Iterate over y in float64 chunks of exactly chunk_size values, except the last.
+        """
+        if hasattr(self.y, "iter_chunks"):
+            yield from self.y.iter_chunks(chunk_size)
+            return
+        for start in range(0, self.n_elements, chunk_size):
+            yield self.y[start:start + chunk_size]
+
+    def _bins_from_values(self, bin_size, chunk_size):
+        """
+        Compute the first, last, min and max points of bins of bin_size consecutive values.
+        Returns:
+            dict: Arrays of indices ("first", "last", "min", "max") and of the min and max
+                values ("min_value", "max_value"), None if the series is empty.
+        """
+        if self.n_elements == 0:
+            return None
+
+        chunks = []
+        offset = 0
+        for chunk in self._iter_y_chunks(chunk_size):
+            chunks.append(bin_extrema(chunk, bin_size, offset))
+            offset += len(chunk)
+        keys = ("first", "last", "min", "max", "min_value", "max_value")
+        return {key: np.concatenate([chunk[key] for chunk in chunks]) for key in keys}
+
+    @staticmethod
+    def _merge_bins(bins):
+        """
+        Merge pairs of consecutive bins into the bins of the next level.
+        The min and max of a merged bin are among the min and max of its halves.
+        """
+        n_bins = len(bins["first"])
+        left = {key: values[0::2] for key, values in bins.items()}
+        # An odd last bin is merged with itself
+        right = {key: np.concatenate([values[1::2], values[-1:]]) if n_bins % 2 else values[1::2]
+                 for key, values in bins.items()}
+
+        left_min = left["min_value"] <= right["min_value"]
+        left_max = left["max_value"] >= right["max_value"]
+        return {
+            "first": left["first"],
+            "last": right["last"],
+            "min": np.where(left_min, left["min"], right["min"]),
+            "max": np.where(left_max, left["max"], right["max"]),
+            "min_value": np.where(left_min, left["min_value"], right["min_value"]),
+            "max_value": np.where(left_max, left["max_value"], right["max_value"]),
+        }
+
+    def _store_level(self, bins, compress_method):
+        """
+        Store points_per_bin sorted indices per bin in a delta encoded CompressedVector.
+        """
+        columns = ("first", "min", "max", "last") if self.method == "m4" else ("min", "max")
+        indices = np.sort(np.stack([bins[column] for column in columns], axis=1), axis=1).reshape(-1)
+
+        level = CompressedVector(decimal_places=0, int_width=64, representation="delta", summary_block_size=None)
+        level.create_vector(len(indices))
+        level.fill_from_vector(indices.astype(np.float64))
+        if compress_method is not None:
+            level.compress(compress_method)
+        return level
+
+    def index_range(self, x_min=None, x_max=None):
+        """
+        Return the range of indices whose x lies in [x_min, x_max].
+        Args:
+            x_min (float): Lower bound of x. If None, from the first point.
+            x_max (float): Upper bound of x. If None, until the last point.
+        Returns:
+            tuple: First index and end index (exclusive).
+        """
+        start = 0 if x_min is None else self._search(x_min, "left")
+        end = self.n_elements if x_max is None else self._search(x_max, "right")
+        return start, max(start, end)
+
+    def _search(self, value, side):
+        """
+        Binary search value in x, like np.searchsorted. Reads O(log n) values of x.
+        """
+        if self.x is None:
+            position = math.ceil(value) if side == "left" else math.floor(value) + 1
+            return min(max(position, 0), self.n_elements)
+        return searchsorted(self.x, value, side)
+
+    def query(self, x_min=None, x_max=None, n_out=1000):
+        """
+        Return the points to draw the viewport [x_min, x_max] at n_out pixels.
+        The level read is the finest with at most about n_out bins in the viewport,
+        so about points_per_bin * n_out points (plus a few per level for the bins
+        cut by the edges) are decoded whatever the length of the series.
+        Viewports holding fewer points are returned raw.
+        Args:
+            x_min (float): Left edge of the viewport. If None, from the first point.
+            x_max (float): Right edge of the viewport. If None, until the last point.
+            n_out (int): Number of bins, usually the width of the plot in pixels.
+        Returns:
+            tuple: x and y float64 numpy arrays of the selected points, sorted by x.
+        """
+        if not isinstance(n_out, int) or n_out <= 0:
+            raise ValueError("n_out must be a positive integer.")
+        start, end = self.index_range(x_min, x_max)
+        indices = self.query_indices(start, end, n_out)
+        x_values = indices.astype(np.float64) if self.x is None else self._gather(self.x, indices)
+        return x_values, self._gather(self.y, indices)
+
+    def query_indices(self, start, end, n_out):
+        """
+        Return the indices of the points to draw [start, end) at n_out pixels, see query().
+        Args:
+            start (int): First index of the viewport.
+            end (int): End index (exclusive) of the viewport.
+            n_out (int): Number of bins.
+        Returns:
+            np.ndarray: Sorted int64 indices.
+        """
+        n_points = end - start
+        if n_points <= self.points_per_bin * n_out or not self.levels:
+            return np.arange(start, end, dtype=np.int64)
+
+        # Finest level whose bins are at least n_points / n_out long
+        bin_size, level = next(
+            ((bin_size, level) for bin_size, level in self.levels if bin_size * n_out >= n_points),
+            self.levels[-1]
+        )
+        inner_start = min(-(-start // bin_size) * bin_size, end)
+        inner_end = max(end // bin_size * bin_size, inner_start)
+        # The ends of the viewport are always drawn
+        parts = [np.array([start, end - 1], dtype=np.int64)]
+        if inner_start < inner_end:
+            level_range = range(inner_start // bin_size * self.points_per_bin, inner_end // bin_size * self.points_per_bin)
+            parts.append(level._take(level_range).astype(np.int64))
+        # Bins cut by the viewport edges would select points outside of it, the
+        # edges are drawn from finer levels down to the raw points at the ends
+        for edge_start, edge_end in ((start, inner_start), (inner_end, end)):
+            if edge_end > edge_start:
+                parts.append(self.query_indices(edge_start, edge_end, 2))
+        return np.unique(np.concatenate(parts))
+
+    @staticmethod
+    def _gather(source, indices):
+        """
+        Read the values of a vector at sorted indices.
+        """
+        if hasattr(source, "_take"):
+            return source._take(indices)
+        return source[indices]
+
+    def size_in_bytes(self):
+        """
+        Return the size in bytes of the levels, without the series itself.
+        """
+        return sum(level.size_in_bytes() for _, level in self.levels)
+
+    def destroy(self):
+        """
+        Destroy the levels and free memory.
+        """
+        for _, level in self.levels:
+            level.destroy()
+        self.levels = []
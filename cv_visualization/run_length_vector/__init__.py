@@ -0,0 +1 @@
+from .run_length_vector import RunLengthVector
\ No newline at end of file
@@ -0,0 +1,114 @@
+import sdsl4py
+import numpy as np
+
+class RunLengthVector:
+    def __init__(self, vector):
+        """
+        Run-length encode an integer vector.
+        Each run of equal consecutive values is stored once, together with the
+        index where it ends, so nearly constant vectors such as the sign part
+        take a few bytes regardless of their length.
+        Args:
+            vector: An sdsl4py int_vector, numpy array or sequence of non-negative integers.
+        """
+        values = self._as_array(vector).astype(np.uint64)
+
+        self.n_elements = len(values)
+        if self.n_elements:
+            run_starts = np.flatnonzero(np.concatenate([[True], values[1:] != values[:-1]]))
+            run_ends = np.append(run_starts[1:], self.n_elements)
+            run_values = values[run_starts]
+        else:
+            run_ends = run_values = np.empty(0, dtype=np.uint64)
+
+        self.run_values = self._to_int_vector(run_values)
+        self.run_ends = self._to_int_vector(run_ends)
+
+    @staticmethod
+    def _as_array(vector):
+        """
+        Return the values of a vector as a numpy array. Vectors exposing the buffer
+        protocol (int_vector_8/16/32/64) are viewed without a copy, anything else is read
+        element by element.
+        """
+        try:
+            return np.asarray(memoryview(vector))
+        except TypeError:
+            return np.fromiter((int(value) for value in vector), dtype=np.uint64, count=len(vector))
+
+    @staticmethod
+    def _to_int_vector(values):
+        """
+        Store values in the smallest fixed width sdsl4py int_vector holding them.
+        """
+        max_value = int(values.max()) if len(values) else 0
+        for width, vector_type in (
+            (8, sdsl4py.int_vector_8),
+            (16, sdsl4py.int_vector_16),
+            (32, sdsl4py.int_vector_32),
+            (64, sdsl4py.int_vector_64),
+        ):
+            if max_value < 2 ** width:
+                break
+        vector = vector_type(size=len(values), default_value=0)
+        try:
+            np.asarray(memoryview(vector))[:] = values
+        except TypeError:
+            for index, value in enumerate(values):
+                vector[index] = int(value)
+        return vector
+
+    def __getstate__(self):
+        """
+        Return the state for pickling, with the runs as numpy arrays instead of sdsl vectors.
+        """
+        return {
+            "n_elements": self.n_elements,
+            "run_values": np.array(self._as_array(self.run_values)),
+            "run_ends": np.array(self._as_array(self.run_ends)),
+        }
+
+    def __setstate__(self, state):
+        """
+        Restore the runs pickled by __getstate__, without encoding them again.
+        """
+        self.n_elements = state["n_elements"]
+        self.run_values = self._to_int_vector(state["run_values"])
+        self.run_ends = self._to_int_vector(state["run_ends"])
+
+    def __len__(self):
+        """
+        Return the number of elements in the vector.
+        """
+        return self.n_elements
+
+    def __getitem__(self, index):
+        """
+        Get the value at the given index.
+        Args:
+            index (int): The index to retrieve.
+        Returns:
+            int: The value at the index.
+        """
+        if index < 0:
+            index += self.n_elements
+        if index < 0 or index >= self.n_elements:
+            raise IndexError("Index out of bounds")
+        run = int(np.searchsorted(self._as_array(self.run_ends), index, side="right"))
+        return int(self.run_values[run])
+
+    def __iter__(self):
+        """
+        Iterate over the values, one run at a time.
+        """
+        run_start = 0
+        for value, run_end in zip(self._as_array(self.run_values), self._as_array(self.run_ends)):
+            for _ in range(int(run_end) - run_start):
+                yield int(value)
+            run_start = int(run_end)
+
+    def size_in_bytes(self):
+        """
+        Return the size in bytes of the run values and run ends.
+        """
+        return sdsl4py.size_in_bytes(self.run_values) + sdsl4py.size_in_bytes(self.run_ends)
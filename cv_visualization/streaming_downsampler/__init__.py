@@ -0,0 +1 @@
+from .streaming_downsampler import StreamingDownsampler
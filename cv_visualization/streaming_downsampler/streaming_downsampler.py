@@ -0,0 +1,201 @@
+import numpy as np
+from ..common.available_methods import LOD_METHODS
+from ..common.binning import bin_extrema
+from ..compressed_vector import CompressedVector
+
+# Points tracked for every bucket
+BUCKET_POINTS = ("first", "min", "max", "last")
+
+class StreamingDownsampler:
+    def __init__(
+        self,
+        n_out=1000,
+        method="m4",
+        int_width=64,
+        decimal_places=4,
+        compress_method="vlc_vector_fibonacci"
+    ):
+        """
+        Incremental downsampler for series growing at the end.
+        The appended points are split into at most n_out / points_per_bin buckets of
+        bucket_width consecutive points, each keeping its first, last, min and max points.
+        When the buckets are full, bucket_width doubles and pairs of buckets are merged
+        in place, so the state and every refresh stay O(n_out) however long the series is.
+        Args:
+            n_out (int): Maximum number of points of the output.
+            method (str): Points kept per bucket in the output, one of LOD_METHODS. (default: "m4")
+            int_width (int or str): Bit width of integers in the output vectors, or "auto".
+            decimal_places (int): Number of decimal places of the output vectors.
+            compress_method (str or function): Compression method of the output vectors.
+        """
+        if method not in LOD_METHODS:
+            raise ValueError(
+                f"Unknown streaming method: '{method}'. "
+                f"Available: {', '.join(LOD_METHODS)}"
+            )
+        if not isinstance(n_out, int) or n_out < LOD_METHODS[method]:
+            raise ValueError(f"n_out must be an integer of at least {LOD_METHODS[method]} for '{method}'.")
+
+        self.n_out = n_out
+        self.method = method
+        self.points_per_bin = LOD_METHODS[method]
+        self.max_buckets = n_out // self.points_per_bin
+        self.int_width = int_width
+        self.decimal_places = decimal_places
+        self.compress_method = compress_method
+        self.reset()
+
+    def reset(self):
+        """
+        Forget every appended point.
+        """
+        self.n_elements = 0
+        self.bucket_width = 1
+        self.buckets = None
+
+    def __len__(self):
+        """
+        Return the number of points appended so far.
+        """
+        return self.n_elements
+
+    @property
+    def n_buckets(self):
+        return 0 if self.buckets is None else len(self.buckets["first_index"])
+
+    def append(self, x_chunk=None, y_chunk=None):
+        """
+        Append new points at the end of the series.
+        Args:
+            x_chunk (array-like): Their x values, sorted and after the previous ones.
+                If None, x is the index of the point in the series.
+            y_chunk (array-like): Their y values.
+        """
+        if y_chunk is None:
+            raise ValueError("y_chunk must be provided.")
+        y_chunk = np.asarray(y_chunk, dtype=np.float64).reshape(-1)
+        if x_chunk is None:
+            x_chunk = np.arange(self.n_elements, self.n_elements + len(y_chunk), dtype=np.float64)
+        else:
+            x_chunk = np.asarray(x_chunk, dtype=np.float64).reshape(-1)
+            if len(x_chunk) != len(y_chunk):
+                raise ValueError("x_chunk and y_chunk must have the same length.")
+        if len(y_chunk) == 0:
+            return
+
+        # Widen the buckets before adding, so the chunk is only binned once
+        while -(-(self.n_elements + len(y_chunk)) // self.bucket_width) > self.max_buckets:
+            if self.buckets is not None:
+                self.buckets = self._merge_pairs(self.buckets)
+            self.bucket_width *= 2
+
+        offset = self.n_elements
+        # The head of the chunk completes the last bucket, if it is partial
+        head = min(len(y_chunk), -offset % self.bucket_width)
+        if head:
+            head_bucket = self._summarize(x_chunk[:head], y_chunk[:head], head, offset)
+            last = {key: values[-1:] for key, values in self.buckets.items()}
+            merged = self._merge(last, head_bucket)
+            for key, values in merged.items():
+                self.buckets[key][-1] = values[0]
+
+        if head < len(y_chunk):
+            new_buckets = self._summarize(x_chunk[head:], y_chunk[head:], self.bucket_width, offset + head)
+            if self.buckets is None:
+                self.buckets = new_buckets
+            else:
+                self.buckets = {key: np.concatenate([self.buckets[key], new_buckets[key]]) for key in self.buckets}
+        self.n_elements += len(y_chunk)
+
+    @staticmethod
+    def _summarize(x_values, y_values, bucket_width, offset):
+        """
+        Summarize consecutive buckets of bucket_width points.
+        Returns:
+            dict: For each of BUCKET_POINTS, the "_index", "_x" and "_y" arrays of its point in every bucket.
+        """
+        extrema = bin_extrema(y_values, bucket_width, offset)
+        buckets = {}
+        for point in BUCKET_POINTS:
+            positions = extrema[point] - offset
+            buckets[f"{point}_index"] = extrema[point]
+            buckets[f"{point}_x"] = x_values[positions]
+            buckets[f"{point}_y"] = y_values[positions]
+        return buckets
+
+    @staticmethod
+    def _merge(left, right):
+        """
+        Merge buckets with the buckets following them. NaN values are only
+        kept as min or max when both halves have nothing else.
+        """
+        use_left = {
+            "first": np.ones(len(left["first_index"]), dtype=bool),
+            "last": np.zeros(len(left["first_index"]), dtype=bool),
+            "min": (left["min_y"] <= right["min_y"]) | np.isnan(right["min_y"]),
+            "max": (left["max_y"] >= right["max_y"]) | np.isnan(right["max_y"]),
+        }
+        return {
+            key: np.where(use_left[key.rsplit("_", 1)[0]], left[key], right[key])
+            for key in left
+        }
+
+    def _merge_pairs(self, buckets):
+        """
+        Merge pairs of consecutive buckets into buckets twice as wide.
+        An odd last bucket is merged with itself.
+        """
+        n_buckets = len(buckets["first_index"])
+        left = {key: values[0::2] for key, values in buckets.items()}
+        right = {key: np.concatenate([values[1::2], values[-1:]]) if n_buckets % 2 else values[1::2]
+                 for key, values in buckets.items()}
+        return self._merge(left, right)
+
+    def get_indices(self):
+        """
+        Return the indices in the series of the points of the output.
+        Returns:
+            np.ndarray: Sorted int64 indices.
+        """
+        return self._select()[0]
+
+    def _select(self):
+        """
+        Select the output points from the buckets.
+        Returns:
+            tuple: Sorted unique indices, and their x and y values.
+        """
+        if self.buckets is None:
+            empty = np.empty(0, dtype=np.float64)
+            return np.empty(0, dtype=np.int64), empty, empty
+
+        points = BUCKET_POINTS if self.method == "m4" else ("min", "max")
+        indices = np.concatenate([self.buckets[f"{point}_index"] for point in points])
+        x_values = np.concatenate([self.buckets[f"{point}_x"] for point in points])
+        y_values = np.concatenate([self.buckets[f"{point}_y"] for point in points])
+        indices, positions = np.unique(indices, return_index=True)
+        return indices, x_values[positions], y_values[positions]
+
+    def downsample(self):
+        """
+        Return the up to date downsampled series, in O(n_out).
+        Returns:
+            tuple: CompressedVector x and y of at most n_out points.
+        """
+        _, x_values, y_values = self._select()
+        return self._compress_values(x_values), self._compress_values(y_values)
+
+    def _compress_values(self, values):
+        """
+        Store output values in a new CompressedVector.
+        """
+        cv = CompressedVector(
+            int_width=self.int_width,
+            decimal_places=self.decimal_places,
+            get_decompressed=False
+        )
+        cv.create_vector(len(values))
+        cv.fill_from_vector(values)
+        if self.compress_method is not None:
+            cv.compress(self.compress_method)
+        return cv
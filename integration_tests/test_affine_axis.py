@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+from cv_visualization import AffineAxis, CompressedVector, CompressedVectorDownsampler as cvd, DOWNSAMPLERS
+
+DECIMAL_PLACES = 4
+all_methods = list(DOWNSAMPLERS.keys())
+
+
+def test_affine_axis():
+    x = np.round(10 + np.arange(10000) * 0.002, DECIMAL_PLACES)
+    axis = AffineAxis.from_values(x, tolerance=1e-9, decimal_places=DECIMAL_PLACES)
+
+    assert axis is not None, "A regularly spaced vector should be detected"
+    assert len(axis) == len(x), "Length does not match"
+    assert np.array_equal(axis.to_numpy(), x), "Values do not match"
+    assert axis[123] == x[123], "Random access does not match"
+    assert axis[-1] == x[-1], "Negative index does not match"
+
+    sliced = axis[100:5000:7]
+    assert isinstance(sliced, AffineAxis), "Slicing an AffineAxis should return an AffineAxis"
+    assert np.array_equal(sliced.to_numpy(), x[100:5000:7]), "Slice does not match"
+    assert np.array_equal(np.asarray(axis[[5, 1, 9]]), x[[5, 1, 9]]), "Index list does not match"
+    assert axis.size_in_bytes() == 24, "An AffineAxis should only store start, step and n"
+
+
+def test_affine_axis_materialize_fractional_step():
+    axis = AffineAxis(0, 0.25, 10)
+    np.testing.assert_array_equal(axis[[1, 3]].materialize().to_numpy(), [0.25, 0.75])
+    np.testing.assert_array_equal(AffineAxis(1.5, 0.001, 10)[[2, 9]].materialize().to_numpy(), [1.502, 1.509])
+
+    with pytest.raises(ValueError):
+        AffineAxis(0, 1 / 3, 10)[[1, 2]].materialize()
+    np.testing.assert_allclose(
+        AffineAxis(0, 1 / 3, 10, decimal_places=4)[[1, 2]].materialize().to_numpy(), [0.3333, 0.6667]
+    )
+
+
+def test_affine_axis_irregular():
+    x = np.cumsum(np.random.uniform(0.5, 1.5, 1000))
+    assert AffineAxis.from_values(x, tolerance=1e-6) is None, "Irregular values should not be detected"
+
+
+def test_build_from_file_affine(tmp_path):
+    x = np.round(np.arange(5000) * 0.01, DECIMAL_PLACES)
+    file_path = tmp_path / "x.csv"
+    np.savetxt(file_path, x, delimiter=',')
+
+    built = CompressedVector(DECIMAL_PLACES, 64).build_from_file(str(file_path), column=0, delimiter=',', affine_tolerance=1e-9)
+    assert isinstance(built, AffineAxis), "build_from_file should detect a regular axis"
+    assert np.array_equal(built.to_numpy(), x), "Detected axis does not match the file"
+
+    built = CompressedVector(DECIMAL_PLACES, 64).build_from_file(str(file_path), column=0, delimiter=',')
+    assert isinstance(built, CompressedVector), "Without a tolerance a CompressedVector should be built"
+
+
+@pytest.mark.parametrize("ts_method", all_methods)
+def test_downsample_affine_x(ts_method):
+    x = np.round(np.arange(20000) * 0.001, DECIMAL_PLACES)
+    y = np.sin(x * 10)
+
+    cv_downsampler = cvd()
+    downsampled_x, downsampled_y = cv_downsampler.downsample(
+        y=y,
+        x=AffineAxis.from_values(x, tolerance=1e-9, decimal_places=DECIMAL_PLACES),
+        n_out=500,
+        method=ts_method,
+        decimal_places=DECIMAL_PLACES
+    )
+    indices = cv_downsampler.get_x_indices()
+    assert np.allclose(np.asarray(downsampled_x), x[indices]), "Downsampled x does not match"
+    assert np.allclose(np.asarray(downsampled_y), np.round(y[indices], DECIMAL_PLACES)), "Downsampled y does not match"
+
+
+@pytest.mark.parametrize("align", ["union", "per-series"])
+def test_downsample_many_affine_x(align):
+    x = np.round(np.arange(20000) * 0.001, DECIMAL_PLACES)
+    ys = {"sin": np.sin(x * 10), "cos": np.cos(x * 7)}
+    axis = AffineAxis.from_values(x, tolerance=1e-9, decimal_places=DECIMAL_PLACES)
+
+    def fail():
+        raise AssertionError("The AffineAxis should not be materialized")
+    axis.to_numpy = fail
+
+    cv_downsampler = cvd()
+    result_x, result_y = cv_downsampler.downsample_many(
+        axis, ys, n_out=400, method="M4Downsampler", decimal_places=DECIMAL_PLACES, align=align
+    )
+    for name, y in ys.items():
+        indices = cv_downsampler.get_y_indices()[name]
+        assert np.allclose(np.asarray(result_y[name]), np.round(y[indices], DECIMAL_PLACES)), "Downsampled y does not match"
+        if align == "per-series":
+            np.testing.assert_array_equal(result_x[name], indices)
+    if align == "union":
+        assert np.allclose(np.asarray(result_x), x[cv_downsampler.get_x_indices()]), "Downsampled x does not match"
+
+
+def test_affine_axis_boolean_mask():
+    axis = AffineAxis(0, 0.5, 8)
+    mask = np.array([True, False] * 4)
+    np.testing.assert_array_equal(np.asarray(axis[mask]), axis.to_numpy()[mask])
+    with pytest.raises(IndexError):
+        axis[mask[:3]]
@@ -0,0 +1,128 @@
+import os
+import sdsl4py
+import numpy as np
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from cv_visualization import BlockCompressedVector, CompressedVectorView, COMPRESSION_METHODS
+from utils import build_vector, get_original_vector_and_decimal_places, verify_compressed_vector
+
+BLOCK_SIZE = 1000
+
+
+@pytest.mark.parametrize("width", [8, 16, 32, 64])
+def test_block_compressed_vector(width):
+    bcv, original_vector, decimal_places = build_vector(
+        width, vector_type=BlockCompressedVector, block_size=BLOCK_SIZE, n_jobs=4
+    )
+    assert len(bcv.blocks) == -(-len(original_vector) // BLOCK_SIZE)
+    bcv.compress("dac_vector")
+    verify_compressed_vector(original_vector, decimal_places, bcv)
+    assert all(methods["integer_part"] == "dac_vector" for methods in bcv.compression_methods)
+
+
+def test_block_compressed_vector_build_and_compress():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(64)
+    bcv = BlockCompressedVector(decimal_places, 64, block_size=BLOCK_SIZE, executor=ThreadPoolExecutor(2))
+    bcv.fill_from_vector(original_vector, compress_method="auto")
+    verify_compressed_vector(original_vector, decimal_places, bcv)
+    assert len(bcv.compression_methods) == len(bcv.blocks), "Every block should have its own codecs"
+
+
+def test_block_compressed_vector_process_executor():
+    bcv, original_vector, decimal_places = build_vector(
+        64, vector_type=BlockCompressedVector, block_size=BLOCK_SIZE, n_jobs=4, executor="process"
+    )
+    bcv.compress("vlc_vector_elias_gamma")
+    verify_compressed_vector(original_vector, decimal_places, bcv)
+    assert all(methods["integer_part"] == "vlc_vector_elias_gamma" for methods in bcv.compression_methods)
+
+
+def test_block_compressed_vector_process_executor_does_not_encode_in_parent(monkeypatch):
+    encoded = []
+
+    class CountingDacVector(sdsl4py.dac_vector):
+        def __init__(self, *args, **kwargs):
+            if args or kwargs:
+                encoded.append(os.getpid())
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setitem(COMPRESSION_METHODS, "dac_vector", CountingDacVector)
+    original_vector, decimal_places = get_original_vector_and_decimal_places(64)
+    bcv = BlockCompressedVector(decimal_places, 64, block_size=BLOCK_SIZE, n_jobs=4, executor="process")
+    bcv.fill_from_vector(original_vector, compress_method="dac_vector")
+
+    assert os.getpid() not in encoded, "Compressed blocks should be loaded, not encoded again, by the parent"
+    verify_compressed_vector(original_vector, decimal_places, bcv)
+
+
+def test_block_compressed_vector_indexing():
+    bcv, original_vector, decimal_places = build_vector(
+        16, vector_type=BlockCompressedVector, block_size=BLOCK_SIZE, n_jobs=4
+    )
+    expected = np.round(np.asarray(original_vector), decimal_places)
+    bcv.compress("vlc_vector_fibonacci")
+
+    assert round(bcv[BLOCK_SIZE + 3], decimal_places) == expected[BLOCK_SIZE + 3]
+    assert round(bcv[-1], decimal_places) == expected[-1]
+    with pytest.raises(IndexError):
+        bcv[len(original_vector)]
+
+    view = bcv[BLOCK_SIZE - 10:3 * BLOCK_SIZE + 10:3]
+    assert isinstance(view, CompressedVectorView)
+    np.testing.assert_allclose(view.to_numpy(), expected[BLOCK_SIZE - 10:3 * BLOCK_SIZE + 10:3])
+
+    indices = [5, 2 * BLOCK_SIZE, -1, BLOCK_SIZE - 1, 5]
+    np.testing.assert_allclose(bcv[indices].to_numpy(), expected[indices])
+
+    bcv.set_decompressed_config(True)
+    np.testing.assert_allclose(bcv[10:2 * BLOCK_SIZE + 5], expected[10:2 * BLOCK_SIZE + 5])
+
+
+def test_block_compressed_vector_boolean_mask():
+    bcv, original_vector, decimal_places = build_vector(
+        64, vector_type=BlockCompressedVector, block_size=BLOCK_SIZE, n_jobs=4
+    )
+    expected = np.round(original_vector, decimal_places)
+    mask = np.arange(len(expected)) % 3 == 0
+    np.testing.assert_allclose(bcv[mask].to_numpy(), expected[mask])
+
+
+def test_block_compressed_vector_iter_chunks():
+    bcv, original_vector, decimal_places = build_vector(
+        64, vector_type=BlockCompressedVector, block_size=BLOCK_SIZE, n_jobs=4
+    )
+    chunks = list(bcv.iter_chunks(chunk_size=700, start=150, end=4150))
+    assert [len(chunk) for chunk in chunks] == [700] * 5 + [500]
+    np.testing.assert_allclose(np.concatenate(chunks), np.round(original_vector[150:4150], decimal_places))
+
+
+def test_block_compressed_vector_setitem_rebuilds_block():
+    bcv, original_vector, decimal_places = build_vector(
+        64, vector_type=BlockCompressedVector, block_size=BLOCK_SIZE, n_jobs=4
+    )
+    bcv.compress("enc_vector_elias_gamma")
+    untouched = bcv.blocks[0]
+
+    bcv[BLOCK_SIZE + 1] = 42.5
+    assert bcv[BLOCK_SIZE + 1] == 42.5
+    assert bcv.blocks[0] is untouched, "Only the changed block should be rebuilt"
+    assert bcv.compression_methods[1]["integer_part"] == "enc_vector_elias_gamma"
+
+
+def test_block_compressed_vector_size_in_bytes():
+    bcv, _, _ = build_vector(64, vector_type=BlockCompressedVector, block_size=BLOCK_SIZE, n_jobs=4)
+    uncompressed = bcv.size_in_bytes()
+    bcv.compress("dac_vector")
+    assert len(bcv.size_in_bytes(per_block=True)) == len(bcv.blocks)
+    assert sum(bcv.size_in_bytes(per_block=True)) == bcv.size_in_bytes()
+    assert bcv.size_in_bytes() < uncompressed
+    assert bcv.compression_ratio() > 0
+
+
+def test_block_compressed_vector_invalid_arguments():
+    with pytest.raises(ValueError):
+        BlockCompressedVector(2, 64, block_size=0)
+    with pytest.raises(ValueError):
+        BlockCompressedVector(2, 64, executor="gpu")
+    with pytest.raises(ValueError):
+        BlockCompressedVector(2, 64, representation="unknown")
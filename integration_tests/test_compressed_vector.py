@@ -1,5 +1,6 @@
 import numpy as np
-from cv_visualization import CompressedVector
+import pytest
+from cv_visualization import CompressedVector, CompressedVectorView
 from utils import get_original_vector_and_decimal_places, verify_compressed_vector
 import sdsl4py
 
@@ -347,4 +348,96 @@ def test_build_from_file():
     for i, value in enumerate(cv):
         assert round(value, decimal_places) == round(original_vector[i], decimal_places), \
             f"Decompressed value {value} does not match original {original_vector[i]}"
-        
\ No newline at end of file
+        
+def test_fill_from_vector_matches_single_insert():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(64)
+    original_vector = original_vector + [float('nan'), -0.0, 0.015, 1.005, 2.5]
+
+    # Bulk encoded vector
+    cv = CompressedVector(decimal_places, 64)
+    cv.create_vector(len(original_vector))
+    cv.fill_from_vector(np.asarray(original_vector))
+
+    # Element by element encoded vector
+    expected = CompressedVector(decimal_places, 64)
+    expected.create_vector(len(original_vector))
+    for i, value in enumerate(original_vector):
+        expected._insert_value(i, value)
+
+    for i in range(len(original_vector)):
+        assert cv.integer_part[i] == expected.integer_part[i], f"Integer part mismatch at index {i}"
+        assert cv.decimal_part[i] == expected.decimal_part[i], f"Decimal part mismatch at index {i}"
+        assert cv.sign_part[i] == expected.sign_part[i], f"Sign part mismatch at index {i}"
+
+def test_to_numpy():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(64)
+    original_vector = original_vector + [float('nan')]
+    cv = CompressedVector(decimal_places, 64)
+    cv.create_vector(len(original_vector))
+    cv.fill_from_vector(original_vector)
+    cv.compress(sdsl4py.vlc_vector_elias_gamma)
+
+    expected = np.array([cv._reconstruct_float_value(i) for i in range(len(cv))])
+    decompressed = cv.to_numpy()
+    assert decompressed.dtype == np.float64, "to_numpy should return float64 by default"
+    assert np.array_equal(decompressed, expected, equal_nan=True), "to_numpy does not match element reconstruction"
+    assert np.array_equal(np.asarray(cv), expected, equal_nan=True), "np.asarray does not match element reconstruction"
+    assert cv.to_numpy(dtype=np.float32).dtype == np.float32, "to_numpy should honour dtype"
+
+def test_iter_chunks():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(64)
+    cv = CompressedVector(decimal_places, 64)
+    cv.create_vector(len(original_vector))
+    cv.fill_from_vector(original_vector)
+    cv.compress(sdsl4py.enc_vector_elias_delta)
+
+    chunks = list(cv.iter_chunks(chunk_size=999))
+    assert all(len(chunk) == 999 for chunk in chunks[:-1]), "Every chunk but the last should be full"
+    assert np.array_equal(np.concatenate(chunks), cv.to_numpy()), "Chunks do not match the decompressed vector"
+
+    partial = np.concatenate(list(cv.iter_chunks(chunk_size=100, start=10, end=555)))
+    assert np.array_equal(partial, cv.to_numpy()[10:555]), "Chunk range does not match the decompressed vector"
+
+def test_slice_view():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(64)
+    cv = CompressedVector(decimal_places, 64)
+    cv.create_vector(len(original_vector))
+    cv.fill_from_vector(original_vector)
+    cv.compress(sdsl4py.dac_vector)
+    decompressed = cv.to_numpy()
+
+    view = cv[100:2000:3]
+    assert isinstance(view, CompressedVectorView), "Slicing should return a lazy view"
+    assert view.parent is cv, "The view should reference its parent"
+    assert np.array_equal(view.to_numpy(), decompressed[100:2000:3]), "View does not match the sliced values"
+    assert np.array_equal(view[10:20].to_numpy(), decompressed[100:2000:3][10:20]), "Nested view does not match"
+    assert view[-1] == decompressed[100:2000:3][-1], "Negative index on a view does not match"
+
+    # list indices must select the requested positions, not the first elements
+    indices = [7, 3, 42, -1]
+    assert np.array_equal(np.asarray(cv[indices]), decompressed[indices]), "List indices are not honoured"
+
+    materialized = view.materialize()
+    assert isinstance(materialized, CompressedVector), "materialize should return a CompressedVector"
+    assert np.array_equal(materialized.to_numpy(), view.to_numpy()), "Materialized vector does not match the view"
+
+
+def test_boolean_mask():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(64)
+    cv = CompressedVector(decimal_places, 64)
+    cv.create_vector(len(original_vector))
+    cv.fill_from_vector(original_vector)
+    decompressed = cv.to_numpy()
+    mask = decompressed > np.median(decompressed)
+
+    assert np.array_equal(np.asarray(cv[mask]), decompressed[mask]), "A boolean mask should select the True positions"
+    view = cv[100:2000]
+    assert np.array_equal(np.asarray(view[mask[100:2000]]), decompressed[100:2000][mask[100:2000]]), "Mask on a view does not match"
+    assert np.array_equal(np.asarray((cv.lazy() * 2)[mask]), decompressed[mask] * 2), "Mask on an expression does not match"
+
+    small = CompressedVector(0, 64, get_decompressed=True)
+    small.create_vector(4)
+    small.fill_from_vector([1.0, 2.0, 3.0, 4.0])
+    assert np.array_equal(small[np.array([False, True, False, True])], [2.0, 4.0])
+    with pytest.raises(IndexError):
+        small[np.array([True, False])]
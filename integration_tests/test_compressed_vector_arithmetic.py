@@ -0,0 +1,210 @@
+import operator
+import numpy as np
+import pytest
+from cv_visualization import CompressedVector, CompressedVectorExpression, REPRESENTATIONS
+from utils import build_vector, get_original_vector_and_decimal_places, verify_compressed_vector
+
+# Small chunks so the operations span several of them
+CHUNK_SIZE = 1000
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+def test_in_place_operations(representation):
+    original_vector, _ = get_original_vector_and_decimal_places(16)
+    decimal_places = 4
+    values = np.asarray(original_vector)
+    values[10:20] = np.nan
+    cv = build_vector(values=values, decimal_places=decimal_places, representation=representation)[0]
+    other = np.linspace(-5, 5, len(values)).round(2)
+
+    cv *= 0.5
+    cv += 1.25
+    cv -= other
+    cv /= 2
+    cv._apply_operation(other.tolist(), np.multiply, chunk_size=CHUNK_SIZE)
+
+    expected = values * 0.5
+    expected = np.round(np.round(np.round(expected + 1.25, 4) - other, 4) / 2, 4) * other
+    np.testing.assert_allclose(cv.to_numpy(), expected, atol=1e-3, equal_nan=True)
+    assert cv.max() == pytest.approx(np.nanmax(cv.to_numpy()))
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+def test_in_place_operations_with_vectors(representation):
+    original_vector, decimal_places = get_original_vector_and_decimal_places(16)
+    cv = build_vector(values=original_vector, decimal_places=decimal_places, representation=representation)[0]
+    other = build_vector(values=original_vector[::-1], decimal_places=decimal_places, representation="packed")[0]
+    other.compress("dac_vector")
+
+    cv._apply_operation(other, np.add, chunk_size=CHUNK_SIZE)
+    cv._apply_operation(other[0:len(other)], np.subtract, chunk_size=CHUNK_SIZE)
+    cv += cv
+    cv **= 1
+
+    verify_compressed_vector([2 * value for value in original_vector], decimal_places, cv)
+
+
+def test_in_place_operation_errors():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(16, 100)
+    cv = build_vector(values=original_vector, decimal_places=decimal_places)[0]
+
+    with pytest.raises(ValueError):
+        cv += [1.0, 2.0]
+    with pytest.raises(TypeError):
+        cv += "1"
+    with pytest.raises(ZeroDivisionError):
+        cv /= 0
+    verify_compressed_vector(original_vector, decimal_places, cv)
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+def test_lazy_affine_transform_on_compressed_vector(representation):
+    original_vector, decimal_places = get_original_vector_and_decimal_places(16)
+    values = np.asarray(original_vector)
+    cv = build_vector(values=values, decimal_places=decimal_places, representation=representation)[0]
+    cv.compress("vlc_vector_elias_gamma")
+    parts = [getattr(cv, name) for name in cv._part_names()]
+
+    cv *= -2
+    cv += 1.5
+    cv /= 4
+    cv -= 0.25
+
+    assert [getattr(cv, name) for name in cv._part_names()] == parts, "Scalar operations should not re-encode"
+    assert cv.has_transform()
+    expected = (values * -2 + 1.5) / 4 - 0.25
+    np.testing.assert_allclose(cv.to_numpy(), expected)
+    np.testing.assert_allclose(list(cv), expected)
+    np.testing.assert_allclose(cv[10:20].to_numpy(), expected[10:20])
+    assert cv[7] == pytest.approx(expected[7])
+    assert cv.min(100, 5000) == pytest.approx(expected[100:5000].min())
+    assert cv.max() == pytest.approx(expected.max())
+    assert cv.sum(37, 4321) == pytest.approx(expected[37:4321].sum())
+
+    methods = dict(cv.compression_methods)
+    cv.materialize()
+    assert not cv.has_transform()
+    assert cv.compression_methods == methods
+    np.testing.assert_allclose(cv.to_numpy(), expected, atol=10 ** -decimal_places)
+
+
+def test_write_materializes_transform():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(16, 100)
+    cv = build_vector(values=original_vector, decimal_places=decimal_places)[0]
+    cv += 1
+    cv[0] = 5.0
+
+    assert not cv.has_transform()
+    verify_compressed_vector([5.0] + [value + 1 for value in original_vector[1:]], decimal_places, cv)
+
+
+def test_lazy_expression():
+    size = 5000
+    a, b, c, d = [np.round(np.random.uniform(1, 10, size), 2) for _ in range(4)]
+    cv_a = build_vector(values=a, decimal_places=2)[0]
+    cv_b = build_vector(values=b, decimal_places=2, representation="delta")[0]
+    cv_c = build_vector(values=c, decimal_places=2, representation="packed")[0]
+    cv_c.compress("dac_vector")
+
+    expression = (cv_a.lazy() + cv_b) * cv_c - d
+    assert isinstance(expression, CompressedVectorExpression)
+    assert isinstance(d + cv_a.lazy(), CompressedVectorExpression), "numpy arrays should defer to the expression"
+
+    expected = (a + b) * c - d
+    np.testing.assert_allclose(expression.to_numpy(), expected)
+    np.testing.assert_allclose(list(expression), expected)
+    np.testing.assert_allclose(np.concatenate(list(expression.iter_chunks(CHUNK_SIZE))), expected)
+    np.testing.assert_allclose(expression[10:20], expected[10:20])
+    assert expression[-1] == pytest.approx(expected[-1])
+    np.testing.assert_allclose((2 - cv_a.lazy() / cv_b[0:size]).to_numpy(), 2 - a / b)
+    np.testing.assert_allclose((-cv_a.lazy()).to_numpy(), -a)
+
+    with pytest.raises(ValueError):
+        cv_a.lazy() + d[:10]
+
+
+def test_binary_operators_return_vectors():
+    size = 5000
+    a, b = [np.round(np.random.uniform(1, 10, size), 2) for _ in range(2)]
+    cv_a = build_vector(values=a, decimal_places=2, representation="packed")[0]
+    cv_b = build_vector(values=b, decimal_places=2)[0]
+
+    for result, expected in [
+        (cv_a + cv_b, a + b),
+        (b - cv_a, b - a),
+        (cv_a * 2, a * 2),
+        (3 + cv_a, a + 3),
+        (10 / cv_a, 10 / a),
+        (cv_a ** 2, a ** 2),
+        (-cv_a, -a),
+    ]:
+        assert isinstance(result, CompressedVector)
+        assert result.representation == "packed"
+        np.testing.assert_allclose(result.to_numpy(), expected, atol=1e-2)
+
+    result = cv_a + 1
+    assert result.has_transform() and result.packed_part is cv_a.packed_part, "Scalar operations should not decode"
+    result[0] = 0.5
+    assert result[0] == 0.5 and cv_a[0] == pytest.approx(a[0])
+    result.compress("dac_vector")
+    assert result.size_in_bytes() > 0
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+def test_lazy_expression_compute(representation):
+    size = 5000
+    a, b = [np.round(np.random.uniform(-10, 10, size), 2) for _ in range(2)]
+    cv_a = build_vector(values=a, decimal_places=2, representation=representation)[0]
+    cv_b = build_vector(values=b, decimal_places=2)[0]
+
+    result = (cv_a.lazy() * 2 + cv_b).compute(compress="vlc_vector_elias_gamma", chunk_size=CHUNK_SIZE)
+    assert isinstance(result, CompressedVector)
+    assert result.representation == representation
+    np.testing.assert_allclose(result.to_numpy(), a * 2 + b, atol=1e-2)
+    assert result.max() == pytest.approx(np.max(result.to_numpy()))
+
+    result = (cv_a.lazy() - cv_b).compute(decimal_places=1, representation="packed")
+    assert result.decimal_places == 1 and result.representation == "packed"
+    np.testing.assert_allclose(result.to_numpy(), a - b, atol=0.1)
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+def test_in_place_operation_aliasing(representation):
+    values = np.arange(3000, dtype=np.float64)
+    cv = build_vector(values=values, decimal_places=2, representation=representation)[0]
+
+    cv._apply_operation(cv[::-1], np.add, chunk_size=CHUNK_SIZE)
+    np.testing.assert_allclose(cv.to_numpy(), np.full(3000, 2999.0))
+
+    cv = build_vector(values=values, decimal_places=2, representation=representation)[0]
+    cv._apply_operation(cv.lazy() * 2, np.add, chunk_size=CHUNK_SIZE)
+    np.testing.assert_allclose(cv.to_numpy(), values * 3)
+
+
+def test_failed_division_leaves_vector_unchanged():
+    values = np.arange(1, 3001, dtype=np.float64)
+    cv = build_vector(values=values, decimal_places=2)[0]
+    divisor = np.ones(3000)
+    divisor[-1] = 0
+
+    with pytest.raises(ZeroDivisionError):
+        cv._apply_operation(divisor, operator.truediv, chunk_size=CHUNK_SIZE)
+    np.testing.assert_allclose(cv.to_numpy(), values)
+
+
+def test_division_by_zero_raises_on_every_path():
+    values = np.array([0.0, 1.0, 2.0])
+    cv = build_vector(values=values, decimal_places=2)[0]
+    divisor = np.array([1.0, 0.0, 2.0])
+
+    for divide in (
+        lambda: cv / divisor,
+        lambda: 1 / cv,
+        lambda: cv / cv,
+        lambda: (cv.lazy() / (cv.lazy() + 1 - 1)).compute(),
+        lambda: cv / 0,
+    ):
+        with pytest.raises(ZeroDivisionError):
+            divide()
+    np.testing.assert_allclose(cv.to_numpy(), values)
+    assert np.isinf((1 / cv.lazy()).to_numpy()[0]), "Lazy evaluation to numpy keeps numpy semantics"
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from cv_visualization import CompressedVector, COMPRESSION_METHODS, COMPRESSION_OBJECTIVES
+from utils import get_original_vector_and_decimal_places, verify_compressed_vector
+
+
+@pytest.mark.parametrize("objective", COMPRESSION_OBJECTIVES)
+def test_auto_compression(objective):
+    original_vector, decimal_places = get_original_vector_and_decimal_places(64)
+    cv = CompressedVector(decimal_places, 64)
+    cv.create_vector(len(original_vector))
+    cv.fill_from_vector(original_vector)
+    cv.compress("auto", objective=objective, sample_size=2048)
+    verify_compressed_vector(original_vector, decimal_places, cv)
+
+    for name in ("integer_part", "decimal_part", "sign_part"):
+        assert cv.compression_methods[name] in COMPRESSION_METHODS, f"Unknown method selected for {name}"
+        report = cv.compression_report[name]
+        assert report["method"] == cv.compression_methods[name], "Report does not match the selected method"
+        assert report["ratio"] > 0, "Measured ratio should be positive"
+        assert report["objective"] == objective, "Report should record the objective"
+
+
+def test_auto_compression_size_is_smallest():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(64)
+    cv = CompressedVector(decimal_places, 64)
+    cv.create_vector(len(original_vector))
+    cv.fill_from_vector(original_vector)
+    cv.compress("auto", objective="size")
+
+    for name, report in cv.compression_report.items():
+        smallest = min(trial["size_in_bytes"] for trial in report["trials"].values())
+        assert report["trials"][report["method"]]["size_in_bytes"] == smallest, \
+            f"The smallest method should be selected for {name}"
+
+
+def test_auto_compression_unknown_objective():
+    cv = CompressedVector(2, 64)
+    cv.create_vector(3)
+    cv.fill_from_vector([1.0, 2.0, 3.0])
+    with pytest.raises(ValueError):
+        cv.compress("auto", objective="fastest")
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from cv_visualization import REPRESENTATIONS
+from utils import build_vector
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+def test_block_cache_random_access(representation):
+    cv, expected, _ = build_vector(
+        16, int_width=64, compress_method="vlc_vector_elias_gamma", representation=representation
+    )
+    expected = np.asarray(expected)
+    positions = np.random.randint(0, 3000, 500)
+
+    for position in positions:
+        assert cv[int(position)] == pytest.approx(expected[position])
+    np.testing.assert_allclose(cv[positions[:100]].to_numpy(), expected[positions[:100]])
+    np.testing.assert_allclose(cv[2990:3010].to_numpy(), expected[2990:3010])
+
+    stats = cv.block_cache_stats()
+    assert stats["misses"] == 6, "Each block of the working set should be cached on its second lookup"
+    assert stats["hits"] > 490
+    # Long reads decode directly and leave the cache alone
+    np.testing.assert_allclose(cv.to_numpy(), expected)
+    assert cv.block_cache_stats()["entries"] == 3
+
+
+def test_block_cache_eviction():
+    cv, expected, _ = build_vector(
+        16, int_width=64, compress_method="vlc_vector_elias_gamma", block_cache_bytes=2 * 1024 * 8
+    )
+    for position in (0, 1, 1500, 1501, 3000, 3001, 0, 1):
+        assert cv[position] == pytest.approx(expected[position])
+
+    stats = cv.block_cache_stats()
+    assert stats["entries"] == 2 and stats["evictions"] == 2 and stats["misses"] == 8
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+def test_block_cache_cold_scattered_access(representation):
+    cv, expected, _ = build_vector(
+        16, int_width=64, compress_method="vlc_vector_elias_gamma", representation=representation
+    )
+    expected = np.asarray(expected)
+    decode_stored = cv._decode_stored
+    decoded = []
+    cv._decode_stored = lambda indices: decoded.append(len(indices)) or decode_stored(indices)
+
+    positions = np.arange(0, len(expected), 1024) + 7
+    np.testing.assert_allclose(cv[positions].to_numpy(), expected[positions])
+
+    assert sum(decoded) == len(positions), "A first lookup should only decode the requested values"
+    assert cv.block_cache_stats()["entries"] == 0
+    for position in positions + 3:
+        assert cv[int(position)] == pytest.approx(expected[position])
+    assert cv.block_cache_stats()["entries"] == len(positions), "A block should be cached on its second lookup"
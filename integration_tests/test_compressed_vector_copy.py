@@ -0,0 +1,78 @@
+import copy
+import pickle
+import numpy as np
+import pytest
+from cv_visualization import CompressedVector, REPRESENTATIONS
+from utils import build_vector, verify_compressed_vector
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+def test_copy_on_write(representation):
+    cv, original_vector, decimal_places = build_vector(16, int_width=64, representation=representation)
+    cv_copy = copy.copy(cv)
+
+    assert all(getattr(cv_copy, name) is getattr(cv, name) for name in cv._part_names()), "Copies share their parts"
+    cv_copy[0] = 1.25
+    cv_copy += np.ones(len(cv))
+    assert all(getattr(cv_copy, name) is not getattr(cv, name) for name in cv._part_names())
+
+    verify_compressed_vector(original_vector, decimal_places, cv)
+    verify_compressed_vector([2.25] + [value + 1 for value in original_vector[1:]], decimal_places, cv_copy)
+    assert cv_copy.max() == pytest.approx(np.max(cv_copy.to_numpy()))
+
+    cv[1] = -3.5
+    assert cv_copy[1] == pytest.approx(original_vector[1] + 1)
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+def test_deepcopy(representation):
+    cv, original_vector, decimal_places = build_vector(16, int_width=64, representation=representation)
+    cv_copy = copy.deepcopy(cv)
+
+    assert all(getattr(cv_copy, name) is not getattr(cv, name) for name in cv._part_names())
+    cv[0] = 1.25
+    verify_compressed_vector(original_vector, decimal_places, cv_copy)
+
+
+def test_copy_compressed_vector():
+    cv, original_vector, decimal_places = build_vector(
+        16, int_width=64, compress_method="vlc_vector_elias_gamma", representation="packed"
+    )
+    cv *= 2
+
+    for cv_copy in (cv.copy(), cv.copy(copy_on_write=False)):
+        assert cv_copy.compression_methods == cv.compression_methods
+        assert cv_copy.size_in_bytes() == cv.size_in_bytes()
+        np.testing.assert_allclose(cv_copy.to_numpy(), np.asarray(original_vector) * 2)
+
+
+def test_deepcopy_parts():
+    cv, original_vector, decimal_places = build_vector(16, int_width=64, compress_method="vlc_vector_elias_gamma")
+    cv_copy = copy.deepcopy(cv)
+    assert all(getattr(cv_copy, name) is getattr(cv, name) for name in cv._part_names()), "Compressed parts cannot be written and are shared"
+
+    cv = CompressedVector(decimal_places, "auto")
+    cv.create_vector(len(original_vector))
+    cv.fill_from_vector(original_vector)
+    cv.bit_compress()
+    cv_copy = copy.deepcopy(cv)
+
+    assert cv_copy.part_widths() == cv.part_widths()
+    cv[0] = 1.25
+    verify_compressed_vector(original_vector, decimal_places, cv_copy)
+    assert cv[0] == 1.25
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+def test_pickle_round_trip(representation):
+    cv, original_vector, decimal_places = build_vector(16, int_width=64, representation=representation)
+    cv.compress({cv._part_names()[0]: "dac_vector"})
+    cv *= 2
+    state = cv.__getstate__()
+    assert all(type(value).__module__ != "sdsl4py" for value in state.values()), "sdsl vectors cannot be pickled"
+
+    cv_copy = pickle.loads(pickle.dumps(cv))
+    assert cv_copy.compression_methods == cv.compression_methods
+    assert cv_copy.part_widths() == cv.part_widths()
+    np.testing.assert_allclose(cv_copy.to_numpy(), np.asarray(original_vector) * 2)
+    assert cv_copy.max() == pytest.approx(cv.max())
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from cv_visualization import CompressedVector, COMPRESSION_METHODS
+
+DECIMAL_PLACES = 4
+all_compression_methods = [method for method in COMPRESSION_METHODS if COMPRESSION_METHODS[method] is not None]
+
+
+def get_time_axis(size=10000):
+    # Monotonic, slightly irregular time axis like the bridge sensor files
+    time_axis = np.round(1000 + np.cumsum(np.random.uniform(0.0009, 0.0011, size)), DECIMAL_PLACES)
+    time_axis[[3, 500]] = np.nan
+    return time_axis
+
+
+@pytest.mark.parametrize("representation", ["delta", "delta_of_delta"])
+@pytest.mark.parametrize("compress_method", all_compression_methods)
+def test_delta_representation(representation, compress_method):
+    time_axis = get_time_axis()
+    cv = CompressedVector(DECIMAL_PLACES, 64, representation=representation, checkpoint_interval=64)
+    cv.create_vector(len(time_axis))
+    cv.fill_from_vector(time_axis)
+    cv.compress(compress_method)
+
+    assert np.array_equal(cv.to_numpy(), time_axis, equal_nan=True), "Decompressed values do not match"
+    assert cv[-1] == time_axis[-1], "Random access does not match"
+    assert np.isnan(cv[500]), "NaN should survive the delta encoding"
+    assert np.array_equal(cv[1000:2000:3].to_numpy(), time_axis[1000:2000:3]), "Slice does not match"
+    chunks = np.concatenate(list(cv.iter_chunks(chunk_size=100, start=70, end=9000)))
+    assert np.array_equal(chunks, time_axis[70:9000], equal_nan=True), "Chunks do not match"
+
+
+@pytest.mark.parametrize("representation", ["delta", "delta_of_delta"])
+def test_delta_representation_set_item(representation):
+    time_axis = get_time_axis(1000)
+    cv = CompressedVector(DECIMAL_PLACES, 64, representation=representation, checkpoint_interval=64)
+    cv.create_vector(len(time_axis))
+    cv.fill_from_vector(time_axis)
+
+    cv[100] = -5.5
+    time_axis[100] = -5.5
+    assert np.array_equal(cv.to_numpy(), time_axis, equal_nan=True), "Values after set item do not match"
+
+
+def test_delta_representation_is_smaller():
+    time_axis = get_time_axis()
+    report = CompressedVector.compare_representations(time_axis, DECIMAL_PLACES, 64, "vlc_vector_elias_gamma")
+    assert report["delta"]["size_in_bytes"] < report["packed"]["size_in_bytes"], \
+        "Delta encoding should shrink a monotonic time axis"
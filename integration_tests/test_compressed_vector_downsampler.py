@@ -1,9 +1,10 @@
+import os
 import pytest
 import numpy as np
 
-from cv_visualization import CompressedVectorDownsampler as cvd
+from cv_visualization import CompressedVector, CompressedVectorDownsampler as cvd
 from cv_visualization import DOWNSAMPLERS, COMPRESSION_METHODS
-from utils import get_original_vector_and_decimal_places, verify_compressed_vector
+from utils import build_vector, get_original_vector_and_decimal_places, verify_compressed_vector
 
 INT_WIDTH = 64
 
@@ -32,3 +33,177 @@ def test_compressed_vector_downsampler(ts_method, compress_method):
         decimal_places=decimal_places,
         compressed_vector=downsampled_y
     )
+
+
+@pytest.mark.parametrize("ts_method", ["MinMaxLTTBDownsampler", "M4Downsampler", "LTTBDownsampler"])
+def test_downsampler_x_range(ts_method):
+    original_vector, decimal_places = get_original_vector_and_decimal_places(INT_WIDTH)
+    y = np.asarray(original_vector, dtype=np.float64)
+    x = np.arange(len(y), dtype=np.float64) * 0.5
+
+    cv_downsampler = cvd()
+    downsampled_x, downsampled_y = cv_downsampler.downsample(
+        x=x,
+        y=y,
+        n_out=100,
+        method=ts_method,
+        decimal_places=decimal_places,
+        x_range=(1000.0, 3000.0)
+    )
+
+    indices = cv_downsampler.get_y_indices()
+    assert indices.min() >= 2000 and indices.max() <= 6000, "Only the visible range should be downsampled"
+    verify_compressed_vector(x[indices], decimal_places, downsampled_x)
+    verify_compressed_vector(y[indices], decimal_places, downsampled_y)
+
+
+def test_downsampler_x_range_compressed_x():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(INT_WIDTH)
+    y = np.asarray(original_vector, dtype=np.float64)
+    x, _, _ = build_vector(
+        values=np.arange(len(y)) * 0.25, decimal_places=2, compress_method="dac_vector", representation="delta"
+    )
+
+    cv_downsampler = cvd()
+    downsampled_x, _ = cv_downsampler.downsample(x=x, y=y, n_out=10, decimal_places=decimal_places, x_range=(10.0, 12.0))
+
+    # 9 visible points are fewer than n_out, all of them are returned
+    np.testing.assert_array_equal(cv_downsampler.get_x_indices(), np.arange(40, 49))
+    np.testing.assert_allclose(downsampled_x.to_numpy(), np.arange(40, 49) * 0.25)
+
+
+def test_downsampler_x_range_invalid():
+    y = np.arange(100, dtype=np.float64)
+    with pytest.raises(ValueError):
+        cvd().downsample(y=y, n_out=10, x_range=(0, 10))
+    with pytest.raises(ValueError):
+        cvd().downsample(x=y, y=y, n_out=10, x_range=(10, 0))
+
+
+@pytest.mark.parametrize("ts_method", all_methods)
+def test_downsampler_compressed_inputs(ts_method):
+    original_vector, decimal_places = get_original_vector_and_decimal_places(INT_WIDTH, vector_size=50000)
+    y = np.round(np.asarray(original_vector, dtype=np.float64), decimal_places)
+    y[1000:1010] = np.nan
+    x = np.arange(len(y), dtype=np.float64)
+    cv_x, _, _ = build_vector(values=x, decimal_places=0, int_width=INT_WIDTH, compress_method="dac_vector")
+    cv_y, _, _ = build_vector(
+        values=y, decimal_places=decimal_places, int_width=INT_WIDTH, compress_method="dac_vector"
+    )
+
+    cv_downsampler = cvd()
+    downsampled_x, downsampled_y = cv_downsampler.downsample(
+        x=cv_x,
+        y=cv_y,
+        n_out=100,
+        method=ts_method,
+        decimal_places=decimal_places
+    )
+
+    indices = cv_downsampler.get_y_indices()
+    assert len(indices) <= 100
+    np.testing.assert_allclose(downsampled_x.to_numpy(), x[indices])
+    np.testing.assert_allclose(downsampled_y.to_numpy(), y[indices])
+    if ts_method in ("M4Downsampler", "MinMaxDownsampler"):
+        assert np.nanmin(y) in downsampled_y.to_numpy() and np.nanmax(y) in downsampled_y.to_numpy(), \
+            "The extremes of the series should be kept"
+
+
+def test_downsampler_compressed_y_only():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(INT_WIDTH, vector_size=50000)
+    y = np.round(np.asarray(original_vector, dtype=np.float64), decimal_places)
+    cv_y, _, _ = build_vector(
+        values=y, decimal_places=decimal_places, int_width=INT_WIDTH, compress_method="dac_vector"
+    )
+
+    cv_downsampler = cvd()
+    downsampled_y = cv_downsampler.downsample(
+        y=cv_y[100:40000],
+        n_out=200,
+        method="M4Downsampler",
+        decimal_places=decimal_places
+    )
+    window = y[100:40000]
+    indices = cv_downsampler.get_y_indices()
+    np.testing.assert_allclose(downsampled_y.to_numpy(), window[indices])
+    assert window.min() in downsampled_y.to_numpy() and window.max() in downsampled_y.to_numpy()
+
+
+@pytest.mark.parametrize("align", ["union", "per-series"])
+def test_downsample_many(align):
+    original_vector, decimal_places = get_original_vector_and_decimal_places(INT_WIDTH)
+    x = np.arange(len(original_vector), dtype=np.float64)
+    cv_cos, _, _ = build_vector(
+        values=np.cos(x / 80), decimal_places=decimal_places, int_width=INT_WIDTH, compress_method="dac_vector"
+    )
+    ys = {
+        "ch1": np.asarray(original_vector, dtype=np.float64),
+        "ch2": np.sin(x / 50),
+        "ch3": cv_cos,
+    }
+    expected = {"ch1": ys["ch1"], "ch2": ys["ch2"], "ch3": np.cos(x / 80)}
+
+    cv_downsampler = cvd()
+    result_x, result_y = cv_downsampler.downsample_many(
+        x, ys, n_out=200, method="M4Downsampler", decimal_places=decimal_places, align=align
+    )
+    assert set(result_y) == set(ys)
+
+    if align == "union":
+        union = cv_downsampler.get_x_indices()
+        verify_compressed_vector(x[union], decimal_places, result_x)
+        for name, cv_y in result_y.items():
+            assert len(cv_y) == len(union), "Every series should share the union x"
+            verify_compressed_vector(expected[name][union], decimal_places, cv_y)
+    else:
+        for name, cv_y in result_y.items():
+            indices = result_x[name]
+            assert len(indices) <= 200
+            verify_compressed_vector(expected[name][indices], decimal_places, cv_y)
+
+
+def test_downsample_many_invalid():
+    x = np.arange(100, dtype=np.float64)
+    with pytest.raises(ValueError):
+        cvd().downsample_many(x, {"a": x}, n_out=10, align="intersection")
+    with pytest.raises(ValueError):
+        cvd().downsample_many(x, {}, n_out=10)
+    with pytest.raises(ValueError):
+        cvd().downsample_many(x, {"a": x[:50]}, n_out=10)
+
+
+TEST_FILE = os.path.join(os.path.dirname(__file__), "test_input", "test.txt")
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_downsample_batch(executor):
+    original_vector, decimal_places = get_original_vector_and_decimal_places(INT_WIDTH)
+    y = np.asarray(original_vector, dtype=np.float64)
+    x = np.arange(len(y), dtype=np.float64)
+    jobs = [
+        {"x": x, "y": y, "n_out": 100, "decimal_places": decimal_places},
+        (x, -y, {"n_out": 48, "method": "M4Downsampler", "decimal_places": decimal_places}),
+        {"file_path": TEST_FILE, "column": 2, "truncate": 5000, "n_out": 200, "decimal_places": 3},
+    ]
+
+    results = cvd().downsample_batch(jobs, max_workers=3, executor=executor)
+    assert len(results) == len(jobs)
+
+    for result, expected_y in zip(results[:2], (y, -y)):
+        downsampled_x, downsampled_y = result["result"]
+        assert isinstance(downsampled_y, CompressedVector) and downsampled_y.compression_methods
+        verify_compressed_vector(x[result["x_indices"]], decimal_places, downsampled_x)
+        verify_compressed_vector(expected_y[result["y_indices"]], decimal_places, downsampled_y)
+        assert result["seconds"] >= result["read_seconds"] >= 0
+    assert len(results[1]["y_indices"]) <= 48, "Results should be in submission order"
+
+    _, file_y = results[2]["result"]
+    assert len(file_y) <= 200
+    assert results[2]["read_seconds"] > 0
+
+
+def test_downsample_batch_invalid():
+    with pytest.raises(ValueError):
+        cvd().downsample_batch([], executor="gpu")
+    with pytest.raises(TypeError):
+        cvd().downsample_batch([42], executor="thread")
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+import sdsl4py
+from cv_visualization import CompressedVector
+from utils import get_original_vector_and_decimal_places, verify_compressed_vector
+
+
+def test_auto_int_width():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(16)
+    cv = CompressedVector(decimal_places, "auto")
+    cv.create_vector(len(original_vector))
+    cv.fill_from_vector(original_vector)
+    verify_compressed_vector(original_vector, decimal_places, cv)
+
+    # values in [-100, 100] with 2 decimal places fit in 8 bits per part
+    assert cv.part_widths() == {"integer_part": 8, "decimal_part": 8, "sign_part": 8}, \
+        f"Unexpected widths {cv.part_widths()}"
+    assert type(cv.integer_part) == sdsl4py.int_vector_8, "Integer part should be of type int_vector_8"
+
+
+def test_auto_int_width_promotion():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(16)
+    cv = CompressedVector(decimal_places, "auto")
+    cv.create_vector(len(original_vector))
+    cv.fill_from_vector(original_vector)
+
+    cv[0] = 123456.78
+    assert cv.part_widths()["integer_part"] == 32, "Integer part should be widened to 32 bits"
+    assert cv[0] == 123456.78, "Widened value does not match"
+    assert round(cv[1], decimal_places) == round(original_vector[1], decimal_places), \
+        "Existing values should survive the widening"
+
+
+def test_fixed_int_width_overflow():
+    cv = CompressedVector(2, 8)
+    cv.create_vector(3)
+    with pytest.raises(OverflowError):
+        cv.fill_from_vector([1.0, 300.0, 2.0])
+
+
+@pytest.mark.parametrize("int_width", [8, 12])
+def test_fixed_int_width_overflow_single_value(int_width):
+    cv = CompressedVector(0, int_width)
+    cv.create_vector(3)
+    cv.fill_from_vector([1.0, 2.0, 3.0])
+    with pytest.raises(OverflowError):
+        cv[0] = 5000.0
+    assert cv.to_numpy().tolist() == [1.0, 2.0, 3.0], "A failed write should leave the vector unchanged"
+
+
+def test_bit_compress():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(16)
+    cv = CompressedVector(decimal_places, 64)
+    cv.create_vector(len(original_vector))
+    cv.fill_from_vector(original_vector)
+    widths = cv.bit_compress()
+
+    assert widths == cv.part_widths()
+    assert widths["sign_part"] == 1, "Sign part without NaN should need a single bit"
+    assert np.allclose(cv.to_numpy(), np.round(original_vector, decimal_places)), "Values do not match"
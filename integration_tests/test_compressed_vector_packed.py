@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+import sdsl4py
+from cv_visualization import CompressedVector, COMPRESSION_METHODS, REPRESENTATIONS
+from utils import get_original_vector_and_decimal_places, verify_compressed_vector
+
+all_compression_methods = [method for method in COMPRESSION_METHODS if COMPRESSION_METHODS[method] is not None]
+
+
+@pytest.mark.parametrize("width", [16, 32, 64])
+def test_packed_representation(width):
+    original_vector, decimal_places = get_original_vector_and_decimal_places(width)
+    cv = CompressedVector(decimal_places, 64, representation="packed")
+    cv.create_vector(len(original_vector))
+    cv.fill_from_vector(original_vector)
+    verify_compressed_vector(original_vector, decimal_places, cv)
+
+    assert type(cv.packed_part) == sdsl4py.int_vector_64, "Packed vector should be of type int_vector_64"
+
+
+@pytest.mark.parametrize("compress_method", all_compression_methods)
+def test_packed_representation_compressed(compress_method):
+    original_vector, decimal_places = get_original_vector_and_decimal_places(64)
+    original_vector = original_vector + [float('nan'), -1.5]
+    cv = CompressedVector(decimal_places, 64, representation="packed")
+    cv.create_vector(len(original_vector))
+    cv.fill_from_vector(original_vector)
+    cv.compress(compress_method)
+
+    decompressed = cv.to_numpy()
+    assert np.isnan(decompressed[-2]), "NaN should survive the packed representation"
+    assert np.isnan(cv[-2]), "NaN should survive random access"
+    assert np.allclose(decompressed[:-2], np.round(original_vector[:-2], decimal_places)), "Packed values do not match"
+    assert decompressed[-1] == -1.5, "Negative values should survive the zigzag encoding"
+
+
+def test_compare_representations():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(64)
+    report = CompressedVector.compare_representations(original_vector, decimal_places, 64, "dac_vector")
+
+    assert set(report) == set(REPRESENTATIONS), "Every representation should be reported"
+    for representation, sizes in report.items():
+        assert sizes["size_in_bytes"] > 0, f"Size in bytes should be positive for {representation}"
+        assert sizes["compression_ratio"] > 0, f"Compression ratio should be positive for {representation}"
@@ -0,0 +1,96 @@
+import pickle
+import pytest
+from cv_visualization import RunLengthVector
+from cv_visualization.run_length_vector import run_length_vector
+from utils import build_vector, verify_compressed_vector
+
+
+@pytest.mark.parametrize("width", [8, 16, 32, 64])
+def test_per_part_compression(width):
+    cv, original_vector, decimal_places = build_vector(width)
+    cv.compress({"integer": "dac_vector", "decimal": "vlc_vector_fibonacci", "sign": "rle"})
+    verify_compressed_vector(original_vector, decimal_places, cv)
+
+    assert cv.compression_methods == {
+        "integer_part": "dac_vector",
+        "decimal_part": "vlc_vector_fibonacci",
+        "sign_part": "rle",
+    }
+    assert isinstance(cv.sign_part, RunLengthVector), "The sign part should be run-length encoded"
+
+
+def test_per_part_compression_leaves_unmapped_parts():
+    cv, original_vector, decimal_places = build_vector(64)
+    cv.compress({"sign_part": "rle", "integer": "auto"})
+    verify_compressed_vector(original_vector, decimal_places, cv)
+
+    assert cv.compression_methods["decimal_part"] == "No Compression"
+    assert cv.part_widths()["decimal_part"] == 64, "Unmapped parts should not be compressed"
+    assert set(cv.compression_report) == {"integer_part"}, "Only the auto part should be measured"
+
+
+def test_per_part_compression_in_several_calls():
+    cv, original_vector, decimal_places = build_vector(64)
+    cv.compress({"integer": "dac_vector"})
+    cv.compress({"decimal": "dac_vector"})
+    verify_compressed_vector(original_vector, decimal_places, cv)
+
+    assert cv.compression_methods == {
+        "integer_part": "dac_vector",
+        "decimal_part": "dac_vector",
+        "sign_part": "No Compression",
+    }, "Parts left out of a call should keep their method"
+    verify_compressed_vector(original_vector, decimal_places, pickle.loads(pickle.dumps(cv)))
+    with pytest.raises(ValueError):
+        cv.compress({"integer": "vlc_vector_elias_gamma"})
+
+    cv += 1
+    cv.materialize()
+    assert cv.part_widths()["integer_part"] is None, "materialize() should compress the parts again"
+    verify_compressed_vector([value + 1 for value in original_vector], decimal_places, cv)
+
+
+def test_per_part_compression_packed():
+    cv, original_vector, decimal_places = build_vector(64, representation="packed")
+    cv.compress({"packed": "dac_vector"})
+    verify_compressed_vector(original_vector, decimal_places, cv)
+
+
+def test_per_part_compression_unknown_part():
+    cv, _, _ = build_vector(8)
+    with pytest.raises(ValueError):
+        cv.compress({"packed": "dac_vector"})
+
+
+def test_size_in_bytes_per_part():
+    cv, _, _ = build_vector(64)
+    cv.compress({"sign": "rle"})
+    sizes = cv.size_in_bytes(per_part=True)
+    assert set(sizes) == {"integer_part", "decimal_part", "sign_part"}
+    assert sum(sizes.values()) == cv.size_in_bytes()
+    assert sizes["sign_part"] < sizes["integer_part"], "The run-length encoded sign part should be the smallest"
+
+
+def test_run_length_vector():
+    values = [0, 0, 0, 1, 1, 0, 5, 5, 5, 5]
+    rle = RunLengthVector(values)
+    assert len(rle) == len(values)
+    assert list(rle) == values
+    assert [rle[i] for i in range(len(values))] == values
+    assert rle[-1] == 5
+    with pytest.raises(IndexError):
+        rle[len(values)]
+    assert len(RunLengthVector([])) == 0
+
+
+def test_run_length_vector_without_buffer_protocol(monkeypatch):
+    def no_buffer(vector):
+        raise TypeError("memoryview: a bytes-like object is required")
+
+    # Vectors that do not expose the buffer protocol are read and written element by element
+    monkeypatch.setattr(run_length_vector, "memoryview", no_buffer, raising=False)
+    values = [0, 0, 0, 1, 1, 0, 5, 5, 5, 5]
+    rle = RunLengthVector(values)
+    assert list(rle) == values
+    assert [rle[i] for i in range(len(values))] == values
+    assert list(pickle.loads(pickle.dumps(rle))) == values
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from cv_visualization import REPRESENTATIONS
+from utils import build_vector
+
+SUMMARY_BLOCK_SIZE = 256
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+@pytest.mark.parametrize("start, end", [(0, None), (37, 5000), (300, 400), (90, 120), (512, 768)])
+def test_zone_map_summary(representation, start, end):
+    cv, values, decimal_places = build_vector(
+        nan_range=(100, 110), compress_method="dac_vector", representation=representation, summary_block_size=SUMMARY_BLOCK_SIZE
+    )
+    expected = np.round(np.asarray(values), decimal_places)
+    window = expected[start:end]
+    summary = cv.summary(start, end)
+
+    assert summary["min"] == pytest.approx(np.nanmin(window))
+    assert summary["max"] == pytest.approx(np.nanmax(window))
+    assert summary["sum"] == pytest.approx(np.nansum(window))
+    assert summary["nan_count"] == np.isnan(window).sum()
+    assert summary["count"] == len(window) - np.isnan(window).sum()
+    assert cv.mean(start, end) == pytest.approx(np.nanmean(window))
+
+
+def test_zone_map_without_summaries():
+    cv, values, decimal_places = build_vector(
+        nan_range=(100, 110), compress_method="dac_vector", summary_block_size=None
+    )
+    expected = np.round(np.asarray(values), decimal_places)
+    assert "zone_map" not in cv.size_in_bytes(per_part=True)
+    assert cv.min() == pytest.approx(np.nanmin(expected))
+    assert cv.max(10, 20) == pytest.approx(np.nanmax(expected[10:20]))
+
+
+def test_zone_map_all_nan_range():
+    cv, _, _ = build_vector(nan_range=(100, 110), compress_method="dac_vector", summary_block_size=SUMMARY_BLOCK_SIZE)
+    summary = cv.summary(100, 110)
+    assert np.isnan(summary["min"]) and np.isnan(summary["max"])
+    assert summary["count"] == 0 and summary["nan_count"] == 10
+    assert np.isnan(cv.mean(100, 110))
+
+
+def test_zone_map_follows_updates():
+    cv, values, decimal_places = build_vector(nan_range=(100, 110), summary_block_size=SUMMARY_BLOCK_SIZE)
+    expected = np.round(np.asarray(values), decimal_places)
+    cv[700] = 1e6
+    cv += 0
+    assert cv.max() == 1e6
+    assert cv.max(0, 512) == pytest.approx(np.nanmax(expected[:512]))
+
+    cv += 5
+    assert cv.max() == pytest.approx(1e6 + 5), "The zone map should reflect the pending transform"
+    cv *= -1
+    assert cv.min() == pytest.approx(-1e6 - 5)
+    assert cv.sum(0, 512) == pytest.approx(-np.nansum(expected[:512] + 5))
+
+
+def test_zone_map_follows_array_updates():
+    cv, values, decimal_places = build_vector(nan_range=(100, 110), summary_block_size=SUMMARY_BLOCK_SIZE)
+    expected = np.round(np.asarray(values), decimal_places)
+    cv += np.arange(len(cv), dtype=np.float64)
+    expected = expected + np.arange(len(expected))
+    assert cv.max() == pytest.approx(np.nanmax(expected))
+    assert cv.summary(37, 5000)["sum"] == pytest.approx(np.nansum(expected[37:5000]))
+
+
+def test_envelope():
+    cv, values, decimal_places = build_vector(
+        nan_range=(100, 110), compress_method="dac_vector", summary_block_size=SUMMARY_BLOCK_SIZE
+    )
+    expected = np.round(np.asarray(values), decimal_places)
+    mins, maxs = cv.envelope(10, 1000, 9000)
+    for i, (bin_start, bin_end) in enumerate(zip(range(1000, 9000, 800), range(1800, 9001, 800))):
+        assert mins[i] == pytest.approx(np.nanmin(expected[bin_start:bin_end]))
+        assert maxs[i] == pytest.approx(np.nanmax(expected[bin_start:bin_end]))
+
+    with pytest.raises(ValueError):
+        cv.envelope(0)
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from cv_visualization import CompressedVectorDownsampler as cvd, DownsampleCache
+from utils import DECIMAL_PLACES, build_vector, get_series, verify_compressed_vector
+
+
+def test_downsample_cache_hit():
+    x, y = get_series()
+    decimal_places = DECIMAL_PLACES
+    cache = DownsampleCache()
+    cv_downsampler = cvd(cache=cache)
+
+    first_x, first_y = cv_downsampler.downsample(x=x, y=y, n_out=100, decimal_places=decimal_places)
+    first_indices = cv_downsampler.get_y_indices()
+    second_x, second_y = cv_downsampler.downsample(x=x, y=y.copy(), n_out=100, decimal_places=decimal_places)
+
+    np.testing.assert_array_equal(second_y.to_numpy(), first_y.to_numpy())
+    np.testing.assert_array_equal(cv_downsampler.get_y_indices(), first_indices)
+    verify_compressed_vector(y[first_indices], decimal_places, second_y)
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+    assert cache.size_in_bytes > 0
+
+
+def test_downsample_cache_results_are_copies():
+    x, y = get_series()
+    decimal_places = DECIMAL_PLACES
+    cv_downsampler = cvd(cache=DownsampleCache())
+
+    first_x, first_y = cv_downsampler.downsample(x=x, y=y, n_out=100, decimal_places=decimal_places)
+    expected = first_y.to_numpy()
+    first_y *= 1000
+    first_x.destroy()
+
+    second_x, second_y = cv_downsampler.downsample(x=x, y=y, n_out=100, decimal_places=decimal_places)
+    third_x, third_y = cv_downsampler.downsample(x=x, y=y, n_out=100, decimal_places=decimal_places)
+    second_y += 1
+    np.testing.assert_array_equal(third_y.to_numpy(), expected)
+    assert len(third_x) == len(expected)
+    assert cv_downsampler.cache.stats()["hits"] == 2
+
+
+def test_downsample_cache_key_parameters():
+    x, y = get_series()
+    decimal_places = DECIMAL_PLACES
+    cache = DownsampleCache()
+    cv_downsampler = cvd(cache=cache)
+
+    cv_downsampler.downsample(x=x, y=y, n_out=100, decimal_places=decimal_places)
+    cv_downsampler.downsample(x=x, y=y, n_out=200, decimal_places=decimal_places)
+    cv_downsampler.downsample(x=x, y=y, n_out=100, decimal_places=decimal_places, method="M4Downsampler")
+    cv_downsampler.downsample(x=x, y=y + 1, n_out=100, decimal_places=decimal_places)
+    assert cache.stats()["misses"] == 4 and len(cache) == 4
+
+
+def test_downsample_cache_explicit_key():
+    x, y = get_series()
+    decimal_places = DECIMAL_PLACES
+    cache = DownsampleCache()
+    cv_y, _, _ = build_vector(values=y, decimal_places=decimal_places)
+
+    cv_downsampler = cvd(cache=cache)
+    cv_downsampler.downsample(y=cv_y, n_out=100, decimal_places=decimal_places, cache_key="series-1@v1")
+    cv_downsampler.downsample(y=cv_y, n_out=100, decimal_places=decimal_places, cache_key="series-1@v1")
+    cv_downsampler.downsample(y=cv_y, n_out=100, decimal_places=decimal_places, cache_key="series-1@v2")
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+
+def test_downsample_cache_lru_eviction():
+    cache = DownsampleCache(max_bytes=100)
+    cache.put("a", 1, 40)
+    cache.put("b", 2, 40)
+    assert cache.get("a") == 1
+    cache.put("c", 3, 40)
+
+    assert "b" not in cache, "The least recently used entry should be evicted"
+    assert "a" in cache and "c" in cache
+    assert cache.size_in_bytes == 80 and cache.stats()["evictions"] == 1
+    assert not cache.put("d", 4, 200), "Entries larger than the budget should not be stored"
+
+
+def test_downsample_cache_fingerprint():
+    values = np.arange(1000, dtype=np.float64)
+    assert DownsampleCache.fingerprint(values) == DownsampleCache.fingerprint(values.copy())
+    assert DownsampleCache.fingerprint(values) != DownsampleCache.fingerprint(values[:-1])
+    assert DownsampleCache.fingerprint(list(values)) != DownsampleCache.fingerprint(values)
+    with pytest.raises(ValueError):
+        DownsampleCache(max_bytes=0)
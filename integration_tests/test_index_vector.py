@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from cv_visualization import CompressedVectorDownsampler as cvd, IndexVector
+from utils import get_original_vector_and_decimal_places
+
+
+def test_index_vector_numpy_compatible():
+    indices = np.array([0, 3, 4, 10, 500, 501, 100000], dtype=np.int64)
+    index_vector = IndexVector(indices)
+
+    assert len(index_vector) == len(indices) and index_vector.shape == indices.shape
+    np.testing.assert_array_equal(np.asarray(index_vector), indices)
+    assert np.asarray(index_vector).dtype == np.int64
+    assert index_vector[3] == 10 and index_vector[-1] == 100000
+    np.testing.assert_array_equal(index_vector[2:5], indices[2:5])
+    np.testing.assert_array_equal(index_vector[[0, 6]], indices[[0, 6]])
+    assert list(index_vector) == indices.tolist()
+    assert index_vector.min() == 0 and index_vector.max() == 100000
+
+    values = np.arange(100001, dtype=np.float64) * 2
+    np.testing.assert_array_equal(values[index_vector], values[indices])
+
+
+def test_index_vector_rejects_negative():
+    with pytest.raises(ValueError):
+        IndexVector([1, -2, 3])
+
+
+def test_index_vector_empty():
+    index_vector = IndexVector([])
+    assert len(index_vector) == 0
+    assert np.asarray(index_vector).dtype == np.int64 and len(np.asarray(index_vector)) == 0
+    with pytest.raises(ValueError):
+        index_vector.min()
+
+
+def test_downsampler_indices_are_compressed():
+    original_vector, decimal_places = get_original_vector_and_decimal_places(64)
+    y = np.asarray(original_vector, dtype=np.float64)
+    cv_downsampler = cvd()
+    cv_downsampler.downsample(y=y, n_out=1000, decimal_places=decimal_places)
+    indices = cv_downsampler.get_y_indices_compressed()
+
+    assert isinstance(indices, IndexVector)
+    assert isinstance(cv_downsampler.get_y_indices(), np.ndarray)
+    np.testing.assert_array_equal(cv_downsampler.get_y_indices(), np.asarray(indices))
+    assert indices.size_in_bytes() < np.asarray(indices).nbytes, "Sorted indices should compress below int64"
+    assert np.all(np.diff(np.asarray(indices)) > 0)
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from cv_visualization import AffineAxis, LODPyramid
+from utils import build_vector, get_series
+
+N = 50000
+
+
+@pytest.mark.parametrize("method, points_per_bin", [("m4", 4), ("minmax", 2)])
+def test_lod_pyramid_query(method, points_per_bin):
+    x, y = get_series(N, decimal_places=2, seed=7)
+    pyramid = LODPyramid(y, x, method=method, chunk_size=4096)
+    n_out = 100
+
+    x_out, y_out = pyramid.query(x[1000], x[41000], n_out)
+    max_points = points_per_bin * n_out + 4 * points_per_bin * np.log2(N)
+    assert len(x_out) <= max_points, "A query should read about points_per_bin * n_out points"
+    window = y[1000:41001]
+    assert y_out.min() == window.min() and y_out.max() == window.max(), "The extremes of the viewport should be kept"
+    assert x_out[0] == x[1000] and x_out[-1] == x[41000]
+    assert np.all(np.diff(x_out) > 0)
+    np.testing.assert_array_equal(y_out, y[np.searchsorted(x, x_out)])
+
+    x_out, y_out = pyramid.query(n_out=n_out)
+    assert y_out.min() == y.min() and y_out.max() == y.max(), "The extremes of the series should be kept"
+
+
+def test_lod_pyramid_levels():
+    _, y = get_series(N, decimal_places=2, seed=7)
+    pyramid = LODPyramid(y)
+    bin_sizes = [bin_size for bin_size, _ in pyramid.levels]
+    assert bin_sizes[0] == 8
+    assert all(b == 2 * a for a, b in zip(bin_sizes, bin_sizes[1:]))
+    assert len(pyramid.levels[-1][1]) == 4, "The coarsest level should be a single bin"
+    assert pyramid.size_in_bytes() > 0
+
+
+def test_lod_pyramid_small_viewport_is_raw():
+    x, y = get_series(N, decimal_places=2, seed=7)
+    pyramid = LODPyramid(y, x)
+    x_out, y_out = pyramid.query(x[100], x[299], n_out=100)
+    np.testing.assert_array_equal(x_out, x[100:300])
+    np.testing.assert_array_equal(y_out, y[100:300])
+
+
+def test_lod_pyramid_compressed_inputs():
+    _, y = get_series(N, decimal_places=2, seed=7)
+    y[5000:5100] = np.nan
+    cv_y, _, _ = build_vector(values=y, decimal_places=2, compress_method="dac_vector")
+    axis = AffineAxis(0.0, 0.5, N)
+
+    pyramid = LODPyramid(cv_y, axis)
+    x_out, y_out = pyramid.query(1000.0, 20000.0, 50)
+    assert x_out[0] == 1000.0 and x_out[-1] == 20000.0
+    np.testing.assert_allclose(y_out, y[(x_out / 0.5).astype(np.int64)])
+    assert np.nanmin(y_out) == np.nanmin(y[2000:40001])
+
+
+def test_lod_pyramid_index_axis():
+    _, y = get_series(N, decimal_places=2, seed=7)
+    pyramid = LODPyramid(y, method="minmax")
+    assert pyramid.index_range(10.5, 20) == (11, 21)
+    x_out, _ = pyramid.query(0, N, 10)
+    np.testing.assert_array_equal(x_out, np.unique(x_out))
+
+
+def test_lod_pyramid_invalid_arguments():
+    with pytest.raises(ValueError):
+        LODPyramid([1.0, 2.0], method="lttb")
+    with pytest.raises(ValueError):
+        LODPyramid([1.0, 2.0], x=[1.0])
+    with pytest.raises(ValueError):
+        LODPyramid([1.0, 2.0]).query(n_out=0)
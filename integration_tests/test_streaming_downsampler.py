@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from cv_visualization import StreamingDownsampler
+from utils import get_series, verify_compressed_vector
+
+N = 20000
+
+
+def expected_indices(y, bucket_width, points):
+    values = y.copy()
+    starts = np.arange(0, len(y), bucket_width)
+    indices = set()
+    for start in starts:
+        bucket = values[start:start + bucket_width]
+        if "first" in points:
+            indices.update([start, start + len(bucket) - 1])
+        if np.isnan(bucket).all():
+            indices.add(start)
+        else:
+            indices.update([start + np.nanargmin(bucket), start + np.nanargmax(bucket)])
+    return np.array(sorted(indices))
+
+
+@pytest.mark.parametrize("method, points", [("m4", ("first", "min", "max", "last")), ("minmax", ("min", "max"))])
+@pytest.mark.parametrize("chunk_size", [1, 37, 1000, N])
+def test_streaming_downsampler(method, points, chunk_size):
+    x, y = get_series(N, decimal_places=3, seed=3, nan_range=(500, 520))
+    if chunk_size == 1:
+        x, y = x[:3000], y[:3000]
+    streaming = StreamingDownsampler(n_out=200, method=method, decimal_places=3)
+    for start in range(0, len(y), chunk_size):
+        streaming.append(x[start:start + chunk_size], y[start:start + chunk_size])
+
+    assert len(streaming) == len(y)
+    assert streaming.n_buckets <= 200 // len(points)
+    indices = streaming.get_indices()
+    np.testing.assert_array_equal(indices, expected_indices(y, streaming.bucket_width, points))
+
+    cv_x, cv_y = streaming.downsample()
+    assert len(cv_y) <= 200
+    verify_compressed_vector(x[indices], 3, cv_x)
+    np.testing.assert_allclose(cv_y.to_numpy(), y[indices])
+
+
+def test_streaming_downsampler_refresh():
+    _, y = get_series(N, decimal_places=3, seed=3, nan_range=(500, 520))
+    streaming = StreamingDownsampler(n_out=100, method="m4", compress_method=None)
+    streaming.append(y_chunk=y[:5000])
+    first_x, _ = streaming.downsample()
+    streaming.append(y_chunk=y[5000:])
+    x_out, y_out = streaming.downsample()
+
+    assert first_x.to_numpy().max() < 5000
+    assert x_out.to_numpy()[-1] == N - 1, "x defaults to the index of the points"
+    assert np.nanmax(y) in y_out.to_numpy() and np.nanmin(y) in y_out.to_numpy()
+
+
+def test_streaming_downsampler_invalid():
+    with pytest.raises(ValueError):
+        StreamingDownsampler(n_out=100, method="lttb")
+    with pytest.raises(ValueError):
+        StreamingDownsampler(n_out=2, method="m4")
+    with pytest.raises(ValueError):
+        StreamingDownsampler().append([1.0, 2.0], [1.0])
+    empty_x, empty_y = StreamingDownsampler().downsample()
+    assert len(empty_x) == 0 and len(empty_y) == 0
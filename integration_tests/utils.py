@@ -28,6 +28,42 @@ def get_original_vector_and_decimal_places(width, vector_size=VECTOR_SIZE):
 
     return vector, decimal_places
 
+def build_vector(width=64, values=None, decimal_places=None, compress_method=None, int_width=None,
+                 nan_range=None, vector_type=CompressedVector, **config):
+    """
+    Build a vector filled with test values, optionally compressed.
+    width picks the random values of get_original_vector_and_decimal_places and, unless
+    int_width is given, the int_width of the vector. values and decimal_places override
+    the random values and their precision. nan_range is an optional (start, end) slice of
+    the values set to NaN. config holds more vector_type arguments
+    (representation, block_cache_bytes, block_size...).
+    Returns the vector, its values and their decimal places.
+    """
+    if values is None:
+        values, default_decimal_places = get_original_vector_and_decimal_places(width)
+        decimal_places = default_decimal_places if decimal_places is None else decimal_places
+    if nan_range is not None:
+        values = list(values)
+        values[nan_range[0]:nan_range[1]] = [float("nan")] * (nan_range[1] - nan_range[0])
+    vector = vector_type(decimal_places, width if int_width is None else int_width, **config)
+    vector.create_vector(len(values))
+    vector.fill_from_vector(values)
+    if compress_method is not None:
+        vector.compress(compress_method)
+    return vector, values, decimal_places
+
+def get_series(size=VECTOR_SIZE, decimal_places=DECIMAL_PLACES, seed=None, nan_range=None):
+    """
+    Return a random walk y and an increasing, irregularly spaced x, rounded to decimal_places.
+    nan_range is an optional (start, end) slice of y set to NaN.
+    """
+    rng = np.random.default_rng(seed)
+    y = np.round(np.cumsum(rng.normal(size=size)), decimal_places)
+    if nan_range is not None:
+        y[nan_range[0]:nan_range[1]] = np.nan
+    x = np.round(np.cumsum(rng.uniform(0.5, 1.5, size=size)), decimal_places)
+    return x, y
+
 def get_original_vector_and_decimal_places_with_file(file_path, width):
     """
     Reads a vector from a file and returns it along with the decimal places.